@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""新增 creative_metrics (date, creative_id) 複合索引
+
+儀表板依日期範圍聚合 creative_metrics，並以 creative_id 關聯到 creatives。
+複合索引同時服務日期範圍過濾與 join，並支援 ORDER BY date DESC LIMIT 7 的趨勢查詢。
+
+Revision ID: 006_cm_date_index
+Revises: 005_fix_schema
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "006_cm_date_index"
+down_revision: Union[str, None] = "005_fix_schema"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_cm_date_creative",
+        "creative_metrics",
+        ["date", "creative_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_cm_date_creative", table_name="creative_metrics")
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""新增儀表板每日聚合物化視圖 daily_account_platform_agg
+
+依 (date, ad_account_id) 預先聚合 creative_metrics，並帶入 user_id 與 platform，
+儀表板查詢只需掃描 帳戶數 × 天數 列，不再 join creatives / ad_accounts。
+視圖於每次數據同步後以 REFRESH MATERIALIZED VIEW CONCURRENTLY 更新，
+CONCURRENTLY 需要唯一索引 (date, ad_account_id)。
+計數欄位以 ::bigint 轉型：PostgreSQL 中 SUM(bigint) 的型別為 numeric，
+asyncpg 會以 Decimal 返回。
+
+物化視圖不支援 RLS，因此比照 003 撤銷 anon/authenticated 權限。
+
+Revision ID: 007_daily_agg_view
+Revises: 006_cm_date_index
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "007_daily_agg_view"
+down_revision: Union[str, None] = "006_cm_date_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW daily_account_platform_agg AS
+        SELECT
+            cm.date AS date,
+            aa.id AS ad_account_id,
+            aa.user_id AS user_id,
+            aa.platform AS platform,
+            SUM(cm.impressions)::bigint AS impressions,
+            SUM(cm.clicks)::bigint AS clicks,
+            SUM(cm.conversions)::bigint AS conversions,
+            SUM(cm.spend) AS spend
+        FROM creative_metrics cm
+        JOIN creatives c ON cm.creative_id = c.id
+        JOIN ad_accounts aa ON c.ad_account_id = aa.id
+        GROUP BY cm.date, aa.id, aa.user_id, aa.platform
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ux_daily_account_platform_agg "
+        "ON daily_account_platform_agg (date, ad_account_id)"
+    )
+    op.execute(
+        "CREATE INDEX ix_daily_account_platform_agg_user_date "
+        "ON daily_account_platform_agg (user_id, date)"
+    )
+
+    op.execute("REVOKE ALL ON daily_account_platform_agg FROM anon;")
+    op.execute("REVOKE ALL ON daily_account_platform_agg FROM authenticated;")
+    op.execute("GRANT ALL ON daily_account_platform_agg TO service_role;")
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS daily_account_platform_agg")
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""creative_metrics 反正規化 ad_account_id / platform
+
+1. creative_metrics 新增 ad_account_id、platform 欄位並從 creatives / ad_accounts 回填
+2. BEFORE INSERT / UPDATE OF creative_id trigger 自動維護兩個欄位，
+   任何寫入路徑（ORM、raw SQL）都會保持同步
+3. 重建 daily_account_platform_agg，聚合時不再 join creatives
+
+Revision ID: 008_cm_denormalize
+Revises: 007_daily_agg_view
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "008_cm_denormalize"
+down_revision: Union[str, None] = "007_daily_agg_view"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_daily_agg_view(source_sql: str) -> None:
+    """建立 daily_account_platform_agg 及其索引、權限"""
+    op.execute(f"CREATE MATERIALIZED VIEW daily_account_platform_agg AS {source_sql}")
+    op.execute(
+        "CREATE UNIQUE INDEX ux_daily_account_platform_agg "
+        "ON daily_account_platform_agg (date, ad_account_id)"
+    )
+    op.execute(
+        "CREATE INDEX ix_daily_account_platform_agg_user_date "
+        "ON daily_account_platform_agg (user_id, date)"
+    )
+    op.execute("REVOKE ALL ON daily_account_platform_agg FROM anon;")
+    op.execute("REVOKE ALL ON daily_account_platform_agg FROM authenticated;")
+    op.execute("GRANT ALL ON daily_account_platform_agg TO service_role;")
+
+
+def upgrade() -> None:
+    # === creative_metrics: 新增欄位並回填 ===
+    op.add_column(
+        "creative_metrics",
+        sa.Column(
+            "ad_account_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("ad_accounts.id", ondelete="CASCADE"),
+            nullable=True,
+            comment="反正規化自 creatives.ad_account_id",
+        ),
+    )
+    op.add_column(
+        "creative_metrics",
+        sa.Column("platform", sa.String(50), nullable=True, comment="反正規化自 ad_accounts.platform"),
+    )
+    op.execute(
+        """
+        UPDATE creative_metrics cm
+        SET ad_account_id = c.ad_account_id, platform = aa.platform
+        FROM creatives c
+        JOIN ad_accounts aa ON c.ad_account_id = aa.id
+        WHERE cm.creative_id = c.id
+        """
+    )
+
+    # === trigger: 寫入時自動帶入 ad_account_id / platform ===
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION creative_metrics_set_account() RETURNS trigger AS $$
+        BEGIN
+            SELECT c.ad_account_id, aa.platform
+            INTO NEW.ad_account_id, NEW.platform
+            FROM creatives c
+            JOIN ad_accounts aa ON c.ad_account_id = aa.id
+            WHERE c.id = NEW.creative_id;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_creative_metrics_set_account
+        BEFORE INSERT OR UPDATE OF creative_id ON creative_metrics
+        FOR EACH ROW EXECUTE FUNCTION creative_metrics_set_account()
+        """
+    )
+
+    # === daily_account_platform_agg: 改由反正規化欄位聚合 ===
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS daily_account_platform_agg")
+    _create_daily_agg_view(
+        """
+        SELECT
+            cm.date AS date,
+            cm.ad_account_id AS ad_account_id,
+            aa.user_id AS user_id,
+            cm.platform AS platform,
+            SUM(cm.impressions)::bigint AS impressions,
+            SUM(cm.clicks)::bigint AS clicks,
+            SUM(cm.conversions)::bigint AS conversions,
+            SUM(cm.spend) AS spend
+        FROM creative_metrics cm
+        JOIN ad_accounts aa ON cm.ad_account_id = aa.id
+        GROUP BY cm.date, cm.ad_account_id, aa.user_id, cm.platform
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS daily_account_platform_agg")
+    _create_daily_agg_view(
+        """
+        SELECT
+            cm.date AS date,
+            aa.id AS ad_account_id,
+            aa.user_id AS user_id,
+            aa.platform AS platform,
+            SUM(cm.impressions)::bigint AS impressions,
+            SUM(cm.clicks)::bigint AS clicks,
+            SUM(cm.conversions)::bigint AS conversions,
+            SUM(cm.spend) AS spend
+        FROM creative_metrics cm
+        JOIN creatives c ON cm.creative_id = c.id
+        JOIN ad_accounts aa ON c.ad_account_id = aa.id
+        GROUP BY cm.date, aa.id, aa.user_id, aa.platform
+        """
+    )
+
+    op.execute("DROP TRIGGER IF EXISTS trg_creative_metrics_set_account ON creative_metrics")
+    op.execute("DROP FUNCTION IF EXISTS creative_metrics_set_account()")
+    op.drop_column("creative_metrics", "platform")
+    op.drop_column("creative_metrics", "ad_account_id")
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""daily_account_platform_agg (user_id, date) 索引改為覆蓋索引
+
+儀表板查詢以 user_id + 日期範圍過濾聚合視圖，並讀取 ad_account_id、platform
+與四個指標欄位。把這些欄位 INCLUDE 進索引後可走 index-only scan，不需回表；
+視圖只由 REFRESH 寫入，autovacuum 維護 visibility map 的成本很低。
+
+Revision ID: 009_daily_agg_covering
+Revises: 008_cm_denormalize
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "009_daily_agg_covering"
+down_revision: Union[str, None] = "008_cm_denormalize"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_daily_account_platform_agg_user_date")
+    op.execute(
+        "CREATE INDEX ix_daily_account_platform_agg_user_date "
+        "ON daily_account_platform_agg (user_id, date) "
+        "INCLUDE (ad_account_id, platform, impressions, clicks, conversions, spend)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_daily_account_platform_agg_user_date")
+    op.execute(
+        "CREATE INDEX ix_daily_account_platform_agg_user_date "
+        "ON daily_account_platform_agg (user_id, date)"
+    )
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""health_audits 最新報告查詢索引
+
+GET /health/audit 以 ORDER BY created_at DESC LIMIT 1 取得最新健檢報告：
+1. 指定帳戶時以 (ad_account_id, created_at DESC) 複合索引，一次 B-tree 下探即取得最新一筆
+2. 未指定帳戶時以 created_at DESC 索引，避免全表掃描加排序
+
+audit_issues.audit_id 已於 001 建立索引，selectinload 的 IN 查詢無需另建。
+
+Revision ID: 010_health_audit_latest
+Revises: 009_daily_agg_covering
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "010_health_audit_latest"
+down_revision: Union[str, None] = "009_daily_agg_covering"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_health_audits_account_created_desc",
+        "health_audits",
+        ["ad_account_id", sa.text("created_at DESC")],
+    )
+    op.create_index(
+        "ix_health_audits_created_desc",
+        "health_audits",
+        [sa.text("created_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_health_audits_created_desc", table_name="health_audits")
+    op.drop_index("ix_health_audits_account_created_desc", table_name="health_audits")
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""notifications keyset 分頁索引
+
+GET /notifications 依 (created_at DESC, id DESC) 以 keyset 游標分頁：
+1. (created_at DESC, id DESC) 供未篩選列表做範圍掃描，取代 001 的 ix_notifications_created_at
+2. (is_read, created_at DESC, id DESC) 供已讀/未讀篩選
+3. (type, created_at DESC, id DESC) 供類型篩選
+
+Revision ID: 011_notifications_keyset
+Revises: 010_health_audit_latest
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "011_notifications_keyset"
+down_revision: Union[str, None] = "010_health_audit_latest"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_notifications_created_at_id_desc",
+        "notifications",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_notifications_is_read_created_at_id_desc",
+        "notifications",
+        ["is_read", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_notifications_type_created_at_id_desc",
+        "notifications",
+        ["type", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    # 單欄 created_at 索引已被 (created_at DESC, id DESC) 涵蓋
+    op.drop_index("ix_notifications_created_at", table_name="notifications")
+
+
+def downgrade() -> None:
+    op.create_index("ix_notifications_created_at", "notifications", ["created_at"])
+    op.drop_index("ix_notifications_type_created_at_id_desc", table_name="notifications")
+    op.drop_index("ix_notifications_is_read_created_at_id_desc", table_name="notifications")
+    op.drop_index("ix_notifications_created_at_id_desc", table_name="notifications")
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""notifications 未讀部分索引
+
+PUT /notifications/read-all 只更新當前用戶的未讀通知
+（WHERE user_id = ? AND is_read = false）。部分索引只收錄未讀資料列，
+大小與全表已讀歷史無關，查詢條件與索引謂詞完全相符。
+
+以 CONCURRENTLY 建立，避免鎖住 notifications 寫入。
+
+Revision ID: 012_notifications_unread
+Revises: 011_notifications_keyset
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "012_notifications_unread"
+down_revision: Union[str, None] = "011_notifications_keyset"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_notifications_unread_user",
+            "notifications",
+            ["user_id"],
+            postgresql_where=sa.text("is_read = false"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_notifications_unread_user",
+            table_name="notifications",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+共用 HTTP 客戶端
+
+各 OAuth 流程（Google、Meta、LinkedIn、Pinterest、Reddit、TikTok）對 token 端點的
+請求重用同一個 httpx.AsyncClient，連線池中的 keep-alive 連線可跨請求重用，
+不必每次重新建立 TCP / TLS 連線。
+"""
+
+import asyncio
+from typing import Optional
+
+import httpx
+
+OAUTH_HTTP_TIMEOUT = 10.0
+OAUTH_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+_oauth_client: Optional[httpx.AsyncClient] = None
+_oauth_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_oauth_http_client() -> httpx.AsyncClient:
+    """
+    取得 OAuth 共用 HTTP 客戶端
+
+    客戶端綁定建立時的 event loop；在其他 loop 中呼叫（如 worker 以 asyncio.run
+    執行任務）時會另建新的客戶端，避免使用屬於已關閉 loop 的連線。
+    """
+    global _oauth_client, _oauth_client_loop
+
+    loop = asyncio.get_running_loop()
+    if _oauth_client is None or _oauth_client.is_closed or _oauth_client_loop is not loop:
+        _oauth_client = httpx.AsyncClient(timeout=OAUTH_HTTP_TIMEOUT, limits=OAUTH_HTTP_LIMITS)
+        _oauth_client_loop = loop
+    return _oauth_client
+
+
+async def close_http_clients() -> None:
+    """關閉共用 HTTP 客戶端（應用程式關閉時呼叫）"""
+    global _oauth_client, _oauth_client_loop
+
+    if _oauth_client is not None:
+        await _oauth_client.aclose()
+    _oauth_client = None
+    _oauth_client_loop = None
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Prometheus 指標定義
+
+HTTP 層的 per-route 延遲由 PrometheusMiddleware 收集（見 app/middleware/metrics.py），
+這裡集中定義所有指標，用於定位實際的熱點 handler 與查詢。
+"""
+
+from prometheus_client import Counter, Histogram
+
+# 各路由的 HTTP 請求延遲；handler 為路由樣板（如 /api/v1/health/audit/{audit_id}），
+# status 依百位數分組（2xx、4xx、5xx），避免標籤基數隨路徑參數膨脹
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency in seconds",
+    ["method", "handler", "status"],
+)
+
+# 儀表板各端點的資料庫查詢耗時
+DASHBOARD_DB_SECONDS = Histogram(
+    "dashboard_db_seconds",
+    "Dashboard database query latency in seconds",
+    ["endpoint"],
+)
+
+# 儀表板各端點的 Redis 回應快取命中次數（與 dashboard_db_seconds 的 _count 對照可得命中率）
+DASHBOARD_CACHE_HITS = Counter(
+    "dashboard_cache_hits_total",
+    "Dashboard response cache hits",
+    ["endpoint"],
+)
@@ -11,6 +11,7 @@ APScheduler 目前保留作為 fallback，預計在 CF Cron 穩定運行 2 週
 - 每 10 分鐘：Meta Ads 數據同步
 - 每 15 分鐘：Google Ads 數據同步
 - 每 15 分鐘：自動駕駛規則檢查
+- 每 30 分鐘：儀表板聚合視圖更新
 - 每天 21:00：每日摘要
 - 每週一 09:00：週報生成
 - 每月 1 號 09:00：月報生成
@@ -37,7 +38,7 @@ def _create_platform_sync_job(
     """
     建立平台同步任務的工廠函數
 
-    所有平台的同步任務邏輯相同：取得帳戶列表 -> 逐一同步 -> 記錄結果。
+    所有平台的同步任務邏輯相同：取得帳戶列表 -> 逐一同步 -> 記錄結果 -> 更新儀表板聚合視圖。
     使用此工廠避免重複程式碼。
 
     Args:
@@ -74,6 +75,14 @@ def _create_platform_sync_job(
         except Exception as e:
             logger.error(f"{platform_name} sync dispatch failed: {e}")
 
+        # 同步完成後更新儀表板聚合視圖
+        from app.services.dashboard_aggregates import refresh_dashboard_aggregates
+
+        try:
+            await refresh_dashboard_aggregates()
+        except Exception as e:
+            logger.error(f"Dashboard aggregate refresh after {platform_name} sync failed: {e}")
+
     sync_job.__doc__ = f"{platform_name} 數據同步任務"
     return sync_job
 
@@ -138,6 +147,20 @@ async def monthly_report_job():
     await generator.generate_monthly_reports()
 
 
+async def dashboard_aggregates_refresh_job():
+    """
+    儀表板聚合視圖更新任務
+
+    每 30 分鐘執行一次 REFRESH MATERIALIZED VIEW CONCURRENTLY
+    """
+    from app.services.dashboard_aggregates import refresh_dashboard_aggregates
+
+    try:
+        await refresh_dashboard_aggregates()
+    except Exception as e:
+        logger.error(f"Dashboard aggregate refresh failed: {e}")
+
+
 def setup_scheduler():
     """
     設定並啟動排程器
@@ -196,6 +219,16 @@ def setup_scheduler():
         replace_existing=True,
     )
 
+    # 每 30 分鐘更新儀表板聚合視圖（同步任務結束時也會更新；
+    # 此排程涵蓋其他寫入 creative_metrics 的路徑，如手動同步）
+    scheduler.add_job(
+        dashboard_aggregates_refresh_job,
+        trigger=IntervalTrigger(minutes=30),
+        id="dashboard_aggregates_refresh",
+        name="儀表板聚合視圖更新",
+        replace_existing=True,
+    )
+
     # MVP 階段暫不啟用：LinkedIn, Pinterest, TikTok, Reddit sync jobs
 
     scheduler.start()
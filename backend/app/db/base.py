@@ -15,10 +15,11 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 # Supabase pgbouncer（transaction mode）需要禁用 prepared statement cache，
-# 否則會出現「prepared statement does not exist」錯誤
+# 否則會出現「prepared statement does not exist」錯誤；預設為 0，
+# 直連 PostgreSQL 時可透過 DB_STATEMENT_CACHE_SIZE 啟用
 PGBOUNCER_CONNECT_ARGS = {
-    "statement_cache_size": 0,
-    "prepared_statement_cache_size": 0,
+    "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
 }
 
 try:
@@ -26,8 +27,10 @@ try:
         settings.DATABASE_URL,
         echo=settings.DEBUG,
         pool_pre_ping=True,
-        pool_size=5,
-        max_overflow=10,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
         connect_args=PGBOUNCER_CONNECT_ARGS,
     )
 
@@ -66,6 +69,18 @@ class MockAsyncSession:
     async def execute(self, *args, **kwargs):
         raise DatabaseUnavailableError("Database is not available")
 
+    async def get(self, *args, **kwargs):
+        raise DatabaseUnavailableError("Database is not available")
+
+    async def scalar(self, *args, **kwargs):
+        raise DatabaseUnavailableError("Database is not available")
+
+    async def scalars(self, *args, **kwargs):
+        raise DatabaseUnavailableError("Database is not available")
+
+    async def refresh(self, *args, **kwargs):
+        raise DatabaseUnavailableError("Database is not available")
+
     async def commit(self):
         pass
 
@@ -9,13 +9,18 @@ from datetime import datetime, timezone
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from sqlalchemy.exc import DBAPIError, OperationalError, TimeoutError as PoolTimeoutError
 
 from app.core.config import get_settings
 from app.core.exceptions import AdOptimizeError
+from app.core.http import close_http_clients
 from app.core.logger import get_logger, setup_logging as setup_app_logging
 from app.core.scheduler import setup_scheduler, shutdown_scheduler
+from app.db.base import DatabaseUnavailableError
 from app.middleware.logging import LoggingMiddleware, setup_logging
+from app.middleware.metrics import PrometheusMiddleware
 from app.routers import api_router
 from app.services.redis_client import get_redis_client
 
@@ -42,6 +47,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
     # 關閉時執行
     shutdown_scheduler()
+    await close_http_clients()
     try:
         await redis_client.disconnect()
     except Exception as e:
@@ -72,6 +78,15 @@ app.add_middleware(
 # 日誌中間件（AC-A3: trace_id 追蹤）
 app.add_middleware(LoggingMiddleware)
 
+# Prometheus 指標中間件（per-route 延遲直方圖，暴露於 /metrics）
+app.add_middleware(PrometheusMiddleware)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Prometheus 指標端點"""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
 
 # 全局異常處理（AC-E4: 統一錯誤格式）
 @app.exception_handler(AdOptimizeError)
@@ -84,6 +99,30 @@ async def adoptimize_error_handler(request: Request, exc: AdOptimizeError) -> JS
     )
 
 
+# 資料庫連線層級的錯誤（連線失敗、連線中斷、連線池逾時）統一回傳 503；
+# 其他資料庫錯誤（SQL 錯誤、約束違反等）屬程式問題，交由預設處理回傳 500
+@app.exception_handler(DBAPIError)
+@app.exception_handler(PoolTimeoutError)
+@app.exception_handler(DatabaseUnavailableError)
+async def database_error_handler(request: Request, exc: Exception) -> JSONResponse:
+    """處理資料庫不可用錯誤，返回 503"""
+    if (
+        isinstance(exc, DBAPIError)
+        and not isinstance(exc, OperationalError)
+        and not exc.connection_invalidated
+    ):
+        raise exc
+    logger.error(
+        f"Database unavailable on {request.method} {request.url.path}: {exc}",
+        exc_info=exc,
+    )
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Database service unavailable"},
+        headers={"X-Trace-ID": request.headers.get("X-Trace-ID", "")},
+    )
+
+
 @app.get("/api/health")
 async def health_check() -> dict:
     """
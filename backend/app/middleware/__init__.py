@@ -13,6 +13,7 @@ from app.middleware.logging import (
     logger,
     setup_logging,
 )
+from app.middleware.metrics import PrometheusMiddleware
 
 __all__ = [
     "get_current_user",
@@ -24,4 +25,5 @@ __all__ = [
     "clear_trace_id",
     "logger",
     "setup_logging",
+    "PrometheusMiddleware",
 ]
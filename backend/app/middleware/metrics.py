@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Prometheus 指標中間件
+
+記錄每個請求的延遲，以路由樣板作為 handler 標籤。
+
+FastAPI 0.130 起 include_router 不再把子路由攤平成帶前綴的 APIRoute，
+scope["route"].path 只剩子路由本身的路徑（不含 /api/v1 等前綴）；
+完整樣板改由 scope["fastapi"]["effective_route_context"] 取得。
+"""
+
+import time
+from typing import Optional
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+
+from app.core.prometheus import HTTP_REQUEST_SECONDS
+
+# 不記錄的路徑（指標端點本身與健康檢查）
+EXCLUDED_PATHS = frozenset({"/metrics", "/api/health"})
+
+
+def _route_template(request: Request) -> Optional[str]:
+    """取得請求對應的完整路由樣板，未匹配任何路由時返回 None"""
+    context = request.scope.get("fastapi", {}).get("effective_route_context")
+    if context is not None:
+        return context.path
+    route = request.scope.get("route")
+    return getattr(route, "path", None)
+
+
+class PrometheusMiddleware(BaseHTTPMiddleware):
+    """
+    HTTP 延遲指標中間件
+
+    - 以路由樣板為 handler 標籤，未匹配的路徑一律記為 "none"
+    - 狀態碼依百位數分組；未處理的例外記為 5xx 後重新拋出
+    """
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        if request.url.path in EXCLUDED_PATHS:
+            return await call_next(request)
+
+        start_time = time.perf_counter()
+        status = "5xx"
+        try:
+            response = await call_next(request)
+            status = f"{response.status_code // 100}xx"
+            return response
+        finally:
+            HTTP_REQUEST_SECONDS.labels(
+                method=request.method,
+                handler=_route_template(request) or "none",
+                status=status,
+            ).observe(time.perf_counter() - start_time)
@@ -8,7 +8,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import BigInteger, Date, DateTime, ForeignKey, Integer, Numeric, UniqueConstraint, func
+from sqlalchemy import BigInteger, Date, DateTime, ForeignKey, Integer, Numeric, String, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -37,6 +37,19 @@ class CreativeMetrics(Base):
         nullable=False,
         index=True,
     )
+    # 反正規化欄位：由 DB trigger 依 creative_id 自動帶入（見 migration 008），
+    # 聚合查詢可直接依帳戶 / 平台分組而不需 join creatives
+    ad_account_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("ad_accounts.id", ondelete="CASCADE"),
+        nullable=True,
+        comment="反正規化自 creatives.ad_account_id",
+    )
+    platform: Mapped[str | None] = mapped_column(
+        String(50),
+        nullable=True,
+        comment="反正規化自 ad_accounts.platform",
+    )
     date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
     impressions: Mapped[int] = mapped_column(BigInteger, default=0)
     clicks: Mapped[int] = mapped_column(BigInteger, default=0)
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""
+儀表板每日聚合物化視圖
+
+daily_account_platform_agg 依 (date, ad_account_id) 預先聚合 creative_metrics，
+由 migration 007 建立（008 改為讀取反正規化欄位），數據同步後以 refresh_dashboard_aggregates() 更新。
+
+以獨立的 MetaData 宣告為 Core Table（非 ORM 模型），避免 Base.metadata.create_all
+與 alembic autogenerate 把它當成一般資料表。
+"""
+
+from sqlalchemy import BigInteger, Column, Date, MetaData, Numeric, String, Table
+from sqlalchemy.dialects.postgresql import UUID
+
+view_metadata = MetaData()
+
+daily_account_platform_agg = Table(
+    "daily_account_platform_agg",
+    view_metadata,
+    Column("date", Date, nullable=False),
+    Column("ad_account_id", UUID(as_uuid=True), nullable=False),
+    Column("user_id", UUID(as_uuid=True), nullable=False),
+    Column("platform", String(50), nullable=False),
+    Column("impressions", BigInteger),
+    Column("clicks", BigInteger),
+    Column("conversions", BigInteger),
+    Column("spend", Numeric(12, 2)),
+)
@@ -7,23 +7,45 @@
 - GET /dashboard/metrics - 取得詳細指標
 - GET /dashboard/trends - 取得趨勢數據
 - GET /dashboard/alerts - 取得異常警示
+- GET /dashboard/bundle - 一次取得總覽、詳細指標與趨勢
+
+回應序列化：所有端點都宣告 response_model，FastAPI (>=0.130) 會直接以
+Pydantic 的 Rust 核心序列化成 JSON bytes，不需要 ORJSONResponse；
+設定自訂 response class 反而會跳過這條快速路徑。
 """
 
+import base64
+import bisect
 import logging
+import re
 import uuid
 from datetime import date, datetime, timedelta
-from decimal import Decimal
-from typing import Optional
+from functools import lru_cache
+from typing import Literal, Optional, TypeVar
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
-from sqlalchemy import func, select
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    Date,
+    Float,
+    Select,
+    bindparam,
+    cast,
+    func,
+    literal_column,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.prometheus import DASHBOARD_CACHE_HITS, DASHBOARD_DB_SECONDS
 from app.db.base import get_db
 from app.middleware.auth import get_current_user
-from app.models import AdAccount, Creative, CreativeMetrics
+from app.models.daily_account_platform_agg import daily_account_platform_agg as daily_agg
 from app.models.user import User
+from app.services.dashboard_aggregates import get_aggregates_refreshed_at
+from app.services.redis_client import get_redis_client
 
 logger = logging.getLogger(__name__)
 
@@ -113,6 +135,14 @@ class TrendsResponse(BaseModel):
     granularity: str = Field(description="粒度: daily, weekly")
 
 
+class DashboardBundleResponse(BaseModel):
+    """儀表板頁面合併回應"""
+
+    overview: DashboardOverviewResponse
+    metrics: DetailedMetricsResponse
+    trends: TrendsResponse
+
+
 class Alert(BaseModel):
     """異常警示"""
 
@@ -139,6 +169,11 @@ class AlertsResponse(BaseModel):
 # ============================================================
 
 
+# 變化率門檻：以「越高越好」的方向表示，越低越好的指標先取負號再查表
+_STATUS_THRESHOLDS = (-30, -10)
+_STATUS_LABELS = ("danger", "warning", "normal")
+
+
 def _get_metric_status(change: float, is_positive_better: bool = True) -> str:
     """
     根據變化率判斷指標狀態
@@ -148,69 +183,206 @@ def _get_metric_status(change: float, is_positive_better: bool = True) -> str:
         is_positive_better: True 表示正數變化是好的（如 ROAS）
                            False 表示負數變化是好的（如 CPA）
     """
-    if is_positive_better:
-        if change >= -10:
-            return "normal"
-        elif change >= -30:
-            return "warning"
-        else:
-            return "danger"
-    else:
-        # 對於 CPA，上升是壞的
-        if change <= 10:
-            return "normal"
-        elif change <= 30:
-            return "warning"
-        else:
-            return "danger"
+    # 對於 CPA 等指標，上升是壞的：取負號後與 ROAS 共用同一組門檻
+    directed = change if is_positive_better else -change
+    return _STATUS_LABELS[bisect.bisect_right(_STATUS_THRESHOLDS, directed)]
+
+
+def _calculate_change(current: float, previous: float) -> float:
+    """計算相較上期的變化百分比，上期為 0 時視為無變化"""
+    if not previous:
+        return 0.0
+    return round((current - previous) / previous * 100, 2)
 
 
 _PERIOD_DAYS = {"today": 0, "7d": 6, "30d": 29}
 
+Granularity = Literal["daily", "weekly"]
+
 
-def _calculate_period(period: str) -> tuple[str, str]:
+def _calculate_period(period: str) -> tuple[date, date]:
     """計算時間週期的起始和結束日期"""
     today = datetime.now().date()
     days_back = _PERIOD_DAYS.get(period, 6)  # 預設 7 天
-    start = today - timedelta(days=days_back)
-    return start.isoformat(), today.isoformat()
+    return today - timedelta(days=days_back), today
+
+
+def _period(start: date, end: date) -> Period:
+    """建立回應中的期間（ISO 日期字串）"""
+    return Period(start=start.isoformat(), end=end.isoformat())
+
+
+# 標準 8-4-4-4-12 格式的 UUID；先以正規表示式過濾，無效 ID 不會觸發 ValueError
+_UUID_RE = re.compile(
+    r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z"
+)
 
 
 def _parse_account_ids(account_ids: Optional[str]) -> list[uuid.UUID]:
     """解析逗號分隔的帳戶 ID 字串，忽略無效的 UUID"""
     if not account_ids:
         return []
-    result = []
-    for aid in account_ids.split(","):
-        try:
-            result.append(uuid.UUID(aid.strip()))
-        except ValueError:
-            pass
-    return result
+    return [
+        uuid.UUID(token)
+        for token in map(str.strip, account_ids.split(","))
+        if _UUID_RE.match(token)
+    ]
+
+
+_EMPTY_RESPONSE_CACHE_SIZE = 16
 
 
-def _empty_dashboard_metrics() -> DashboardMetrics:
-    """建立空的儀表板指標（所有數值為 0）"""
+@lru_cache(maxsize=_EMPTY_RESPONSE_CACHE_SIZE)
+def _empty_overview_response(start: date, end: date) -> DashboardOverviewResponse:
+    """
+    建立空的總覽回應（所有數值為 0）
+
+    空資料回應只取決於期間，以 lru_cache 快取，避免每次請求重建 Pydantic 物件。
+    回傳的實例為共用物件，呼叫端不可修改。
+    """
     zero = MetricValue(value=0, change=0, status="normal")
-    return DashboardMetrics(
-        spend=zero,
-        impressions=zero,
-        clicks=zero,
-        conversions=zero,
-        cpa=zero,
-        roas=zero,
+    return DashboardOverviewResponse(
+        period=_period(start, end),
+        metrics=DashboardMetrics(
+            spend=zero,
+            impressions=zero,
+            clicks=zero,
+            conversions=zero,
+            cpa=zero,
+            roas=zero,
+        ),
+        platforms={},
     )
 
 
 _METRIC_NAMES = ["impressions", "clicks", "conversions", "spend", "cpa", "roas"]
 
 
-def _empty_detailed_metrics() -> list[DetailedMetric]:
-    """建立空的詳細指標列表（所有數值為 0）"""
-    return [
-        DetailedMetric(name=name, value=0, change=0, status="normal", trend=[])
-        for name in _METRIC_NAMES
-    ]
+@lru_cache(maxsize=_EMPTY_RESPONSE_CACHE_SIZE)
+def _empty_metrics_response(start: date, end: date) -> DetailedMetricsResponse:
+    """建立空的詳細指標回應（所有數值為 0，快取共用實例）"""
+    return DetailedMetricsResponse(
+        period=_period(start, end),
+        metrics=[
+            DetailedMetric(name=name, value=0, change=0, status="normal", trend=[])
+            for name in _METRIC_NAMES
+        ],
+    )
+
+
+@lru_cache(maxsize=_EMPTY_RESPONSE_CACHE_SIZE)
+def _empty_trends_response(start: date, end: date, granularity: Granularity) -> TrendsResponse:
+    """建立空的趨勢回應（快取共用實例）"""
+    return TrendsResponse(
+        period=_period(start, end),
+        data=[],
+        granularity=granularity,
+    )
+
+
+# 聚合查詢以 bindparam 宣告參數，結構只取決於 granularity 與是否過濾帳戶，
+# 在模組層級建構一次後重複使用：省去每次請求建構 select() 的成本，
+# SQL 文字固定也讓 asyncpg 的 prepared statement 快取持續命中。
+# PostgreSQL 中 SUM(bigint) 的型別為 numeric（asyncpg 返回 Decimal），
+# 計數欄位一律轉型為 BigInteger，spend 轉型為 Float，讓 Python 端以 int / float 運算。
+_RANGE_START = bindparam("range_start", type_=Date)
+_RANGE_END = bindparam("range_end", type_=Date)
+_PERIOD_START = bindparam("period_start", type_=Date)
+
+
+def _apply_metrics_filters(query: Select, filter_accounts: bool) -> Select:
+    """
+    為聚合查詢加上日期（range_start ~ range_end）、使用者、帳戶過濾條件
+
+    查詢對象為物化視圖 daily_account_platform_agg，user_id 與 platform
+    已在視圖中，不需要 join creatives / ad_accounts。
+    """
+    query = (
+        query.where(daily_agg.c.date >= _RANGE_START)
+        .where(daily_agg.c.date <= _RANGE_END)
+        .where(daily_agg.c.user_id == bindparam("user_id"))
+    )
+    if filter_accounts:
+        query = query.where(
+            daily_agg.c.ad_account_id.in_(bindparam("account_ids", expanding=True))
+        )
+    return query
+
+
+def _metrics_params(
+    range_start: date,
+    range_end: date,
+    user_id: uuid.UUID,
+    account_id_list: list[uuid.UUID],
+    **extra: date,
+) -> dict:
+    """組合 _apply_metrics_filters 所需的查詢參數"""
+    params = {
+        "range_start": range_start,
+        "range_end": range_end,
+        "user_id": user_id,
+        **extra,
+    }
+    if account_id_list:
+        params["account_ids"] = account_id_list
+    return params
+
+
+def _trend_bucket(granularity: Granularity) -> ColumnElement[date]:
+    """
+    趨勢分桶運算式：daily 直接使用日期，weekly 以 date_trunc('week', date)
+    取得該週週一，SELECT / GROUP BY / ORDER BY 共用同一運算式
+    """
+    if granularity == "weekly":
+        # 'week' 以字面值嵌入，確保 SELECT 與 GROUP BY 的運算式完全相同
+        return cast(func.date_trunc(literal_column("'week'"), daily_agg.c.date), Date)
+    return daily_agg.c.date
+
+
+@lru_cache(maxsize=None)
+def _overview_statement(filter_accounts: bool) -> Select:
+    """
+    總覽查詢：依平台分組，本期（period_start 起）與上一期以 FILTER 條件聚合
+
+    range_start 需涵蓋上一期的起始日。
+    """
+    in_current = daily_agg.c.date >= _PERIOD_START
+    in_previous = daily_agg.c.date < _PERIOD_START
+    return _apply_metrics_filters(
+        select(
+            daily_agg.c.platform,
+            cast(func.sum(daily_agg.c.impressions).filter(in_current), BigInteger).label("impressions"),
+            cast(func.sum(daily_agg.c.clicks).filter(in_current), BigInteger).label("clicks"),
+            cast(func.sum(daily_agg.c.conversions).filter(in_current), BigInteger).label("conversions"),
+            cast(func.sum(daily_agg.c.spend).filter(in_current), Float).label("spend"),
+            cast(func.sum(daily_agg.c.impressions).filter(in_previous), BigInteger).label("prev_impressions"),
+            cast(func.sum(daily_agg.c.clicks).filter(in_previous), BigInteger).label("prev_clicks"),
+            cast(func.sum(daily_agg.c.conversions).filter(in_previous), BigInteger).label("prev_conversions"),
+            cast(func.sum(daily_agg.c.spend).filter(in_previous), Float).label("prev_spend"),
+        ),
+        filter_accounts,
+    ).group_by(daily_agg.c.platform)
+
+
+@lru_cache(maxsize=None)
+def _daily_metrics_statement(granularity: Granularity, filter_accounts: bool) -> Select:
+    """趨勢查詢：依日（或週）分桶，CPA / ROAS 在資料庫端計算"""
+    bucket = _trend_bucket(granularity)
+    conversions = cast(func.sum(daily_agg.c.conversions), BigInteger)
+    spend = cast(func.sum(daily_agg.c.spend), Float)
+    return _apply_metrics_filters(
+        select(
+            bucket.label("date"),
+            cast(func.sum(daily_agg.c.impressions), BigInteger).label("impressions"),
+            cast(func.sum(daily_agg.c.clicks), BigInteger).label("clicks"),
+            conversions.label("conversions"),
+            spend.label("spend"),
+            # 衍生指標在資料庫端計算，分母為 0 時以 NULLIF 轉為 NULL 再補 0
+            func.coalesce(spend / func.nullif(conversions, 0), 0.0).label("cpa"),
+            func.coalesce(conversions * 50 / func.nullif(spend, 0), 0.0).label("roas"),
+        ),
+        filter_accounts,
+    ).group_by(bucket).order_by(bucket)
 
 
 async def _query_daily_metrics(
@@ -219,36 +391,200 @@ async def _query_daily_metrics(
     end_date: date,
     user_id: uuid.UUID,
     account_id_list: list[uuid.UUID],
+    granularity: Granularity = "daily",
 ) -> list:
-    """查詢每日指標數據，資料庫錯誤時返回空列表"""
+    """
+    查詢每日（或每週）指標數據，資料庫錯誤時返回空列表
+
+    granularity 為 weekly 時以 date_trunc('week', date) 在資料庫端分桶，
+    每週只返回一列，date 欄位為該週的週一。
+
+    返回列數以期間天數為上限（最多 30 列），因此刻意使用一次性 fetch，
+    不使用 db.stream / yield_per：server-side cursor 的額外往返在此規模只會更慢。
+    """
     try:
-        query = (
-            select(
-                CreativeMetrics.date,
-                func.sum(CreativeMetrics.impressions).label("impressions"),
-                func.sum(CreativeMetrics.clicks).label("clicks"),
-                func.sum(CreativeMetrics.conversions).label("conversions"),
-                func.sum(CreativeMetrics.spend).label("spend"),
+        with DASHBOARD_DB_SECONDS.labels(endpoint="trends").time():
+            result = await db.execute(
+                _daily_metrics_statement(granularity, bool(account_id_list)),
+                _metrics_params(start_date, end_date, user_id, account_id_list),
             )
-            .join(Creative, CreativeMetrics.creative_id == Creative.id)
-            .join(AdAccount, Creative.ad_account_id == AdAccount.id)
-            .where(CreativeMetrics.date >= start_date)
-            .where(CreativeMetrics.date <= end_date)
-            .where(AdAccount.user_id == user_id)
-            .group_by(CreativeMetrics.date)
-            .order_by(CreativeMetrics.date)
-        )
+        return result.all()
+    except Exception as e:
+        logger.warning(f"Database query failed, returning empty data: {e}")
+        return []
 
-        if account_id_list:
-            query = query.where(AdAccount.id.in_(account_id_list))
 
-        result = await db.execute(query)
-        return result.all()
+_TREND_DAYS = 7
+
+
+@lru_cache(maxsize=None)
+def _recent_daily_metrics_statement(filter_accounts: bool) -> Select:
+    """
+    最近 7 天每日指標查詢，附帶本期（period_start 起）與上一期的 window 總計
+
+    range_start 需涵蓋上一期的起始日。
+    """
+    impressions = cast(func.sum(daily_agg.c.impressions), BigInteger)
+    clicks = cast(func.sum(daily_agg.c.clicks), BigInteger)
+    conversions = cast(func.sum(daily_agg.c.conversions), BigInteger)
+    spend = cast(func.sum(daily_agg.c.spend), Float)
+    in_current = daily_agg.c.date >= _PERIOD_START
+    in_previous = daily_agg.c.date < _PERIOD_START
+    return _apply_metrics_filters(
+        select(
+            daily_agg.c.date,
+            impressions.label("impressions"),
+            clicks.label("clicks"),
+            conversions.label("conversions"),
+            spend.label("spend"),
+            cast(func.sum(impressions).filter(in_current).over(), BigInteger).label("total_impressions"),
+            cast(func.sum(clicks).filter(in_current).over(), BigInteger).label("total_clicks"),
+            cast(func.sum(conversions).filter(in_current).over(), BigInteger).label("total_conversions"),
+            func.sum(spend).filter(in_current).over().label("total_spend"),
+            cast(func.sum(impressions).filter(in_previous).over(), BigInteger).label("prev_impressions"),
+            cast(func.sum(clicks).filter(in_previous).over(), BigInteger).label("prev_clicks"),
+            cast(func.sum(conversions).filter(in_previous).over(), BigInteger).label("prev_conversions"),
+            func.sum(spend).filter(in_previous).over().label("prev_spend"),
+        ),
+        filter_accounts,
+    ).group_by(daily_agg.c.date).order_by(daily_agg.c.date.desc()).limit(_TREND_DAYS)
+
+
+async def _query_recent_daily_metrics(
+    db: AsyncSession,
+    start_date: date,
+    end_date: date,
+    user_id: uuid.UUID,
+    account_id_list: list[uuid.UUID],
+    prev_start_date: date,
+) -> list:
+    """
+    查詢最近 7 天的每日指標，並附帶本期與上一期的總計
+
+    查詢範圍涵蓋上一期（prev_start_date 起）到本期結束。趨勢只需要最後 7 天，
+    交由資料庫以 ORDER BY date DESC LIMIT 7 切片；本期（total_*）與上一期
+    （prev_*）總計以 SUM(...) FILTER (...) OVER () 在同一次查詢中取得
+    （window 在 LIMIT 前計算）。本期短於 7 天時結果會包含上一期的日期，
+    呼叫端需以 start_date 篩選。返回的列依日期由舊到新排序，資料庫錯誤時返回空列表。
+    """
+    try:
+        with DASHBOARD_DB_SECONDS.labels(endpoint="metrics").time():
+            result = await db.execute(
+                _recent_daily_metrics_statement(bool(account_id_list)),
+                _metrics_params(
+                    prev_start_date, end_date, user_id, account_id_list, period_start=start_date
+                ),
+            )
+        rows = result.all()
+        rows.reverse()
+        return rows
     except Exception as e:
         logger.warning(f"Database query failed, returning empty data: {e}")
         return []
 
 
+def _no_data_yet(period: str, end_date: date, refreshed_at: Optional[datetime]) -> bool:
+    """
+    判斷 today 期間是否必定沒有數據
+
+    聚合視圖的內容在最後一次更新時就已固定；若最後一次更新早於今天，
+    視圖中不可能有今天的數據，可直接返回空回應而不查詢資料庫。
+    更新時間未知時返回 False，照常查詢。
+    """
+    if period != "today":
+        return False
+    return refreshed_at is not None and refreshed_at.astimezone().date() < end_date
+
+
+# 回應快取：鍵中帶入視圖更新時間作為版本，視圖更新後舊鍵自然失效，
+# TTL 只負責清理不再被讀取的舊版本
+_RESPONSE_CACHE_TTL_SECONDS = 3600
+
+ResponseT = TypeVar("ResponseT", bound=BaseModel)
+
+
+def _response_cache_key(
+    endpoint: str,
+    refreshed_at: Optional[datetime],
+    user_id: uuid.UUID,
+    start_date: date,
+    end_date: date,
+    account_id_list: list[uuid.UUID],
+    *extra: str,
+) -> Optional[str]:
+    """
+    建立儀表板回應快取鍵，視圖更新時間未知時返回 None（不使用快取）
+
+    帳戶 ID 排序後放入鍵中，?account_ids=a,b 與 ?account_ids=b,a 共用同一筆快取。
+    """
+    if refreshed_at is None:
+        return None
+    accounts = ",".join(sorted(str(aid) for aid in account_id_list))
+    return ":".join(
+        [
+            "dashboard",
+            endpoint,
+            refreshed_at.isoformat(),
+            str(user_id),
+            start_date.isoformat(),
+            end_date.isoformat(),
+            accounts,
+            *extra,
+        ]
+    )
+
+
+async def _get_cached_response(
+    key: Optional[str], model: type[ResponseT]
+) -> Optional[ResponseT]:
+    """讀取快取的回應，未命中或 Redis 不可用時返回 None"""
+    if key is None:
+        return None
+    try:
+        cached = await get_redis_client().get(key)
+    except Exception as e:
+        logger.warning(f"Failed to read dashboard response cache: {e}")
+        return None
+    return model.model_validate_json(cached) if cached else None
+
+
+async def _set_cached_response(key: Optional[str], response: BaseModel) -> None:
+    """寫入回應快取，Redis 不可用時略過"""
+    if key is None:
+        return
+    try:
+        await get_redis_client().set(
+            key, response.model_dump_json(), expire=_RESPONSE_CACHE_TTL_SECONDS
+        )
+    except Exception as e:
+        logger.warning(f"Failed to write dashboard response cache: {e}")
+
+
+# 警示來源：異常檢測服務尚未實作，目前為空。
+# 以模組層級的不可變 tuple 保存，依 (created_at, id) 由新到舊預先排序，
+# handler 只做篩選與 seek，不在每次請求重建或排序資料。
+_ALERTS: tuple[Alert, ...] = ()
+
+
+def _alert_sort_key(alert: Alert) -> tuple[str, str]:
+    """警示的分頁排序鍵 (created_at, id)"""
+    return alert.created_at, alert.id
+
+
+def _encode_alert_cursor(alert: Alert) -> str:
+    """以最後一筆警示的 (created_at, id) 建立不透明游標"""
+    return base64.urlsafe_b64encode(f"{alert.created_at}|{alert.id}".encode()).decode()
+
+
+def _decode_alert_cursor(cursor: str) -> tuple[str, str]:
+    """解析分頁游標，格式錯誤時拋出 400"""
+    try:
+        created_at, alert_id = base64.urlsafe_b64decode(cursor).decode().split("|", 1)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return created_at, alert_id
+
+
 # ============================================================
 # API 端點
 # ============================================================
@@ -275,109 +611,125 @@ async def get_dashboard_overview(
         DashboardOverviewResponse: 包含指標、平台數據的總覽
     """
     start_date, end_date = _calculate_period(period)
-    start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").date()
-    end_date_obj = datetime.strptime(end_date, "%Y-%m-%d").date()
     account_id_list = _parse_account_ids(account_ids)
 
-    # 從資料庫聚合指標
+    refreshed_at = await get_aggregates_refreshed_at()
+    if _no_data_yet(period, end_date, refreshed_at):
+        return _empty_overview_response(start_date, end_date)
+
+    cache_key = _response_cache_key(
+        "overview", refreshed_at, current_user.id, start_date, end_date, account_id_list
+    )
+    if cached := await _get_cached_response(cache_key, DashboardOverviewResponse):
+        DASHBOARD_CACHE_HITS.labels(endpoint="overview").inc()
+        return cached
+
+    # 上一期：與本期等長、緊接在本期之前
+    prev_end = start_date - timedelta(days=1)
+    prev_start = prev_end - (end_date - start_date)
+
+    # 從資料庫聚合指標：本期與上一期在同一次查詢中以 FILTER 條件聚合
     platform_data = []
     try:
-        query = (
-            select(
-                AdAccount.platform,
-                func.sum(CreativeMetrics.impressions).label("impressions"),
-                func.sum(CreativeMetrics.clicks).label("clicks"),
-                func.sum(CreativeMetrics.conversions).label("conversions"),
-                func.sum(CreativeMetrics.spend).label("spend"),
+        with DASHBOARD_DB_SECONDS.labels(endpoint="overview").time():
+            result = await db.execute(
+                _overview_statement(bool(account_id_list)),
+                _metrics_params(
+                    prev_start, end_date, current_user.id, account_id_list, period_start=start_date
+                ),
             )
-            .join(Creative, CreativeMetrics.creative_id == Creative.id)
-            .join(AdAccount, Creative.ad_account_id == AdAccount.id)
-            .where(CreativeMetrics.date >= start_date_obj)
-            .where(CreativeMetrics.date <= end_date_obj)
-            .where(AdAccount.user_id == current_user.id)
-            .group_by(AdAccount.platform)
-        )
-
-        if account_id_list:
-            query = query.where(AdAccount.id.in_(account_id_list))
-
-        result = await db.execute(query)
         platform_data = result.all()
     except Exception as e:
         logger.warning(f"Database query failed, returning empty data: {e}")
 
-    if not platform_data:
-        return DashboardOverviewResponse(
-            period=Period(start=start_date, end=end_date),
-            metrics=_empty_dashboard_metrics(),
-            platforms={},
-        )
+    # FILTER 條件下沒有任何列時 SUM 為 NULL，代表該平台本期沒有數據
+    if all(row.impressions is None for row in platform_data):
+        return _empty_overview_response(start_date, end_date)
 
     # 彙總平台數據
     platforms = {}
     total_impressions = 0
     total_clicks = 0
     total_conversions = 0
-    total_spend = Decimal("0")
+    total_spend = 0.0
+    prev_impressions = 0
+    prev_clicks = 0
+    prev_conversions = 0
+    prev_spend = 0.0
 
+    # 查詢已將計數轉型為整數；此處再以 int / float 正規化，避免 Decimal 與 float 混算
     for row in platform_data:
-        platform = row.platform or "unknown"
-        impressions = row.impressions or 0
-        clicks = row.clicks or 0
-        conversions = row.conversions or 0
-        spend = row.spend or Decimal("0")
-
-        platforms[platform] = PlatformMetrics(
-            spend=float(spend),
+        prev_impressions += int(row.prev_impressions or 0)
+        prev_clicks += int(row.prev_clicks or 0)
+        prev_conversions += int(row.prev_conversions or 0)
+        prev_spend += float(row.prev_spend or 0.0)
+
+        if row.impressions is None:
+            continue
+
+        conversions = int(row.conversions or 0)
+        spend = float(row.spend or 0.0)
+        platforms[row.platform or "unknown"] = PlatformMetrics(
+            spend=spend,
             conversions=conversions,
         )
 
-        total_impressions += impressions
-        total_clicks += clicks
+        total_impressions += int(row.impressions)
+        total_clicks += int(row.clicks or 0)
         total_conversions += conversions
         total_spend += spend
 
     # 計算衍生指標
-    cpa = float(total_spend) / total_conversions if total_conversions > 0 else 0
-    roas = (total_conversions * 50) / float(total_spend) if total_spend > 0 else 0
-
-    # TODO: 實作完整的期間比較邏輯，目前變化率皆為 0
-    return DashboardOverviewResponse(
-        period=Period(start=start_date, end=end_date),
+    cpa = total_spend / total_conversions if total_conversions > 0 else 0
+    roas = (total_conversions * 50) / total_spend if total_spend > 0 else 0
+    prev_cpa = prev_spend / prev_conversions if prev_conversions > 0 else 0
+    prev_roas = (prev_conversions * 50) / prev_spend if prev_spend > 0 else 0
+
+    spend_change = _calculate_change(total_spend, prev_spend)
+    impressions_change = _calculate_change(total_impressions, prev_impressions)
+    clicks_change = _calculate_change(total_clicks, prev_clicks)
+    conversions_change = _calculate_change(total_conversions, prev_conversions)
+    cpa_change = _calculate_change(cpa, prev_cpa)
+    roas_change = _calculate_change(roas, prev_roas)
+
+    response = DashboardOverviewResponse(
+        period=_period(start_date, end_date),
         metrics=DashboardMetrics(
             spend=MetricValue(
-                value=float(total_spend),
-                change=0.0,
-                status=_get_metric_status(0.0, is_positive_better=False),
+                value=total_spend,
+                change=spend_change,
+                status=_get_metric_status(spend_change, is_positive_better=False),
             ),
             impressions=MetricValue(
                 value=total_impressions,
-                change=0.0,
-                status="normal",
+                change=impressions_change,
+                status=_get_metric_status(impressions_change),
             ),
             clicks=MetricValue(
                 value=total_clicks,
-                change=0.0,
-                status="normal",
+                change=clicks_change,
+                status=_get_metric_status(clicks_change),
             ),
             conversions=MetricValue(
                 value=total_conversions,
-                change=0.0,
-                status="normal",
+                change=conversions_change,
+                status=_get_metric_status(conversions_change),
             ),
             cpa=MetricValue(
                 value=round(cpa, 2),
-                change=0.0,
-                status=_get_metric_status(0.0, is_positive_better=False),
+                change=cpa_change,
+                status=_get_metric_status(cpa_change, is_positive_better=False),
             ),
             roas=MetricValue(
                 value=round(roas, 2),
-                change=0.0,
-                status="normal",
+                change=roas_change,
+                status=_get_metric_status(roas_change),
             ),
         ),
         platforms=platforms,
     )
+    await _set_cached_response(cache_key, response)
+    return response
 
 
 @router.get("/metrics", response_model=DetailedMetricsResponse)
@@ -401,89 +753,122 @@ async def get_dashboard_metrics(
         DetailedMetricsResponse: 詳細指標列表
     """
     start_date, end_date = _calculate_period(period)
-    start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").date()
-    end_date_obj = datetime.strptime(end_date, "%Y-%m-%d").date()
     account_id_list = _parse_account_ids(account_ids)
 
-    daily_data = await _query_daily_metrics(
-        db, start_date_obj, end_date_obj, current_user.id, account_id_list
+    refreshed_at = await get_aggregates_refreshed_at()
+    if _no_data_yet(period, end_date, refreshed_at):
+        return _empty_metrics_response(start_date, end_date)
+
+    cache_key = _response_cache_key(
+        "metrics", refreshed_at, current_user.id, start_date, end_date, account_id_list
     )
+    if cached := await _get_cached_response(cache_key, DetailedMetricsResponse):
+        DASHBOARD_CACHE_HITS.labels(endpoint="metrics").inc()
+        return cached
 
-    if not daily_data:
-        return DetailedMetricsResponse(
-            period=Period(start=start_date, end=end_date),
-            metrics=_empty_detailed_metrics(),
-        )
+    # 上一期：與本期等長、緊接在本期之前
+    prev_end = start_date - timedelta(days=1)
+    prev_start = prev_end - (end_date - start_date)
 
-    # 彙總數據
-    total_impressions = sum(r.impressions or 0 for r in daily_data)
-    total_clicks = sum(r.clicks or 0 for r in daily_data)
-    total_conversions = sum(r.conversions or 0 for r in daily_data)
-    total_spend = sum(float(r.spend or 0) for r in daily_data)
+    recent = await _query_recent_daily_metrics(
+        db, start_date, end_date, current_user.id, account_id_list, prev_start
+    )
+    current = [r for r in recent if r.date >= start_date]
+
+    if not current:
+        return _empty_metrics_response(start_date, end_date)
+
+    # 本期與上一期總計（每列的 window 總計皆相同）
+    # 查詢已將計數轉型為整數；此處再以 int / float 正規化，避免 Decimal 與 float 混算
+    totals = recent[-1]
+    total_impressions = int(totals.total_impressions or 0)
+    total_clicks = int(totals.total_clicks or 0)
+    total_conversions = int(totals.total_conversions or 0)
+    total_spend = float(totals.total_spend or 0.0)
+    prev_impressions = int(totals.prev_impressions or 0)
+    prev_clicks = int(totals.prev_clicks or 0)
+    prev_conversions = int(totals.prev_conversions or 0)
+    prev_spend = float(totals.prev_spend or 0.0)
 
     cpa = total_spend / total_conversions if total_conversions > 0 else 0
     roas = (total_conversions * 50) / total_spend if total_spend > 0 else 0
-
-    # 計算每日趨勢（最近 7 天）
-    recent = daily_data[-7:]
-    impressions_trend = [r.impressions or 0 for r in recent]
-    clicks_trend = [r.clicks or 0 for r in recent]
-    conversions_trend = [r.conversions or 0 for r in recent]
-    spend_trend = [float(r.spend or 0) for r in recent]
-
-    return DetailedMetricsResponse(
-        period=Period(start=start_date, end=end_date),
+    prev_cpa = prev_spend / prev_conversions if prev_conversions > 0 else 0
+    prev_roas = (prev_conversions * 50) / prev_spend if prev_spend > 0 else 0
+
+    impressions_change = _calculate_change(total_impressions, prev_impressions)
+    clicks_change = _calculate_change(total_clicks, prev_clicks)
+    conversions_change = _calculate_change(total_conversions, prev_conversions)
+    spend_change = _calculate_change(total_spend, prev_spend)
+    cpa_change = _calculate_change(cpa, prev_cpa)
+    roas_change = _calculate_change(roas, prev_roas)
+
+    # 每日趨勢（本期最近 7 天），單次迴圈建立四條趨勢線
+    impressions_trend: list[float] = []
+    clicks_trend: list[float] = []
+    conversions_trend: list[float] = []
+    spend_trend: list[float] = []
+    for r in current:
+        impressions_trend.append(int(r.impressions or 0))
+        clicks_trend.append(int(r.clicks or 0))
+        conversions_trend.append(int(r.conversions or 0))
+        spend_trend.append(float(r.spend or 0.0))
+
+    # 數值皆由伺服器端計算，以 model_construct 略過驗證
+    response = DetailedMetricsResponse.model_construct(
+        period=_period(start_date, end_date),
         metrics=[
-            DetailedMetric(
+            DetailedMetric.model_construct(
                 name="impressions",
                 value=total_impressions,
-                change=0.0,
-                status="normal",
+                change=impressions_change,
+                status=_get_metric_status(impressions_change),
                 trend=impressions_trend,
             ),
-            DetailedMetric(
+            DetailedMetric.model_construct(
                 name="clicks",
                 value=total_clicks,
-                change=0.0,
-                status="normal",
+                change=clicks_change,
+                status=_get_metric_status(clicks_change),
                 trend=clicks_trend,
             ),
-            DetailedMetric(
+            DetailedMetric.model_construct(
                 name="conversions",
                 value=total_conversions,
-                change=0.0,
-                status="normal",
+                change=conversions_change,
+                status=_get_metric_status(conversions_change),
                 trend=conversions_trend,
             ),
-            DetailedMetric(
+            DetailedMetric.model_construct(
                 name="spend",
                 value=total_spend,
-                change=0.0,
-                status="normal",
+                change=spend_change,
+                status=_get_metric_status(spend_change, is_positive_better=False),
                 trend=spend_trend,
             ),
-            DetailedMetric(
+            DetailedMetric.model_construct(
                 name="cpa",
                 value=round(cpa, 2),
-                change=0.0,
-                status="normal",
+                change=cpa_change,
+                status=_get_metric_status(cpa_change, is_positive_better=False),
                 trend=[],
             ),
-            DetailedMetric(
+            DetailedMetric.model_construct(
                 name="roas",
                 value=round(roas, 2),
-                change=0.0,
-                status="normal",
+                change=roas_change,
+                status=_get_metric_status(roas_change),
                 trend=[],
             ),
         ],
     )
+    await _set_cached_response(cache_key, response)
+    return response
 
 
 @router.get("/trends", response_model=TrendsResponse)
 async def get_dashboard_trends(
     period: str = Query("7d", description="時間週期: 7d, 30d"),
-    granularity: str = Query("daily", description="粒度: daily, weekly"),
+    granularity: Granularity = Query("daily", description="粒度: daily, weekly"),
     account_ids: Optional[str] = Query(None, description="帳戶 ID，逗號分隔"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -503,52 +888,97 @@ async def get_dashboard_trends(
         TrendsResponse: 趨勢數據
     """
     start_date, end_date = _calculate_period(period)
-    start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").date()
-    end_date_obj = datetime.strptime(end_date, "%Y-%m-%d").date()
     account_id_list = _parse_account_ids(account_ids)
 
+    refreshed_at = await get_aggregates_refreshed_at()
+    if _no_data_yet(period, end_date, refreshed_at):
+        return _empty_trends_response(start_date, end_date, granularity)
+
+    cache_key = _response_cache_key(
+        "trends", refreshed_at, current_user.id, start_date, end_date, account_id_list, granularity
+    )
+    if cached := await _get_cached_response(cache_key, TrendsResponse):
+        DASHBOARD_CACHE_HITS.labels(endpoint="trends").inc()
+        return cached
+
     daily_data = await _query_daily_metrics(
-        db, start_date_obj, end_date_obj, current_user.id, account_id_list
+        db, start_date, end_date, current_user.id, account_id_list, granularity
     )
 
     if not daily_data:
-        return TrendsResponse(
-            period=Period(start=start_date, end=end_date),
-            data=[],
-            granularity=granularity,
-        )
-
-    # 轉換為回應格式
-    trend_data = []
-    for row in daily_data:
-        conversions = row.conversions or 0
-        spend = float(row.spend or 0)
-        cpa = spend / conversions if conversions > 0 else 0
-        roas = (conversions * 50) / spend if spend > 0 else 0
-
-        trend_data.append(
-            TrendDataPoint(
-                date=row.date.isoformat(),
-                impressions=row.impressions or 0,
-                clicks=row.clicks or 0,
-                conversions=conversions,
-                spend=round(spend, 2),
-                cpa=round(cpa, 2),
-                roas=round(roas, 2),
-            )
+        return _empty_trends_response(start_date, end_date, granularity)
+
+    # 轉換為回應格式（CPA / ROAS 已由查詢計算）
+    # 數值由伺服器端查詢產生，以 model_construct 略過逐筆驗證；
+    # model_construct 不做型別轉換，先以 int / float 正規化（驅動可能返回 Decimal）
+    trend_data = [
+        TrendDataPoint.model_construct(
+            date=row.date.isoformat(),
+            impressions=int(row.impressions or 0),
+            clicks=int(row.clicks or 0),
+            conversions=int(row.conversions or 0),
+            spend=round(float(row.spend or 0.0), 2),
+            cpa=round(float(row.cpa), 2),
+            roas=round(float(row.roas), 2),
         )
+        for row in daily_data
+    ]
 
-    return TrendsResponse(
-        period=Period(start=start_date, end=end_date),
+    response = TrendsResponse.model_construct(
+        period=_period(start_date, end_date),
         data=trend_data,
         granularity=granularity,
     )
+    await _set_cached_response(cache_key, response)
+    return response
+
+
+@router.get("/bundle", response_model=DashboardBundleResponse)
+async def get_dashboard_bundle(
+    period: str = Query("7d", description="時間週期: today, 7d, 30d"),
+    granularity: Granularity = Query("daily", description="趨勢粒度: daily, weekly"),
+    account_ids: Optional[str] = Query(None, description="帳戶 ID，逗號分隔"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> DashboardBundleResponse:
+    """
+    一次取得儀表板頁面所需的總覽、詳細指標與趨勢
+
+    儀表板頁面每次載入都需要這三份數據；合併成單一請求後只經過一次
+    middleware 與認證，三個查詢共用同一個 session（一次連線池取用）。
+    AsyncSession 不支援同時執行多個查詢，因此依序執行；各端點的
+    回應快取與 today 短路邏輯照常生效。
+
+    Args:
+        period: 時間週期
+        granularity: 趨勢粒度
+        account_ids: 帳戶 ID 列表
+        db: 資料庫 session
+
+    Returns:
+        DashboardBundleResponse: 總覽、詳細指標與趨勢
+    """
+    overview = await get_dashboard_overview(
+        period=period, account_ids=account_ids, db=db, current_user=current_user
+    )
+    metrics = await get_dashboard_metrics(
+        period=period, account_ids=account_ids, db=db, current_user=current_user
+    )
+    trends = await get_dashboard_trends(
+        period=period,
+        granularity=granularity,
+        account_ids=account_ids,
+        db=db,
+        current_user=current_user,
+    )
+    return DashboardBundleResponse(overview=overview, metrics=metrics, trends=trends)
 
 
 @router.get("/alerts", response_model=AlertsResponse)
 async def get_dashboard_alerts(
     severity: Optional[str] = Query(None, description="嚴重度: low, medium, high, critical"),
     limit: int = Query(10, ge=1, le=50, description="返回數量"),
+    cursor: Optional[str] = Query(None, description="分頁游標，取自上一頁的 meta.next_cursor"),
     _current_user: User = Depends(get_current_user),
 ) -> AlertsResponse:
     """
@@ -559,21 +989,41 @@ async def get_dashboard_alerts(
     - 閾值警報（超過預設門檻）
     - 趨勢警報（持續下降）
 
+    以 (created_at, id) 游標分頁，由新到舊排序；接上資料庫後對應
+    WHERE (created_at, id) < (:ts, :id) ORDER BY created_at DESC, id DESC LIMIT n，
+    分頁深度不影響查詢成本。
+
     Args:
         severity: 篩選嚴重度
         limit: 返回數量上限
+        cursor: 分頁游標
 
     Returns:
         AlertsResponse: 異常警示列表
     """
     # TODO: 實作真正的異常檢測邏輯
     # 需要查詢最近數據，比較歷史數據，檢測異常模式
-    # 目前返回空列表，待異常檢測服務實作後整合
+    # 待異常檢測服務實作後，以其結果取代 _ALERTS
+    after = _decode_alert_cursor(cursor) if cursor else None
+
+    # 多取一筆判斷是否還有下一頁
+    page: list[Alert] = []
+    for alert in _ALERTS:
+        if severity is not None and alert.severity != severity:
+            continue
+        if after is not None and _alert_sort_key(alert) >= after:
+            continue
+        page.append(alert)
+        if len(page) > limit:
+            break
+
+    has_more = len(page) > limit
+    page = page[:limit]
 
     return AlertsResponse(
-        data=[],
+        data=page,
         meta={
-            "total": 0,
+            "next_cursor": _encode_alert_cursor(page[-1]) if has_more else None,
             "filtered_by_severity": severity,
             "message": "Alert detection service not yet implemented",
         },
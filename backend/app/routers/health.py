@@ -10,22 +10,38 @@
 此路由包裝 audits 路由，提供 /health/audit 路徑給前端使用
 """
 
+import re
+import time
 import uuid
+from collections import Counter
 from datetime import datetime, timezone
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel, Field
-from sqlalchemy import select
+from pydantic import BaseModel
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
+from app.core.logger import get_logger
 from app.db.base import get_db
 from app.models import AuditIssue as AuditIssueModel, HealthAudit as HealthAuditModel
+from app.routers.audits import TriggerAuditResponse
 from app.services.audit_engine import get_audit_grade
 
+logger = get_logger(__name__)
+
+_UTC = timezone.utc
+
 router = APIRouter()
 
+# UUID 格式驗證：先以正則擋下格式錯誤的輸入，避免 uuid.UUID 拋例外的成本
+_UUID_RE = re.compile(
+    r"\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z", re.IGNORECASE
+)
+
 
 # Pydantic 模型
 class AuditDimension(BaseModel):
@@ -75,72 +91,150 @@ class HealthAuditResponse(BaseModel):
     data: HealthAuditWithIssues
 
 
-class TriggerAuditRequest(BaseModel):
-    """觸發健檢請求"""
-
-    account_id: str
-
-
-class TriggerAuditResponse(BaseModel):
-    """觸發健檢回應"""
+class IssueStatusResponse(BaseModel):
+    """問題狀態變更回應"""
 
     success: bool
-    task_id: str
+    issue_id: str
+    new_status: str
     message: str
 
 
-def _convert_db_audit_to_response(audit_record: HealthAuditModel) -> HealthAuditWithIssues:
-    """將資料庫記錄轉換為 API 回應格式"""
-    # 計算 grade
-    grade = get_audit_grade(audit_record.overall_score or 0)
+class TriggerAuditRequest(BaseModel):
+    """觸發健檢請求"""
 
-    # 建立維度資料
-    # 維度權重固定，依 SDD 2.3 定義
-    dimension_weights = {
+    account_id: str
+
+
+# 維度權重固定，依 SDD 2.3 定義；唯讀映射，模組載入時建立一次
+_DIMENSION_WEIGHTS: Mapping[str, float] = MappingProxyType(
+    {
         "structure": 0.20,
         "creative": 0.25,
         "audience": 0.25,
         "budget": 0.20,
         "tracking": 0.10,
     }
+)
+
+# 維度名稱、HealthAudit 分數欄位、權重，依回應順序排列
+_DIMENSION_SPEC: tuple[tuple[str, str, float], ...] = tuple(
+    (name, f"{name}_score", weight) for name, weight in _DIMENSION_WEIGHTS.items()
+)
+
+# 健檢報告只預先載入問題列表；其餘關聯一律 raiseload，
+# 避免日後存取未載入的關聯時在 async context 中隱性 lazy load
+_AUDIT_LOAD_OPTIONS = (
+    selectinload(HealthAuditModel.issues).raiseload("*"),
+    raiseload("*"),
+)
+
+# 查詢於模組載入時建立一次，參數以 bindparam 傳入；每次請求重用同一個 statement，
+# 快取鍵固定，compiled cache 必定命中，不必重新組裝 SQL
+_LATEST_AUDIT_STMT = (
+    select(HealthAuditModel)
+    .options(*_AUDIT_LOAD_OPTIONS)
+    .order_by(HealthAuditModel.created_at.desc())
+    .limit(1)
+)
+_LATEST_ACCOUNT_AUDIT_STMT = _LATEST_AUDIT_STMT.where(
+    HealthAuditModel.ad_account_id == bindparam("account_id")
+)
+_AUDIT_BY_ID_STMT = (
+    select(HealthAuditModel)
+    .options(*_AUDIT_LOAD_OPTIONS)
+    .where(HealthAuditModel.id == bindparam("audit_id"))
+)
+
+
+# 空健檢報告的維度內容固定，於載入時建立一次；回應序列化時只讀不寫，可安全共用
+_EMPTY_DIMENSIONS: Mapping[str, AuditDimension] = MappingProxyType(
+    {
+        name: AuditDimension(score=0, weight=weight, issues=0)
+        for name, weight in _DIMENSION_WEIGHTS.items()
+    }
+)
+
+
+def _empty_audit() -> HealthAuditWithIssues:
+    """建立空的健檢報告，讓前端可以正常顯示「尚未進行健檢」"""
+    # 僅 created_at 隨請求變動，其餘皆為預先建立的固定值
+    return HealthAuditWithIssues.model_construct(
+        id="",
+        account_id="",
+        overall_score=0,
+        dimensions=dict(_EMPTY_DIMENSIONS),
+        grade="N/A",
+        issues_count=0,
+        created_at=datetime.now(_UTC).isoformat(),
+        issues=[],
+    )
+
+
+# 最新健檢報告的程序內快取：新健檢間隔數分鐘以上，短 TTL 內重複請求直接回傳，
+# 不查資料庫；key 為 account_id（小寫，未指定時為 None）。
+# 新健檢由 Celery worker 在另一個程序寫入，無法清除此快取，最多延遲一個 TTL 才可見
+_LATEST_AUDIT_CACHE_TTL_SECONDS = 30.0
+_LATEST_AUDIT_CACHE_MAXSIZE = 1024
+_latest_audit_cache: dict[Optional[str], tuple[float, HealthAuditResponse]] = {}
+
+
+def _get_cached_latest_audit(key: Optional[str]) -> Optional[HealthAuditResponse]:
+    """取得未過期的最新健檢報告快取"""
+    entry = _latest_audit_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, response = entry
+    if expires_at <= time.monotonic():
+        _latest_audit_cache.pop(key, None)
+        return None
+    return response
+
+
+def _set_cached_latest_audit(key: Optional[str], response: HealthAuditResponse) -> None:
+    """寫入最新健檢報告快取，超過上限時先清除過期項目，仍滿則淘汰最舊項目"""
+    now = time.monotonic()
+    if key not in _latest_audit_cache and len(_latest_audit_cache) >= _LATEST_AUDIT_CACHE_MAXSIZE:
+        for stale_key in [k for k, (exp, _) in _latest_audit_cache.items() if exp <= now]:
+            del _latest_audit_cache[stale_key]
+        if len(_latest_audit_cache) >= _LATEST_AUDIT_CACHE_MAXSIZE:
+            del _latest_audit_cache[next(iter(_latest_audit_cache))]
+    _latest_audit_cache[key] = (now + _LATEST_AUDIT_CACHE_TTL_SECONDS, response)
+
+
+def _invalidate_cached_audit(audit_id: uuid.UUID) -> None:
+    """問題狀態變更後清除包含該健檢報告的快取項目"""
+    audit_key = str(audit_id)
+    for key in [k for k, (_, resp) in _latest_audit_cache.items() if resp.data.id == audit_key]:
+        del _latest_audit_cache[key]
+
+
+@lru_cache(maxsize=128)
+def _grade_for_score(score: int) -> str:
+    """分數對應的健檢等級；分數為 0-100 整數，結果可完整快取"""
+    return get_audit_grade(score).value
+
+
+def _convert_db_audit_to_response(audit_record: HealthAuditModel) -> HealthAuditWithIssues:
+    """將資料庫記錄轉換為 API 回應格式"""
 
     # 統計各類別的問題數
-    category_issue_counts: dict[str, int] = {}
-    for issue in audit_record.issues:
-        cat = (issue.category or "").lower()
-        category_issue_counts[cat] = category_issue_counts.get(cat, 0) + 1
+    category_issue_counts = Counter((issue.category or "").lower() for issue in audit_record.issues)
 
+    # 建立維度資料
+    # 以下數值皆來自資料庫欄位（型別已確定），以 model_construct 略過驗證
     dimensions = {
-        "structure": AuditDimension(
-            score=audit_record.structure_score or 0,
-            weight=dimension_weights["structure"],
-            issues=category_issue_counts.get("structure", 0),
-        ),
-        "creative": AuditDimension(
-            score=audit_record.creative_score or 0,
-            weight=dimension_weights["creative"],
-            issues=category_issue_counts.get("creative", 0),
-        ),
-        "audience": AuditDimension(
-            score=audit_record.audience_score or 0,
-            weight=dimension_weights["audience"],
-            issues=category_issue_counts.get("audience", 0),
-        ),
-        "budget": AuditDimension(
-            score=audit_record.budget_score or 0,
-            weight=dimension_weights["budget"],
-            issues=category_issue_counts.get("budget", 0),
-        ),
-        "tracking": AuditDimension(
-            score=audit_record.tracking_score or 0,
-            weight=dimension_weights["tracking"],
-            issues=category_issue_counts.get("tracking", 0),
-        ),
+        name: AuditDimension.model_construct(
+            score=getattr(audit_record, score_field) or 0,
+            weight=weight,
+            issues=category_issue_counts.get(name, 0),
+        )
+        for name, score_field, weight in _DIMENSION_SPEC
     }
 
     # 轉換問題列表
     issues = [
-        AuditIssue(
+        AuditIssue.model_construct(
             id=str(issue.id),
             category=issue.category or "",
             severity=issue.severity or "MEDIUM",
@@ -154,19 +248,19 @@ def _convert_db_audit_to_response(audit_record: HealthAuditModel) -> HealthAudit
                 if isinstance(issue.affected_entities, dict)
                 else []
             ),
-            status=issue.status,
+            status=issue.status or "open",
         )
         for issue in audit_record.issues
     ]
 
-    return HealthAuditWithIssues(
+    return HealthAuditWithIssues.model_construct(
         id=str(audit_record.id),
-        account_id=str(audit_record.account_id),
+        account_id=str(audit_record.ad_account_id),
         overall_score=audit_record.overall_score or 0,
         dimensions=dimensions,
-        grade=grade.value,
+        grade=_grade_for_score(audit_record.overall_score or 0),
         issues_count=len(issues),
-        created_at=audit_record.created_at.isoformat() if audit_record.created_at else datetime.now(timezone.utc).isoformat(),
+        created_at=audit_record.created_at.isoformat() if audit_record.created_at else datetime.now(_UTC).isoformat(),
         issues=issues,
     )
 
@@ -186,70 +280,37 @@ async def get_latest_audit(
     Returns:
         HealthAuditResponse: 最新健檢報告
     """
-    # 從資料庫取得最新健檢報告
-    query = (
-        select(HealthAuditModel)
-        .options(selectinload(HealthAuditModel.issues))
-        .order_by(HealthAuditModel.created_at.desc())
-    )
+    cache_key = account_id.lower() if account_id else None
+    cached = _get_cached_latest_audit(cache_key)
+    if cached is not None:
+        return cached
 
-    # 驗證 account_id 格式並加入篩選條件
+    # 驗證 account_id 格式並選擇對應查詢
     if account_id:
-        try:
-            account_uuid = uuid.UUID(account_id)
-            query = query.where(HealthAuditModel.ad_account_id == account_uuid)
-        except ValueError:
+        if not _UUID_RE.match(account_id):
             raise HTTPException(status_code=400, detail="Invalid account_id format")
+        query, params = _LATEST_ACCOUNT_AUDIT_STMT, {"account_id": uuid.UUID(account_id)}
+    else:
+        query, params = _LATEST_AUDIT_STMT, {}
 
+    # 從資料庫取得最新健檢報告
     try:
-        result = await db.execute(query.limit(1))
+        result = await db.execute(query, params)
         audit_record = result.scalar_one_or_none()
     except Exception as e:
         # 資料庫連線失敗，返回空的健檢報告
-        import logging
-        logging.warning(f"Database connection failed in get_latest_audit: {e}")
-        # 返回空的健檢報告，讓前端可以正常顯示「尚未進行健檢」
-        empty_audit = HealthAuditWithIssues(
-            id="",
-            account_id="",
-            overall_score=0,
-            dimensions={
-                "structure": AuditDimension(score=0, weight=0.20, issues=0),
-                "creative": AuditDimension(score=0, weight=0.25, issues=0),
-                "audience": AuditDimension(score=0, weight=0.25, issues=0),
-                "budget": AuditDimension(score=0, weight=0.20, issues=0),
-                "tracking": AuditDimension(score=0, weight=0.10, issues=0),
-            },
-            grade="N/A",
-            issues_count=0,
-            created_at=datetime.now(timezone.utc).isoformat(),
-            issues=[],
-        )
-        return HealthAuditResponse(data=empty_audit)
+        logger.warning(f"Database connection failed in get_latest_audit: {e}")
+        return HealthAuditResponse(data=_empty_audit())
 
     if not audit_record:
         # 沒有健檢記錄，返回空的健檢報告
-        empty_audit = HealthAuditWithIssues(
-            id="",
-            account_id="",
-            overall_score=0,
-            dimensions={
-                "structure": AuditDimension(score=0, weight=0.20, issues=0),
-                "creative": AuditDimension(score=0, weight=0.25, issues=0),
-                "audience": AuditDimension(score=0, weight=0.25, issues=0),
-                "budget": AuditDimension(score=0, weight=0.20, issues=0),
-                "tracking": AuditDimension(score=0, weight=0.10, issues=0),
-            },
-            grade="N/A",
-            issues_count=0,
-            created_at=datetime.now(timezone.utc).isoformat(),
-            issues=[],
-        )
-        return HealthAuditResponse(data=empty_audit)
+        response = HealthAuditResponse(data=_empty_audit())
+    else:
+        # 轉換資料庫記錄為 API 回應格式
+        response = HealthAuditResponse(data=_convert_db_audit_to_response(audit_record))
 
-    # 轉換資料庫記錄為 API 回應格式
-    audit = _convert_db_audit_to_response(audit_record)
-    return HealthAuditResponse(data=audit)
+    _set_cached_latest_audit(cache_key, response)
+    return response
 
 
 @router.get("/audit/{audit_id}", response_model=HealthAuditResponse)
@@ -268,24 +329,12 @@ async def get_audit(
         HealthAuditResponse: 健檢報告
     """
     # 驗證 ID 格式
-    try:
-        audit_uuid = uuid.UUID(audit_id)
-    except ValueError:
+    if not _UUID_RE.match(audit_id):
         raise HTTPException(status_code=400, detail="Invalid audit ID format")
 
-    # 從資料庫取得指定健檢報告
-    try:
-        result = await db.execute(
-            select(HealthAuditModel)
-            .options(selectinload(HealthAuditModel.issues))
-            .where(HealthAuditModel.id == audit_uuid)
-        )
-        audit_record = result.scalar_one_or_none()
-    except Exception as e:
-        # 資料庫連線失敗
-        import logging
-        logging.warning(f"Database connection failed in get_audit: {e}")
-        raise HTTPException(status_code=503, detail="Database service unavailable")
+    # 從資料庫取得指定健檢報告（資料庫錯誤由全域 handler 轉為 503）
+    result = await db.execute(_AUDIT_BY_ID_STMT, {"audit_id": uuid.UUID(audit_id)})
+    audit_record = result.scalar_one_or_none()
 
     if not audit_record:
         raise HTTPException(status_code=404, detail="Audit not found")
@@ -308,9 +357,7 @@ async def trigger_audit(request: TriggerAuditRequest) -> TriggerAuditResponse:
         TriggerAuditResponse: 任務 ID
     """
     # 驗證 ID 格式
-    try:
-        uuid.UUID(request.account_id)
-    except ValueError:
+    if not _UUID_RE.match(request.account_id):
         raise HTTPException(status_code=400, detail="Invalid account_id format")
 
     # TODO: 實際觸發 Celery 任務
@@ -324,12 +371,12 @@ async def trigger_audit(request: TriggerAuditRequest) -> TriggerAuditResponse:
     )
 
 
-@router.post("/audit/{audit_id}/issues/{issue_id}/resolve")
+@router.post("/audit/{audit_id}/issues/{issue_id}/resolve", response_model=IssueStatusResponse)
 async def resolve_issue(
     audit_id: str,
     issue_id: str,
     db: AsyncSession = Depends(get_db),
-) -> dict:
+) -> IssueStatusResponse:
     """
     標記問題為已解決
 
@@ -339,52 +386,43 @@ async def resolve_issue(
         db: 資料庫 session
 
     Returns:
-        成功訊息
+        IssueStatusResponse: 成功訊息
     """
     # 驗證 ID 格式
-    try:
-        uuid.UUID(audit_id)
-        issue_uuid = uuid.UUID(issue_id)
-    except ValueError:
+    if not (_UUID_RE.match(audit_id) and _UUID_RE.match(issue_id)):
         raise HTTPException(status_code=400, detail="Invalid ID format")
 
-    # 更新資料庫中的問題狀態
-    try:
-        result = await db.execute(
-            select(AuditIssueModel).where(AuditIssueModel.id == issue_uuid)
-        )
-        issue = result.scalar_one_or_none()
-    except Exception as e:
-        import logging
-        logging.warning(f"Database connection failed in resolve_issue: {e}")
-        raise HTTPException(status_code=503, detail="Database service unavailable")
+    # 以單一 UPDATE ... RETURNING 更新問題狀態，不需先載入 ORM 物件
+    result = await db.execute(
+        update(AuditIssueModel)
+        .where(AuditIssueModel.id == uuid.UUID(issue_id))
+        .values(status="resolved", resolved_at=datetime.now(_UTC))
+        .returning(AuditIssueModel.audit_id)
+    )
+    updated_audit_id = result.scalar_one_or_none()
 
-    if not issue:
+    if updated_audit_id is None:
         raise HTTPException(status_code=404, detail="Issue not found")
 
-    try:
-        issue.status = "resolved"
-        issue.resolved_at = datetime.now(timezone.utc)
-        await db.flush()
-    except Exception as e:
-        import logging
-        logging.warning(f"Database update failed in resolve_issue: {e}")
-        raise HTTPException(status_code=503, detail="Database service unavailable")
-
-    return {
-        "success": True,
-        "issue_id": issue_id,
-        "new_status": "resolved",
-        "message": "Issue marked as resolved",
-    }
+    # 先提交再清除快取：若在提交前清除，並行的 GET /audit 會讀到舊資料並重新快取一個 TTL
+    await db.commit()
+    # 以問題實際所屬的健檢報告清除快取，避免 GET /audit 在 TTL 內回傳舊狀態
+    _invalidate_cached_audit(updated_audit_id)
 
+    return IssueStatusResponse(
+        success=True,
+        issue_id=issue_id,
+        new_status="resolved",
+        message="Issue marked as resolved",
+    )
 
-@router.post("/audit/{audit_id}/issues/{issue_id}/ignore")
+
+@router.post("/audit/{audit_id}/issues/{issue_id}/ignore", response_model=IssueStatusResponse)
 async def ignore_issue(
     audit_id: str,
     issue_id: str,
     db: AsyncSession = Depends(get_db),
-) -> dict:
+) -> IssueStatusResponse:
     """
     忽略問題
 
@@ -394,40 +432,32 @@ async def ignore_issue(
         db: 資料庫 session
 
     Returns:
-        成功訊息
+        IssueStatusResponse: 成功訊息
     """
     # 驗證 ID 格式
-    try:
-        uuid.UUID(audit_id)
-        issue_uuid = uuid.UUID(issue_id)
-    except ValueError:
+    if not (_UUID_RE.match(audit_id) and _UUID_RE.match(issue_id)):
         raise HTTPException(status_code=400, detail="Invalid ID format")
 
-    # 更新資料庫中的問題狀態
-    try:
-        result = await db.execute(
-            select(AuditIssueModel).where(AuditIssueModel.id == issue_uuid)
-        )
-        issue = result.scalar_one_or_none()
-    except Exception as e:
-        import logging
-        logging.warning(f"Database connection failed in ignore_issue: {e}")
-        raise HTTPException(status_code=503, detail="Database service unavailable")
+    # 以單一 UPDATE ... RETURNING 更新問題狀態，不需先載入 ORM 物件
+    result = await db.execute(
+        update(AuditIssueModel)
+        .where(AuditIssueModel.id == uuid.UUID(issue_id))
+        .values(status="ignored")
+        .returning(AuditIssueModel.audit_id)
+    )
+    updated_audit_id = result.scalar_one_or_none()
 
-    if not issue:
+    if updated_audit_id is None:
         raise HTTPException(status_code=404, detail="Issue not found")
 
-    try:
-        issue.status = "ignored"
-        await db.flush()
-    except Exception as e:
-        import logging
-        logging.warning(f"Database update failed in ignore_issue: {e}")
-        raise HTTPException(status_code=503, detail="Database service unavailable")
-
-    return {
-        "success": True,
-        "issue_id": issue_id,
-        "new_status": "ignored",
-        "message": "Issue ignored",
-    }
+    # 先提交再清除快取：若在提交前清除，並行的 GET /audit 會讀到舊資料並重新快取一個 TTL
+    await db.commit()
+    # 以問題實際所屬的健檢報告清除快取，避免 GET /audit 在 TTL 內回傳舊狀態
+    _invalidate_cached_audit(updated_audit_id)
+
+    return IssueStatusResponse(
+        success=True,
+        issue_id=issue_id,
+        new_status="ignored",
+        message="Issue ignored",
+    )
@@ -7,13 +7,14 @@
 - POST /history/:id/revert - 還原操作
 """
 
+import re
 import uuid
 from datetime import datetime, timezone
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logger import get_logger
@@ -23,8 +24,15 @@ from app.models.recommendation import Recommendation as RecommendationDBModel
 
 logger = get_logger(__name__)
 
+_UTC = timezone.utc
+
 router = APIRouter()
 
+# UUID 格式驗證：先以正則擋下格式錯誤的輸入，避免 uuid.UUID 拋例外的成本
+_UUID_RE = re.compile(
+    r"\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z", re.IGNORECASE
+)
+
 
 class RevertResponse(BaseModel):
     """還原操作回應"""
@@ -54,51 +62,42 @@ async def revert_action(
         RevertResponse: 還原結果
     """
     # 驗證 ID 格式
-    try:
-        history_uuid = uuid.UUID(history_id)
-    except ValueError:
+    if not _UUID_RE.match(history_id):
         raise HTTPException(status_code=400, detail="Invalid history ID format")
 
-    # 從資料庫取得操作歷史
-    try:
-        result = await db.execute(
-            select(ActionHistoryDBModel).where(ActionHistoryDBModel.id == history_uuid)
+    # 以條件式 UPDATE ... RETURNING 標記已還原，同時取回還原建議所需欄位；
+    # 已還原的記錄不會被更新，並發重複還原也只有一次成功。
+    # 資料庫錯誤由全域 handler 轉為 503
+    history_uuid = uuid.UUID(history_id)
+    reverted_at = datetime.now(_UTC)
+    result = await db.execute(
+        update(ActionHistoryDBModel)
+        .where(
+            ActionHistoryDBModel.id == history_uuid,
+            ActionHistoryDBModel.status.is_distinct_from("rolled_back"),
         )
-        history_record = result.scalar_one_or_none()
-    except Exception as e:
-        logger.error(f"Database connection failed in revert_action: {e}")
-        raise HTTPException(status_code=503, detail="Database service unavailable")
-
-    if not history_record:
-        raise HTTPException(status_code=404, detail="History record not found")
+        .values(status="rolled_back", rolled_back_at=reverted_at)
+        .returning(ActionHistoryDBModel.recommendation_id, ActionHistoryDBModel.before_state)
+    )
+    reverted_row = result.one_or_none()
 
-    if history_record.reverted:
+    if reverted_row is None:
+        # 未更新任何記錄：區分不存在與已還原
+        exists = await db.scalar(
+            select(ActionHistoryDBModel.id).where(ActionHistoryDBModel.id == history_uuid)
+        )
+        if exists is None:
+            raise HTTPException(status_code=404, detail="History record not found")
         raise HTTPException(status_code=400, detail="This action has already been reverted")
 
     # 還原相關建議的狀態（如果有）
-    if history_record.recommendation_id and history_record.before_state:
-        try:
-            rec_result = await db.execute(
-                select(RecommendationDBModel).where(
-                    RecommendationDBModel.id == history_record.recommendation_id
-                )
-            )
-            rec_record = rec_result.scalar_one_or_none()
-
-            if rec_record and "status" in history_record.before_state:
-                rec_record.status = history_record.before_state["status"]
-        except Exception as e:
-            logger.warning(f"Failed to revert recommendation status: {e}")
-
-    # 標記操作已還原
-    reverted_at = datetime.now(timezone.utc)
-    try:
-        history_record.status = "rolled_back"
-        history_record.rolled_back_at = reverted_at
-        await db.flush()
-    except Exception as e:
-        logger.error(f"Database update failed in revert_action: {e}")
-        raise HTTPException(status_code=503, detail="Database service unavailable")
+    recommendation_id, before_state = reverted_row
+    if recommendation_id and before_state and "status" in before_state:
+        await db.execute(
+            update(RecommendationDBModel)
+            .where(RecommendationDBModel.id == recommendation_id)
+            .values(status=before_state["status"])
+        )
 
     logger.info(f"Action {history_id} reverted successfully")
 
@@ -6,20 +6,25 @@
 - GET /notifications - 通知列表
 - GET /notifications/:id - 通知詳情
 - PUT /notifications/:id/read - 標記已讀
-- PUT /notifications/read-all - 全部標記已讀
+- PUT /notifications/read-all - 當前用戶全部標記已讀
 """
 
+import base64
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
-from sqlalchemy import select, update
+from sqlalchemy import func, literal, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.base import get_db
+from app.middleware.auth import get_current_user
 from app.models import Notification
+from app.models.user import User
 
 router = APIRouter()
 
@@ -55,9 +60,34 @@ class MarkReadResponse(BaseModel):
     message: str
 
 
+# 列表只讀取回應所需欄位，以 Core 資料列返回，略過 ORM 實體建構與 identity map 登錄
+_NOTIFICATION_LIST_COLUMNS = (
+    Notification.id,
+    Notification.type,
+    Notification.severity,
+    Notification.title,
+    Notification.message,
+    Notification.data,
+    Notification.is_read,
+    Notification.read_at,
+    Notification.created_at,
+)
+
+# 列表的基礎查詢於載入時建立一次，請求時只附加篩選與分頁條件；
+# 同一篩選組合的編譯結果由 SQLAlchemy 的編譯快取重用
+_NOTIFICATION_COUNTS_STMT = select(
+    func.count(),
+    func.count().filter(Notification.is_read == False),  # noqa: E712
+).select_from(Notification)
+_NOTIFICATION_PAGE_STMT = select(*_NOTIFICATION_LIST_COLUMNS).order_by(
+    Notification.created_at.desc(), Notification.id.desc()
+)
+
+
 def _convert_db_notification_to_response(notification: Notification) -> NotificationResponse:
-    """將資料庫記錄轉換為 API 回應格式"""
-    return NotificationResponse(
+    """將資料庫記錄（ORM 實體或列表欄位資料列）轉換為 API 回應格式"""
+    # 欄位型別由資料庫欄位決定，以 model_construct 略過逐筆驗證
+    return NotificationResponse.model_construct(
         id=str(notification.id),
         type=notification.type,
         severity=notification.severity,
@@ -70,66 +100,107 @@ def _convert_db_notification_to_response(notification: Notification) -> Notifica
     )
 
 
+# 模擬通知內容固定，於載入時建立一次。時間以相對於現在的偏移表示
+# （created_ago / read_ago，未讀為 None）；data 中的 "__uuid__" 於載入時替換為隨機 ID
+_MOCK_TEMPLATE: tuple[dict, ...] = (
+    {
+        "type": "alert",
+        "severity": "critical",
+        "title": "CPA 異常上升警報",
+        "message": "過去 3 天 CPA 上升 45%，已超出正常波動範圍。建議立即檢查廣告活動設定。",
+        "data": {"metric": "cpa", "value": 18.5, "threshold": 12.0},
+        "created_ago": timedelta(0),
+        "read_ago": None,
+    },
+    {
+        "type": "recommendation",
+        "severity": "warning",
+        "title": "新建議：暫停疲勞素材",
+        "message": "系統偵測到 5 個素材疲勞度過高，建議暫停以優化廣告效能。",
+        "data": {"recommendation_id": "__uuid__", "count": 5},
+        "created_ago": timedelta(hours=2),
+        "read_ago": None,
+    },
+    {
+        "type": "system",
+        "severity": "info",
+        "title": "資料同步完成",
+        "message": "Google Ads 帳戶資料已成功同步，共更新 1,234 筆記錄。",
+        "data": {"account_id": "__uuid__", "records_updated": 1234},
+        "created_ago": timedelta(hours=4),
+        "read_ago": timedelta(hours=3),
+    },
+    {
+        "type": "alert",
+        "severity": "warning",
+        "title": "ROAS 低於目標",
+        "message": "當前 ROAS 為 2.8，低於目標值 3.5。建議優化廣告投放策略。",
+        "data": {"metric": "roas", "value": 2.8, "threshold": 3.5},
+        "created_ago": timedelta(hours=8),
+        "read_ago": timedelta(hours=6),
+    },
+    {
+        "type": "info",
+        "severity": "info",
+        "title": "健檢報告已產生",
+        "message": "您的帳戶健檢報告已產生，整體健康度分數為 72 分。",
+        "data": {"audit_id": "__uuid__", "score": 72},
+        "created_ago": timedelta(days=1),
+        "read_ago": timedelta(days=1),
+    },
+)
+
+_MOCK_UNREAD_COUNT = sum(1 for t in _MOCK_TEMPLATE if t["read_ago"] is None)
+
+# 模擬資料的 ID 不需每次不同，於載入時產生一次：(通知 ID, 已替換 ID 的 data)
+_MOCK_IDS: tuple[tuple[str, dict], ...] = tuple(
+    (
+        str(uuid.uuid4()),
+        {k: str(uuid.uuid4()) if v == "__uuid__" else v for k, v in t["data"].items()},
+    )
+    for t in _MOCK_TEMPLATE
+)
+
+
+@lru_cache(maxsize=1)
+def _mock_notifications_for_minute(minute: int) -> tuple[NotificationResponse, ...]:
+    """依分鐘產生模擬通知；同一分鐘內重用同一組物件，時間仍會隨分鐘更新"""
+    now = datetime.fromtimestamp(minute * 60, tz=timezone.utc)
+    return tuple(
+        NotificationResponse(
+            id=notification_id,
+            type=t["type"],
+            severity=t["severity"],
+            title=t["title"],
+            message=t["message"],
+            data=data,
+            is_read=t["read_ago"] is not None,
+            read_at=(now - t["read_ago"]).isoformat() if t["read_ago"] is not None else None,
+            created_at=(now - t["created_ago"]).isoformat(),
+        )
+        for t, (notification_id, data) in zip(_MOCK_TEMPLATE, _MOCK_IDS)
+    )
+
+
 def _generate_mock_notifications() -> list[NotificationResponse]:
     """產生模擬通知資料"""
-    now = datetime.now(timezone.utc)
-    return [
-        NotificationResponse(
-            id=str(uuid.uuid4()),
-            type="alert",
-            severity="critical",
-            title="CPA 異常上升警報",
-            message="過去 3 天 CPA 上升 45%，已超出正常波動範圍。建議立即檢查廣告活動設定。",
-            data={"metric": "cpa", "value": 18.5, "threshold": 12.0},
-            is_read=False,
-            read_at=None,
-            created_at=now.isoformat(),
-        ),
-        NotificationResponse(
-            id=str(uuid.uuid4()),
-            type="recommendation",
-            severity="warning",
-            title="新建議：暫停疲勞素材",
-            message="系統偵測到 5 個素材疲勞度過高，建議暫停以優化廣告效能。",
-            data={"recommendation_id": str(uuid.uuid4()), "count": 5},
-            is_read=False,
-            read_at=None,
-            created_at=(now - timedelta(hours=2)).isoformat(),
-        ),
-        NotificationResponse(
-            id=str(uuid.uuid4()),
-            type="system",
-            severity="info",
-            title="資料同步完成",
-            message="Google Ads 帳戶資料已成功同步，共更新 1,234 筆記錄。",
-            data={"account_id": str(uuid.uuid4()), "records_updated": 1234},
-            is_read=True,
-            read_at=(now - timedelta(hours=3)).isoformat(),
-            created_at=(now - timedelta(hours=4)).isoformat(),
-        ),
-        NotificationResponse(
-            id=str(uuid.uuid4()),
-            type="alert",
-            severity="warning",
-            title="ROAS 低於目標",
-            message="當前 ROAS 為 2.8，低於目標值 3.5。建議優化廣告投放策略。",
-            data={"metric": "roas", "value": 2.8, "threshold": 3.5},
-            is_read=True,
-            read_at=(now - timedelta(hours=6)).isoformat(),
-            created_at=(now - timedelta(hours=8)).isoformat(),
-        ),
-        NotificationResponse(
-            id=str(uuid.uuid4()),
-            type="info",
-            severity="info",
-            title="健檢報告已產生",
-            message="您的帳戶健檢報告已產生，整體健康度分數為 72 分。",
-            data={"audit_id": str(uuid.uuid4()), "score": 72},
-            is_read=True,
-            read_at=(now - timedelta(days=1)).isoformat(),
-            created_at=(now - timedelta(days=1)).isoformat(),
-        ),
-    ]
+    return list(_mock_notifications_for_minute(int(time.time() // 60)))
+
+
+def _encode_notification_cursor(notification: Notification) -> str:
+    """以最後一筆通知的 (created_at, id) 建立不透明游標"""
+    return base64.urlsafe_b64encode(
+        f"{notification.created_at.isoformat()}|{notification.id}".encode()
+    ).decode()
+
+
+def _decode_notification_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """解析分頁游標，格式錯誤時拋出 400"""
+    try:
+        created_at, notification_id = base64.urlsafe_b64decode(cursor).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), uuid.UUID(notification_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 
 @router.get("", response_model=NotificationListResponse)
@@ -139,6 +210,7 @@ async def get_notifications(
     severity: Optional[str] = Query(None, description="嚴重度: info, warning, error, critical"),
     page: int = Query(1, ge=1, description="頁碼"),
     page_size: int = Query(20, ge=1, le=50, description="每頁筆數"),
+    cursor: Optional[str] = Query(None, description="分頁游標，取自上一頁的 meta.next_cursor；指定時忽略 page"),
     db: AsyncSession = Depends(get_db),
 ) -> NotificationListResponse:
     """
@@ -150,34 +222,27 @@ async def get_notifications(
         severity: 篩選嚴重度
         page: 頁碼
         page_size: 每頁筆數
+        cursor: keyset 分頁游標，依 (created_at, id) 由新到舊接續上一頁
         db: 資料庫 session
 
     Returns:
         NotificationListResponse: 通知列表
     """
-    # 建立查詢
-    query = select(Notification)
-
-    # 已讀篩選
+    # 篩選條件
+    filters = []
     if is_read is not None:
-        query = query.where(Notification.is_read == is_read)
-
-    # 類型篩選
+        filters.append(Notification.is_read == is_read)
     if type:
-        query = query.where(Notification.type == type)
-
-    # 嚴重度篩選
+        filters.append(Notification.type == type)
     if severity:
-        query = query.where(Notification.severity == severity)
-
-    # 排序（最新在前）
-    query = query.order_by(Notification.created_at.desc())
+        filters.append(Notification.severity == severity)
 
-    result = await db.execute(query)
-    notification_records = result.scalars().all()
+    # 總數與未讀數以單一查詢在資料庫計算
+    counts = await db.execute(_NOTIFICATION_COUNTS_STMT.where(*filters))
+    total, unread_count = counts.one()
 
     # 如果資料庫無資料，返回模擬數據
-    if not notification_records:
+    if total == 0:
         all_notifications = _generate_mock_notifications()
 
         # 套用篩選
@@ -194,8 +259,8 @@ async def get_notifications(
         end = start + page_size
         paginated = all_notifications[start:end]
 
-        # 計算未讀數
-        unread_count = len([n for n in _generate_mock_notifications() if not n.is_read])
+        # 未讀數（不受篩選影響）
+        unread_count = _MOCK_UNREAD_COUNT
 
         return NotificationListResponse(
             data=paginated,
@@ -205,22 +270,32 @@ async def get_notifications(
                 "total": total,
                 "total_pages": (total + page_size - 1) // page_size,
                 "unread_count": unread_count,
+                "next_cursor": None,
             },
         )
 
-    # 轉換為回應格式
-    all_notifications = [_convert_db_notification_to_response(n) for n in notification_records]
-
-    # 分頁
-    total = len(all_notifications)
-    start = (page - 1) * page_size
-    end = start + page_size
-    paginated = all_notifications[start:end]
+    # 只取當頁資料（最新在前）；有游標時以 (created_at, id) keyset 接續，
+    # 深頁不需掃過並丟棄前面所有資料列。多取一筆判斷是否還有下一頁
+    page_query = _NOTIFICATION_PAGE_STMT.where(*filters).limit(page_size + 1)
+    if cursor:
+        after_created_at, after_id = _decode_notification_cursor(cursor)
+        page_query = page_query.where(
+            tuple_(Notification.created_at, Notification.id)
+            < tuple_(
+                literal(after_created_at, Notification.created_at.type),
+                literal(after_id, Notification.id.type),
+            )
+        )
+    else:
+        page_query = page_query.offset((page - 1) * page_size)
 
-    # 計算未讀數
-    unread_count = len([n for n in notification_records if not n.is_read])
+    result = await db.execute(page_query)
+    records = result.all()
+    has_more = len(records) > page_size
+    records = records[:page_size]
+    paginated = [_convert_db_notification_to_response(n) for n in records]
 
-    return NotificationListResponse(
+    return NotificationListResponse.model_construct(
         data=paginated,
         meta={
             "page": page,
@@ -228,36 +303,28 @@ async def get_notifications(
             "total": total,
             "total_pages": (total + page_size - 1) // page_size,
             "unread_count": unread_count,
+            "next_cursor": _encode_notification_cursor(records[-1]) if has_more else None,
         },
     )
 
 
 @router.get("/{notification_id}", response_model=NotificationResponse)
 async def get_notification(
-    notification_id: str,
+    notification_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ) -> NotificationResponse:
     """
     取得通知詳情
 
     Args:
-        notification_id: 通知 ID
+        notification_id: 通知 ID（格式錯誤時由 FastAPI 回傳 422）
         db: 資料庫 session
 
     Returns:
         NotificationResponse: 通知詳情
     """
-    # 驗證 ID 格式
-    try:
-        notification_uuid = uuid.UUID(notification_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid notification ID format")
-
-    # 從資料庫取得通知
-    result = await db.execute(
-        select(Notification).where(Notification.id == notification_uuid)
-    )
-    notification_record = result.scalar_one_or_none()
+    # 以主鍵取得通知（identity map 已有時不查詢資料庫）
+    notification_record = await db.get(Notification, notification_id)
 
     if not notification_record:
         raise HTTPException(status_code=404, detail="Notification not found")
@@ -267,47 +334,45 @@ async def get_notification(
 
 @router.put("/{notification_id}/read", response_model=MarkReadResponse)
 async def mark_notification_read(
-    notification_id: str,
+    notification_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ) -> MarkReadResponse:
     """
     標記通知為已讀
 
     Args:
-        notification_id: 通知 ID
+        notification_id: 通知 ID（格式錯誤時由 FastAPI 回傳 422）
         db: 資料庫 session
 
     Returns:
         MarkReadResponse: 標記結果
     """
-    # 驗證 ID 格式
-    try:
-        notification_uuid = uuid.UUID(notification_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid notification ID format")
-
-    # 從資料庫取得通知
+    # 以條件式 UPDATE 一次完成標記；已讀通知不更新，已讀時間由資料庫設定
     result = await db.execute(
-        select(Notification).where(Notification.id == notification_uuid)
-    )
-    notification_record = result.scalar_one_or_none()
-
-    if not notification_record:
-        # 模擬模式
-        return MarkReadResponse(
-            success=True,
-            notification_id=notification_id,
-            message="通知已標記為已讀 (simulated)",
+        update(Notification)
+        .where(
+            Notification.id == notification_id,
+            Notification.is_read == False,  # noqa: E712
         )
+        .values(is_read=True, read_at=func.now())
+        .returning(Notification.id)
+        .execution_options(synchronize_session=False)
+    )
 
-    # 更新為已讀
-    notification_record.is_read = True
-    notification_record.read_at = datetime.now(timezone.utc)
-    await db.flush()
+    if result.scalar_one_or_none() is None:
+        # 未更新任何資料列：區分已讀與不存在
+        exists = await db.scalar(select(Notification.id).where(Notification.id == notification_id))
+        if exists is None:
+            # 模擬模式
+            return MarkReadResponse(
+                success=True,
+                notification_id=str(notification_id),
+                message="通知已標記為已讀 (simulated)",
+            )
 
     return MarkReadResponse(
         success=True,
-        notification_id=notification_id,
+        notification_id=str(notification_id),
         message="通知已標記為已讀",
     )
 
@@ -315,28 +380,33 @@ async def mark_notification_read(
 @router.put("/read-all", response_model=MarkReadResponse)
 async def mark_all_notifications_read(
     db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
 ) -> MarkReadResponse:
     """
-    將所有未讀通知標記為已讀
+    將當前用戶所有未讀通知標記為已讀
 
     Args:
         db: 資料庫 session
+        current_user: 當前登入用戶
 
     Returns:
         MarkReadResponse: 標記結果
     """
     now = datetime.now(timezone.utc)
 
-    # 更新所有未讀通知
+    # 更新當前用戶的未讀通知（走 ix_notifications_unread_user 部分索引）；
+    # 筆數取自 rowcount，不需以 RETURNING 傳回每筆 ID
     result = await db.execute(
         update(Notification)
-        .where(Notification.is_read == False)  # noqa: E712
+        .where(
+            Notification.user_id == current_user.id,
+            Notification.is_read == False,  # noqa: E712
+        )
         .values(is_read=True, read_at=now)
-        .returning(Notification.id)
+        .execution_options(synchronize_session=False)
     )
 
-    updated_ids = result.scalars().all()
-    count = len(updated_ids)
+    count = result.rowcount
 
     if count == 0:
         return MarkReadResponse(
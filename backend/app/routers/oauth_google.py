@@ -8,30 +8,30 @@ Google Ads OAuth 路由
 3. 刷新 Token
 """
 
+import asyncio
 from typing import Optional
 from urllib.parse import urlencode
 from uuid import UUID
 
-import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import get_settings, Settings
+from app.core.config import get_settings_dependency, Settings
+from app.core.http import get_oauth_http_client
 from app.core.logger import get_logger
 from app.db.base import get_db
 from app.middleware.auth import get_current_user
 from app.models.user import User
 from app.services.csrf_protection import generate_oauth_state, verify_oauth_state
 from app.services.token_manager import TokenManager
+from app.workers import celery_app
 
 logger = get_logger(__name__)
 
-# 條件導入 Celery 任務（Celery 已棄用，改用 APScheduler）
-try:
-    from app.workers.run_health_audit import run_health_audit
-except ImportError:
-    run_health_audit = None
+# 健檢任務以名稱送出，不需在 web 程序中載入任務模組
+# （Celery 已棄用，改用 APScheduler；未安裝 celery 時 celery_app 為 None）
+HEALTH_AUDIT_TASK = "app.workers.run_health_audit.run_health_audit"
 
 router = APIRouter()
 
@@ -40,6 +40,14 @@ GOOGLE_AUTH_URL = "https://accounts.google.com/o/oauth2/v2/auth"
 GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
 GOOGLE_ADS_SCOPE = "https://www.googleapis.com/auth/adwords"
 
+# 授權 URL 中與請求無關的參數，於載入時編碼一次
+_GOOGLE_STATIC_QUERY = urlencode({
+    "response_type": "code",
+    "scope": GOOGLE_ADS_SCOPE,
+    "access_type": "offline",  # 取得 refresh token
+    "prompt": "consent",  # 強制顯示同意頁面以取得 refresh token
+})
+
 
 # Pydantic 模型
 class AuthUrlResponse(BaseModel):
@@ -85,26 +93,26 @@ async def exchange_code_for_tokens(
     Returns:
         包含 access_token, refresh_token, expires_in 的字典
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            GOOGLE_TOKEN_URL,
-            data={
-                "code": code,
-                "client_id": settings.GOOGLE_ADS_CLIENT_ID,
-                "client_secret": settings.GOOGLE_ADS_CLIENT_SECRET,
-                "redirect_uri": redirect_uri,
-                "grant_type": "authorization_code",
-            },
+    client = get_oauth_http_client()
+    response = await client.post(
+        GOOGLE_TOKEN_URL,
+        data={
+            "code": code,
+            "client_id": settings.GOOGLE_ADS_CLIENT_ID,
+            "client_secret": settings.GOOGLE_ADS_CLIENT_SECRET,
+            "redirect_uri": redirect_uri,
+            "grant_type": "authorization_code",
+        },
+    )
+
+    if response.status_code != 200:
+        logger.error(f"Google token exchange failed: {response.text}")
+        raise HTTPException(
+            status_code=400,
+            detail="Token exchange failed - please try again",
         )
 
-        if response.status_code != 200:
-            logger.error(f"Google token exchange failed: {response.text}")
-            raise HTTPException(
-                status_code=400,
-                detail="Token exchange failed - please try again",
-            )
-
-        return response.json()
+    return response.json()
 
 
 async def get_google_ads_customer_ids(
@@ -142,25 +150,25 @@ async def refresh_access_token(
     Returns:
         包含新 access_token 和 expires_in 的字典
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            GOOGLE_TOKEN_URL,
-            data={
-                "refresh_token": refresh_token,
-                "client_id": settings.GOOGLE_ADS_CLIENT_ID,
-                "client_secret": settings.GOOGLE_ADS_CLIENT_SECRET,
-                "grant_type": "refresh_token",
-            },
+    client = get_oauth_http_client()
+    response = await client.post(
+        GOOGLE_TOKEN_URL,
+        data={
+            "refresh_token": refresh_token,
+            "client_id": settings.GOOGLE_ADS_CLIENT_ID,
+            "client_secret": settings.GOOGLE_ADS_CLIENT_SECRET,
+            "grant_type": "refresh_token",
+        },
+    )
+
+    if response.status_code != 200:
+        logger.error(f"Google token refresh failed: {response.text}")
+        raise HTTPException(
+            status_code=400,
+            detail="Token refresh failed - please try again",
         )
 
-        if response.status_code != 200:
-            logger.error(f"Google token refresh failed: {response.text}")
-            raise HTTPException(
-                status_code=400,
-                detail="Token refresh failed - please try again",
-            )
-
-        return response.json()
+    return response.json()
 
 
 # API 端點
@@ -168,7 +176,7 @@ async def refresh_access_token(
 async def get_auth_url(
     redirect_uri: str = Query(..., description="OAuth 回調 URI"),
     current_user: User = Depends(get_current_user),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_settings_dependency),
 ) -> AuthUrlResponse:
     """
     產生 Google OAuth 授權 URL
@@ -187,20 +195,17 @@ async def get_auth_url(
     # 產生 state，包含 user_id 和 nonce 用於回調時識別用戶並防止 CSRF
     state = await generate_oauth_state(current_user.id, "google")
 
-    # 建構授權 URL 參數
+    # 建構授權 URL 參數（固定參數已預先編碼）
     params = {
         "client_id": settings.GOOGLE_ADS_CLIENT_ID,
         "redirect_uri": redirect_uri,
-        "response_type": "code",
-        "scope": GOOGLE_ADS_SCOPE,
-        "access_type": "offline",  # 取得 refresh token
-        "prompt": "consent",  # 強制顯示同意頁面以取得 refresh token
         "state": state,
     }
 
-    auth_url = f"{GOOGLE_AUTH_URL}?{urlencode(params)}"
+    auth_url = f"{GOOGLE_AUTH_URL}?{_GOOGLE_STATIC_QUERY}&{urlencode(params)}"
 
-    return AuthUrlResponse(auth_url=auth_url, state=state)
+    # 回應欄位皆由伺服器端產生，以 model_construct 略過驗證
+    return AuthUrlResponse.model_construct(auth_url=auth_url, state=state)
 
 
 @router.get("/callback", response_model=CallbackResponse)
@@ -212,7 +217,7 @@ async def oauth_callback(
         description="原始重定向 URI",
     ),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_settings_dependency),
 ) -> CallbackResponse:
     """
     處理 Google OAuth 回調
@@ -268,17 +273,20 @@ async def oauth_callback(
                 error=error,
             )
 
-        # 觸發健檢任務（背景執行）
+        # 觸發健檢任務（背景執行）；送出到 broker 是同步網路呼叫，
+        # 在執行緒池中執行以免阻塞 event loop
         audit_task_id = None
-        if run_health_audit is not None:
+        if celery_app is not None:
             try:
-                audit_task = run_health_audit.delay(str(account_id))
+                audit_task = await asyncio.to_thread(
+                    celery_app.send_task, HEALTH_AUDIT_TASK, args=[str(account_id)]
+                )
                 audit_task_id = audit_task.id
             except Exception as e:
                 # Celery 可能未啟動，記錄但不中斷流程
                 logger.warning(f"Failed to trigger health audit for account {account_id}: {e}")
 
-        return CallbackResponse(
+        return CallbackResponse.model_construct(
             success=True,
             account_id=str(account_id),
             customer_ids=customer_ids,
@@ -299,7 +307,7 @@ async def refresh_token_endpoint(
     request: RefreshTokenRequest,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_settings_dependency),
 ) -> RefreshTokenResponse:
     """
     刷新 Google OAuth Token
@@ -12,12 +12,12 @@ from typing import Optional
 from urllib.parse import urlencode
 from uuid import UUID
 
-import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import get_settings, Settings
+from app.core.config import get_settings_dependency, Settings
+from app.core.http import get_oauth_http_client
 from app.core.logger import get_logger
 from app.db.base import get_db
 from app.middleware.auth import get_current_user
@@ -42,6 +42,10 @@ LINKEDIN_SCOPES = [
     "r_basicprofile",  # 讀取基本資料（已棄用，但某些應用仍需要）
     "r_organization_admin",  # 讀取組織管理權限
 ]
+LINKEDIN_SCOPE = " ".join(LINKEDIN_SCOPES)
+
+# 授權 URL 中與請求無關的參數，於載入時編碼一次
+_LINKEDIN_STATIC_QUERY = urlencode({"response_type": "code", "scope": LINKEDIN_SCOPE})
 
 
 # Pydantic 模型
@@ -60,7 +64,7 @@ class CallbackResponse(BaseModel):
 
 class RefreshTokenRequest(BaseModel):
     """刷新 Token 請求"""
-    account_id: str
+    account_id: UUID
 
 
 class RefreshTokenResponse(BaseModel):
@@ -74,7 +78,7 @@ class RefreshTokenResponse(BaseModel):
 async def get_auth_url(
     redirect_uri: str = Query(..., description="OAuth 回調 URI"),
     current_user: User = Depends(get_current_user),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_settings_dependency),
 ) -> AuthUrlResponse:
     """
     產生 LinkedIn OAuth 授權 URL
@@ -91,18 +95,17 @@ async def get_auth_url(
     # 產生 state，包含 user_id 和 nonce 用於回調時識別用戶並防止 CSRF
     state = await generate_oauth_state(current_user.id, "linkedin")
 
-    # 建構授權 URL 參數
+    # 建構授權 URL 參數（固定參數已預先編碼）
     params = {
-        "response_type": "code",
         "client_id": settings.LINKEDIN_CLIENT_ID,
         "redirect_uri": redirect_uri,
         "state": state,
-        "scope": " ".join(LINKEDIN_SCOPES),
     }
 
-    auth_url = f"{LINKEDIN_AUTH_URL}?{urlencode(params)}"
+    auth_url = f"{LINKEDIN_AUTH_URL}?{_LINKEDIN_STATIC_QUERY}&{urlencode(params)}"
 
-    return AuthUrlResponse(auth_url=auth_url, state=state)
+    # 回應欄位皆由伺服器端產生，以 model_construct 略過驗證
+    return AuthUrlResponse.model_construct(auth_url=auth_url, state=state)
 
 
 async def exchange_code_for_tokens(
@@ -127,39 +130,39 @@ async def exchange_code_for_tokens(
             "access_token": f"mock_linkedin_access_{code[:8]}",
             "refresh_token": f"mock_linkedin_refresh_{code[:8]}",
             "expires_in": 5184000,  # 60 天
-            "scope": " ".join(LINKEDIN_SCOPES),
+            "scope": LINKEDIN_SCOPE,
         }
 
     # 真實 API 呼叫
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            LINKEDIN_TOKEN_URL,
-            data={
-                "grant_type": "authorization_code",
-                "code": code,
-                "client_id": settings.LINKEDIN_CLIENT_ID,
-                "client_secret": settings.LINKEDIN_CLIENT_SECRET,
-                "redirect_uri": redirect_uri,
-            },
-            headers={
-                "Content-Type": "application/x-www-form-urlencoded",
-            },
+    client = get_oauth_http_client()
+    response = await client.post(
+        LINKEDIN_TOKEN_URL,
+        data={
+            "grant_type": "authorization_code",
+            "code": code,
+            "client_id": settings.LINKEDIN_CLIENT_ID,
+            "client_secret": settings.LINKEDIN_CLIENT_SECRET,
+            "redirect_uri": redirect_uri,
+        },
+        headers={
+            "Content-Type": "application/x-www-form-urlencoded",
+        },
+    )
+
+    if response.status_code != 200:
+        logger.error(f"LinkedIn token exchange failed: {response.text}")
+        raise HTTPException(
+            status_code=400,
+            detail="Token exchange failed",
         )
 
-        if response.status_code != 200:
-            logger.error(f"LinkedIn token exchange failed: {response.text}")
-            raise HTTPException(
-                status_code=400,
-                detail="Token exchange failed",
-            )
-
-        data = response.json()
-        return {
-            "access_token": data.get("access_token"),
-            "refresh_token": data.get("refresh_token"),
-            "expires_in": data.get("expires_in", 5184000),
-            "scope": data.get("scope", ""),
-        }
+    data = response.json()
+    return {
+        "access_token": data.get("access_token"),
+        "refresh_token": data.get("refresh_token"),
+        "expires_in": data.get("expires_in", 5184000),
+        "scope": data.get("scope", ""),
+    }
 
 
 @router.get("/callback", response_model=CallbackResponse)
@@ -173,7 +176,7 @@ async def oauth_callback(
         description="原始重定向 URI",
     ),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_settings_dependency),
 ) -> CallbackResponse:
     """
     處理 LinkedIn OAuth 回調
@@ -226,7 +229,7 @@ async def oauth_callback(
                 error=error,
             )
 
-        return CallbackResponse(
+        return CallbackResponse.model_construct(
             success=True,
             account_id=str(account_id),
         )
@@ -258,38 +261,38 @@ async def refresh_access_token(
             "access_token": f"mock_linkedin_refreshed_{refresh_token[:8]}",
             "refresh_token": f"mock_linkedin_new_refresh_{refresh_token[:8]}",
             "expires_in": 5184000,  # 60 天
-            "scope": " ".join(LINKEDIN_SCOPES),
+            "scope": LINKEDIN_SCOPE,
         }
 
     # 真實 API 呼叫
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            LINKEDIN_TOKEN_URL,
-            data={
-                "grant_type": "refresh_token",
-                "refresh_token": refresh_token,
-                "client_id": settings.LINKEDIN_CLIENT_ID,
-                "client_secret": settings.LINKEDIN_CLIENT_SECRET,
-            },
-            headers={
-                "Content-Type": "application/x-www-form-urlencoded",
-            },
+    client = get_oauth_http_client()
+    response = await client.post(
+        LINKEDIN_TOKEN_URL,
+        data={
+            "grant_type": "refresh_token",
+            "refresh_token": refresh_token,
+            "client_id": settings.LINKEDIN_CLIENT_ID,
+            "client_secret": settings.LINKEDIN_CLIENT_SECRET,
+        },
+        headers={
+            "Content-Type": "application/x-www-form-urlencoded",
+        },
+    )
+
+    if response.status_code != 200:
+        logger.error(f"LinkedIn token refresh failed: {response.text}")
+        raise HTTPException(
+            status_code=400,
+            detail="Token refresh failed",
         )
 
-        if response.status_code != 200:
-            logger.error(f"LinkedIn token refresh failed: {response.text}")
-            raise HTTPException(
-                status_code=400,
-                detail="Token refresh failed",
-            )
-
-        data = response.json()
-        return {
-            "access_token": data.get("access_token"),
-            "refresh_token": data.get("refresh_token", refresh_token),
-            "expires_in": data.get("expires_in", 5184000),
-            "scope": data.get("scope", ""),
-        }
+    data = response.json()
+    return {
+        "access_token": data.get("access_token"),
+        "refresh_token": data.get("refresh_token", refresh_token),
+        "expires_in": data.get("expires_in", 5184000),
+        "scope": data.get("scope", ""),
+    }
 
 
 @router.post("/refresh", response_model=RefreshTokenResponse)
@@ -297,7 +300,7 @@ async def refresh_token_endpoint(
     request: RefreshTokenRequest,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_settings_dependency),
 ) -> RefreshTokenResponse:
     """
     刷新 LinkedIn access token
@@ -308,7 +311,7 @@ async def refresh_token_endpoint(
         token_manager = TokenManager(db)
 
         # 取得帳戶
-        account = await token_manager.get_account(UUID(request.account_id))
+        account = await token_manager.get_account(request.account_id)
 
         if not account:
             return RefreshTokenResponse(
@@ -338,7 +341,7 @@ async def refresh_token_endpoint(
 
         # 更新帳戶 tokens
         await token_manager.update_tokens(
-            account_id=UUID(request.account_id),
+            account_id=account.id,
             access_token=tokens["access_token"],
             refresh_token=tokens["refresh_token"],
             expires_in=tokens["expires_in"],
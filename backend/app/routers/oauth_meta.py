@@ -13,12 +13,12 @@ from typing import Optional
 from urllib.parse import urlencode
 from uuid import UUID
 
-import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import get_settings, Settings
+from app.core.config import get_settings_dependency, Settings
+from app.core.http import get_oauth_http_client
 from app.core.logger import get_logger
 from app.db.base import get_db
 from app.middleware.auth import get_current_user
@@ -90,25 +90,25 @@ async def exchange_code_for_tokens(
     Returns:
         包含 access_token 和 expires_in 的字典
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            META_TOKEN_URL,
-            params={
-                "client_id": settings.META_APP_ID,
-                "client_secret": settings.META_APP_SECRET,
-                "redirect_uri": redirect_uri,
-                "code": code,
-            },
+    client = get_oauth_http_client()
+    response = await client.get(
+        META_TOKEN_URL,
+        params={
+            "client_id": settings.META_APP_ID,
+            "client_secret": settings.META_APP_SECRET,
+            "redirect_uri": redirect_uri,
+            "code": code,
+        },
+    )
+
+    if response.status_code != 200:
+        logger.error(f"Meta token exchange failed: {response.text}")
+        raise HTTPException(
+            status_code=400,
+            detail="Token exchange failed - please try again",
         )
 
-        if response.status_code != 200:
-            logger.error(f"Meta token exchange failed: {response.text}")
-            raise HTTPException(
-                status_code=400,
-                detail="Token exchange failed - please try again",
-            )
-
-        return response.json()
+    return response.json()
 
 
 async def get_long_lived_token(
@@ -128,25 +128,25 @@ async def get_long_lived_token(
     Returns:
         包含長期 access_token 和 expires_in 的字典
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            META_TOKEN_URL,
-            params={
-                "grant_type": "fb_exchange_token",
-                "client_id": settings.META_APP_ID,
-                "client_secret": settings.META_APP_SECRET,
-                "fb_exchange_token": short_lived_token,
-            },
+    client = get_oauth_http_client()
+    response = await client.get(
+        META_TOKEN_URL,
+        params={
+            "grant_type": "fb_exchange_token",
+            "client_id": settings.META_APP_ID,
+            "client_secret": settings.META_APP_SECRET,
+            "fb_exchange_token": short_lived_token,
+        },
+    )
+
+    if response.status_code != 200:
+        logger.error(f"Meta long-lived token exchange failed: {response.text}")
+        raise HTTPException(
+            status_code=400,
+            detail="Long-lived token exchange failed - please try again",
         )
 
-        if response.status_code != 200:
-            logger.error(f"Meta long-lived token exchange failed: {response.text}")
-            raise HTTPException(
-                status_code=400,
-                detail="Long-lived token exchange failed - please try again",
-            )
-
-        return response.json()
+    return response.json()
 
 
 async def get_meta_ad_accounts(access_token: str) -> list[dict]:
@@ -159,33 +159,33 @@ async def get_meta_ad_accounts(access_token: str) -> list[dict]:
     Returns:
         廣告帳戶列表，每個帳戶包含 id, name, account_status 等資訊
     """
-    async with httpx.AsyncClient() as client:
-        # 先取得用戶資訊
-        me_response = await client.get(
-            f"{META_GRAPH_URL}/me",
-            params={
-                "access_token": access_token,
-                "fields": "id,name",
-            },
-        )
-
-        if me_response.status_code != 200:
-            return []
-
-        # 取得用戶可存取的廣告帳戶
-        accounts_response = await client.get(
-            f"{META_GRAPH_URL}/me/adaccounts",
-            params={
-                "access_token": access_token,
-                "fields": "id,name,account_status,currency,timezone_name",
-            },
-        )
-
-        if accounts_response.status_code != 200:
-            return []
-
-        data = accounts_response.json()
-        return data.get("data", [])
+    client = get_oauth_http_client()
+    # 先取得用戶資訊
+    me_response = await client.get(
+        f"{META_GRAPH_URL}/me",
+        params={
+            "access_token": access_token,
+            "fields": "id,name",
+        },
+    )
+
+    if me_response.status_code != 200:
+        return []
+
+    # 取得用戶可存取的廣告帳戶
+    accounts_response = await client.get(
+        f"{META_GRAPH_URL}/me/adaccounts",
+        params={
+            "access_token": access_token,
+            "fields": "id,name,account_status,currency,timezone_name",
+        },
+    )
+
+    if accounts_response.status_code != 200:
+        return []
+
+    data = accounts_response.json()
+    return data.get("data", [])
 
 
 # encode_state 和 decode_state 已移至 app.services.csrf_protection
@@ -197,7 +197,7 @@ async def get_meta_ad_accounts(access_token: str) -> list[dict]:
 async def get_auth_url(
     redirect_uri: str = Query(..., description="OAuth 回調 URI"),
     current_user: User = Depends(get_current_user),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_settings_dependency),
 ) -> AuthUrlResponse:
     """
     產生 Meta OAuth 授權 URL
@@ -239,7 +239,7 @@ async def oauth_callback(
         description="原始重定向 URI",
     ),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_settings_dependency),
 ) -> CallbackResponse:
     """
     處理 Meta OAuth 回調
@@ -342,7 +342,7 @@ async def refresh_token_endpoint(
     request: RefreshTokenRequest,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_settings_dependency),
 ) -> RefreshTokenResponse:
     """
     延長 Meta OAuth Token 有效期
@@ -19,12 +19,12 @@ from typing import Optional
 from urllib.parse import urlencode
 from uuid import UUID
 
-import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import get_settings, Settings
+from app.core.config import get_settings_dependency, Settings
+from app.core.http import get_oauth_http_client
 from app.core.logger import get_logger
 from app.db.base import get_db
 from app.middleware.auth import get_current_user
@@ -91,7 +91,7 @@ def _get_basic_auth_header(settings: Settings) -> str:
 async def get_auth_url(
     redirect_uri: str = Query(..., description="OAuth 回調 URI"),
     current_user: User = Depends(get_current_user),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_settings_dependency),
 ) -> AuthUrlResponse:
     """
     產生 Pinterest OAuth 授權 URL
@@ -150,34 +150,34 @@ async def exchange_code_for_tokens(
         }
 
     # 真實 API 呼叫
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            PINTEREST_TOKEN_URL,
-            data={
-                "grant_type": "authorization_code",
-                "code": code,
-                "redirect_uri": redirect_uri,
-            },
-            headers={
-                "Authorization": _get_basic_auth_header(settings),
-                "Content-Type": "application/x-www-form-urlencoded",
-            },
+    client = get_oauth_http_client()
+    response = await client.post(
+        PINTEREST_TOKEN_URL,
+        data={
+            "grant_type": "authorization_code",
+            "code": code,
+            "redirect_uri": redirect_uri,
+        },
+        headers={
+            "Authorization": _get_basic_auth_header(settings),
+            "Content-Type": "application/x-www-form-urlencoded",
+        },
+    )
+
+    if response.status_code != 200:
+        logger.error(f"Pinterest token exchange failed: {response.text}")
+        raise HTTPException(
+            status_code=400,
+            detail="Token exchange failed",
         )
 
-        if response.status_code != 200:
-            logger.error(f"Pinterest token exchange failed: {response.text}")
-            raise HTTPException(
-                status_code=400,
-                detail="Token exchange failed",
-            )
-
-        data = response.json()
-        return {
-            "access_token": data.get("access_token"),
-            "refresh_token": data.get("refresh_token"),
-            "expires_in": data.get("expires_in", 2592000),
-            "scope": data.get("scope", ""),
-        }
+    data = response.json()
+    return {
+        "access_token": data.get("access_token"),
+        "refresh_token": data.get("refresh_token"),
+        "expires_in": data.get("expires_in", 2592000),
+        "scope": data.get("scope", ""),
+    }
 
 
 @router.get("/callback", response_model=CallbackResponse)
@@ -191,7 +191,7 @@ async def oauth_callback(
         description="原始重定向 URI",
     ),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_settings_dependency),
 ) -> CallbackResponse:
     """
     處理 Pinterest OAuth 回調
@@ -280,33 +280,33 @@ async def refresh_access_token(
         }
 
     # 真實 API 呼叫
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            PINTEREST_TOKEN_URL,
-            data={
-                "grant_type": "refresh_token",
-                "refresh_token": refresh_token,
-            },
-            headers={
-                "Authorization": _get_basic_auth_header(settings),
-                "Content-Type": "application/x-www-form-urlencoded",
-            },
+    client = get_oauth_http_client()
+    response = await client.post(
+        PINTEREST_TOKEN_URL,
+        data={
+            "grant_type": "refresh_token",
+            "refresh_token": refresh_token,
+        },
+        headers={
+            "Authorization": _get_basic_auth_header(settings),
+            "Content-Type": "application/x-www-form-urlencoded",
+        },
+    )
+
+    if response.status_code != 200:
+        logger.error(f"Pinterest token refresh failed: {response.text}")
+        raise HTTPException(
+            status_code=400,
+            detail="Token refresh failed",
         )
 
-        if response.status_code != 200:
-            logger.error(f"Pinterest token refresh failed: {response.text}")
-            raise HTTPException(
-                status_code=400,
-                detail="Token refresh failed",
-            )
-
-        data = response.json()
-        return {
-            "access_token": data.get("access_token"),
-            "refresh_token": data.get("refresh_token", refresh_token),
-            "expires_in": data.get("expires_in", 2592000),
-            "scope": data.get("scope", ""),
-        }
+    data = response.json()
+    return {
+        "access_token": data.get("access_token"),
+        "refresh_token": data.get("refresh_token", refresh_token),
+        "expires_in": data.get("expires_in", 2592000),
+        "scope": data.get("scope", ""),
+    }
 
 
 @router.post("/refresh", response_model=RefreshTokenResponse)
@@ -314,7 +314,7 @@ async def refresh_token_endpoint(
     request: RefreshTokenRequest,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_settings_dependency),
 ) -> RefreshTokenResponse:
     """
     刷新 Pinterest access token
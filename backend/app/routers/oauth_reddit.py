@@ -14,12 +14,12 @@ from typing import Optional
 from urllib.parse import urlencode
 from uuid import UUID
 
-import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import get_settings, Settings
+from app.core.config import get_settings_dependency, Settings
+from app.core.http import get_oauth_http_client
 from app.core.logger import get_logger
 from app.db.base import get_db
 from app.middleware.auth import get_current_user
@@ -77,7 +77,7 @@ def is_mock_mode() -> bool:
 async def get_auth_url(
     redirect_uri: str = Query(..., description="OAuth 回調 URI"),
     current_user: User = Depends(get_current_user),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_settings_dependency),
 ) -> AuthUrlResponse:
     """
     產生 Reddit OAuth 授權 URL
@@ -134,42 +134,42 @@ async def exchange_code_for_tokens(
         f"{settings.REDDIT_CLIENT_ID}:{settings.REDDIT_CLIENT_SECRET}".encode()
     ).decode()
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            REDDIT_TOKEN_URL,
-            data={
-                "grant_type": "authorization_code",
-                "code": code,
-                "redirect_uri": redirect_uri,
-            },
-            headers={
-                "Authorization": f"Basic {credentials}",
-                "Content-Type": "application/x-www-form-urlencoded",
-                "User-Agent": "AdOptimize/1.0",
-            },
+    client = get_oauth_http_client()
+    response = await client.post(
+        REDDIT_TOKEN_URL,
+        data={
+            "grant_type": "authorization_code",
+            "code": code,
+            "redirect_uri": redirect_uri,
+        },
+        headers={
+            "Authorization": f"Basic {credentials}",
+            "Content-Type": "application/x-www-form-urlencoded",
+            "User-Agent": "AdOptimize/1.0",
+        },
+    )
+
+    if response.status_code != 200:
+        logger.error(f"Reddit token exchange failed: {response.text}")
+        raise HTTPException(
+            status_code=400,
+            detail="Token exchange failed - please try again",
         )
 
-        if response.status_code != 200:
-            logger.error(f"Reddit token exchange failed: {response.text}")
-            raise HTTPException(
-                status_code=400,
-                detail="Token exchange failed - please try again",
-            )
+    data = response.json()
 
-        data = response.json()
-
-        if "error" in data:
-            raise HTTPException(
-                status_code=400,
-                detail=data.get("error_description", data.get("error")),
-            )
+    if "error" in data:
+        raise HTTPException(
+            status_code=400,
+            detail=data.get("error_description", data.get("error")),
+        )
 
-        return {
-            "access_token": data.get("access_token"),
-            "refresh_token": data.get("refresh_token"),
-            "expires_in": data.get("expires_in", 3600),
-            "scope": data.get("scope", ""),
-        }
+    return {
+        "access_token": data.get("access_token"),
+        "refresh_token": data.get("refresh_token"),
+        "expires_in": data.get("expires_in", 3600),
+        "scope": data.get("scope", ""),
+    }
 
 
 @router.get("/callback", response_model=CallbackResponse)
@@ -183,7 +183,7 @@ async def oauth_callback(
         description="原始重定向 URI",
     ),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_settings_dependency),
 ) -> CallbackResponse:
     """處理 Reddit OAuth 回調"""
     try:
@@ -264,7 +264,7 @@ async def refresh_token_endpoint(
     request: RefreshTokenRequest,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_settings_dependency),
 ) -> RefreshTokenResponse:
     """
     刷新 Reddit OAuth Token
@@ -14,12 +14,12 @@ from typing import Optional
 from urllib.parse import urlencode
 from uuid import UUID
 
-import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import get_settings, Settings
+from app.core.config import get_settings_dependency, Settings
+from app.core.http import get_oauth_http_client
 from app.core.logger import get_logger
 from app.db.base import get_db
 from app.middleware.auth import get_current_user
@@ -78,7 +78,7 @@ class RefreshTokenResponse(BaseModel):
 async def get_auth_url(
     redirect_uri: str = Query(..., description="OAuth 回調 URI"),
     current_user: User = Depends(get_current_user),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_settings_dependency),
 ) -> AuthUrlResponse:
     """
     產生 TikTok OAuth 授權 URL
@@ -138,39 +138,39 @@ async def exchange_code_for_tokens(
         }
 
     # 真實 API 呼叫
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            TIKTOK_TOKEN_URL,
-            json={
-                "app_id": settings.TIKTOK_APP_ID,
-                "secret": settings.TIKTOK_APP_SECRET,
-                "auth_code": auth_code,
-            },
-            headers={"Content-Type": "application/json"},
+    client = get_oauth_http_client()
+    response = await client.post(
+        TIKTOK_TOKEN_URL,
+        json={
+            "app_id": settings.TIKTOK_APP_ID,
+            "secret": settings.TIKTOK_APP_SECRET,
+            "auth_code": auth_code,
+        },
+        headers={"Content-Type": "application/json"},
+    )
+
+    if response.status_code != 200:
+        logger.error(f"TikTok token exchange failed: {response.text}")
+        raise HTTPException(
+            status_code=400,
+            detail="Token exchange failed - please try again",
         )
 
-        if response.status_code != 200:
-            logger.error(f"TikTok token exchange failed: {response.text}")
-            raise HTTPException(
-                status_code=400,
-                detail="Token exchange failed - please try again",
-            )
-
-        data = response.json()
-        if data.get("code") != 0:
-            raise HTTPException(
-                status_code=400,
-                detail=data.get("message", "Token exchange failed"),
-            )
+    data = response.json()
+    if data.get("code") != 0:
+        raise HTTPException(
+            status_code=400,
+            detail=data.get("message", "Token exchange failed"),
+        )
 
-        token_data = data.get("data", {})
-        return {
-            "access_token": token_data.get("access_token"),
-            "refresh_token": token_data.get("refresh_token"),
-            "expires_in": token_data.get("expires_in", 86400),
-            "refresh_expires_in": token_data.get("refresh_expires_in", 31536000),
-            "advertiser_ids": token_data.get("advertiser_ids", []),
-        }
+    token_data = data.get("data", {})
+    return {
+        "access_token": token_data.get("access_token"),
+        "refresh_token": token_data.get("refresh_token"),
+        "expires_in": token_data.get("expires_in", 86400),
+        "refresh_expires_in": token_data.get("refresh_expires_in", 31536000),
+        "advertiser_ids": token_data.get("advertiser_ids", []),
+    }
 
 
 @router.get("/callback", response_model=CallbackResponse)
@@ -182,7 +182,7 @@ async def oauth_callback(
         description="原始重定向 URI",
     ),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_settings_dependency),
 ) -> CallbackResponse:
     """
     處理 TikTok OAuth 回調
@@ -255,7 +255,7 @@ async def refresh_token_endpoint(
     request: RefreshTokenRequest,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_settings_dependency),
 ) -> RefreshTokenResponse:
     """
     刷新 TikTok OAuth Token
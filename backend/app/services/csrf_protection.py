@@ -7,11 +7,14 @@ CSRF 保護服務
 """
 
 import base64
-import json
+import binascii
+import hashlib
+import hmac
 import secrets
 import uuid
 from typing import Optional
 
+from app.core.config import get_settings
 from app.core.logger import get_logger
 from app.services.redis_client import get_redis_client
 
@@ -23,6 +26,19 @@ NONCE_TTL_SECONDS = 600
 # Redis key 前綴
 OAUTH_NONCE_PREFIX = "oauth:nonce:"
 
+# state 為固定長度的二進位資料：user_id (16) + nonce (16) + HMAC-SHA256 截斷 (16)，
+# 以 base64url（去除 padding）編碼。provider 納入 HMAC 計算，不需另外傳遞
+_STATE_NONCE_BYTES = 16
+_STATE_TAG_BYTES = 16
+_STATE_PAYLOAD_BYTES = 16 + _STATE_NONCE_BYTES
+_STATE_BYTES = _STATE_PAYLOAD_BYTES + _STATE_TAG_BYTES
+
+
+def _state_tag(payload: bytes, provider: str) -> bytes:
+    """計算 state 的 HMAC 標籤（綁定 provider）"""
+    key = get_settings().JWT_SECRET_KEY.encode()
+    return hmac.new(key, provider.encode() + b"|" + payload, hashlib.sha256).digest()[:_STATE_TAG_BYTES]
+
 
 async def generate_oauth_state(user_id: uuid.UUID, provider: str) -> str:
     """
@@ -35,17 +51,12 @@ async def generate_oauth_state(user_id: uuid.UUID, provider: str) -> str:
     Returns:
         編碼後的 state 字串
     """
-    nonce = secrets.token_urlsafe(32)
-
-    state_data = {
-        "nonce": nonce,
-        "user_id": str(user_id),
-        "provider": provider,
-    }
+    nonce = secrets.token_bytes(_STATE_NONCE_BYTES)
+    payload = user_id.bytes + nonce
 
     # 存儲 nonce 到 Redis（帶 TTL）
     redis_client = get_redis_client()
-    key = f"{OAUTH_NONCE_PREFIX}{nonce}"
+    key = f"{OAUTH_NONCE_PREFIX}{nonce.hex()}"
 
     try:
         await redis_client.set(key, str(user_id), expire=NONCE_TTL_SECONDS)
@@ -54,7 +65,8 @@ async def generate_oauth_state(user_id: uuid.UUID, provider: str) -> str:
         logger.error(f"Failed to store OAuth nonce: {e}")
         # 即使 Redis 失敗也繼續，但記錄錯誤
 
-    return base64.urlsafe_b64encode(json.dumps(state_data).encode()).decode()
+    state = payload + _state_tag(payload, provider)
+    return base64.urlsafe_b64encode(state).rstrip(b"=").decode()
 
 
 async def verify_oauth_state(state: str, provider: str) -> tuple[bool, Optional[uuid.UUID], Optional[str]]:
@@ -62,9 +74,8 @@ async def verify_oauth_state(state: str, provider: str) -> tuple[bool, Optional[
     驗證 OAuth state 參數
 
     檢查：
-    1. state 格式是否正確
+    1. state 格式與 HMAC 標籤是否正確（標籤綁定 provider）
     2. nonce 是否存在於 Redis
-    3. provider 是否匹配
 
     Args:
         state: 編碼後的 state 字串
@@ -73,50 +84,49 @@ async def verify_oauth_state(state: str, provider: str) -> tuple[bool, Optional[
     Returns:
         Tuple of (is_valid, user_id, error_message)
     """
+    # 解碼 state
     try:
-        # 解碼 state
-        state_data = json.loads(base64.urlsafe_b64decode(state))
-        nonce = state_data.get("nonce")
-        user_id_str = state_data.get("user_id")
-        state_provider = state_data.get("provider")
+        raw = base64.urlsafe_b64decode(state + "=" * (-len(state) % 4))
+    except (binascii.Error, ValueError) as e:
+        logger.error(f"Failed to decode OAuth state: {e}")
+        return False, None, "Invalid state parameter - unable to decode"
 
-        if not all([nonce, user_id_str]):
-            return False, None, "Invalid state format - missing required fields"
+    if len(raw) != _STATE_BYTES:
+        return False, None, "Invalid state format - missing required fields"
 
-        # 驗證 provider
-        if state_provider and state_provider != provider:
-            return False, None, f"Provider mismatch: expected {provider}, got {state_provider}"
+    payload, tag = raw[:_STATE_PAYLOAD_BYTES], raw[_STATE_PAYLOAD_BYTES:]
+    if not hmac.compare_digest(tag, _state_tag(payload, provider)):
+        logger.warning(f"OAuth state signature mismatch for provider {provider}")
+        return False, None, "Invalid state parameter - signature mismatch"
 
-        # 驗證 nonce 存在於 Redis
-        redis_client = get_redis_client()
-        key = f"{OAUTH_NONCE_PREFIX}{nonce}"
+    user_id = uuid.UUID(bytes=payload[:16])
+    nonce = payload[16:].hex()
 
-        try:
-            stored_user_id = await redis_client.get(key)
+    # 驗證 nonce 存在於 Redis
+    redis_client = get_redis_client()
+    key = f"{OAUTH_NONCE_PREFIX}{nonce}"
 
-            if not stored_user_id:
-                logger.warning(f"OAuth nonce not found or expired: {nonce[:8]}...")
-                return False, None, "Invalid or expired state - please try again"
+    try:
+        # 取得並同時刪除 nonce（單次往返、原子操作，同一 state 只能使用一次）
+        stored_user_id = await redis_client.getdel(key)
 
-            # 驗證 user_id 匹配
-            if stored_user_id != user_id_str:
-                logger.warning(f"OAuth nonce user_id mismatch")
-                return False, None, "State validation failed - user mismatch"
+        if not stored_user_id:
+            logger.warning(f"OAuth nonce not found or expired: {nonce[:8]}...")
+            return False, None, "Invalid or expired state - please try again"
 
-            # 驗證成功，刪除 nonce（防止重放攻擊）
-            await redis_client.delete(key)
-            logger.info(f"OAuth state verified for user {user_id_str}")
+        # 驗證 user_id 匹配
+        if stored_user_id != str(user_id):
+            logger.warning("OAuth nonce user_id mismatch")
+            return False, None, "State validation failed - user mismatch"
 
-            return True, uuid.UUID(user_id_str), None
+        logger.info(f"OAuth state verified for user {user_id}")
 
-        except Exception as e:
-            logger.error(f"Redis error during nonce verification: {e}")
-            # Redis 失敗時必須拒絕，不可降級通過（CSRF 防護）
-            return False, None, "State verification unavailable - please try again"
+        return True, user_id, None
 
-    except (json.JSONDecodeError, ValueError, TypeError) as e:
-        logger.error(f"Failed to decode OAuth state: {e}")
-        return False, None, "Invalid state parameter - unable to decode"
+    except Exception as e:
+        logger.error(f"Redis error during nonce verification: {e}")
+        # Redis 失敗時必須拒絕，不可降級通過（CSRF 防護）
+        return False, None, "State verification unavailable - please try again"
 
 
 async def cleanup_expired_nonces() -> int:
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+儀表板聚合視圖維護
+
+儀表板查詢讀取物化視圖 daily_account_platform_agg，
+每次廣告數據同步完成後呼叫 refresh_dashboard_aggregates() 更新。
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import text
+
+from app.db.base import async_session_maker
+from app.services.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# 最近一次視圖更新時間（UTC ISO 字串），儀表板據此判斷今日數據是否可能存在
+REFRESHED_AT_KEY = "dashboard:aggregates_refreshed_at"
+
+# CONCURRENTLY 不會阻擋儀表板讀取（需要唯一索引，見 migration 007）
+_REFRESH_SQL = text("REFRESH MATERIALIZED VIEW CONCURRENTLY daily_account_platform_agg")
+
+
+async def refresh_dashboard_aggregates() -> None:
+    """重新整理儀表板每日聚合物化視圖"""
+    if async_session_maker is None:
+        logger.warning("Database not available, skipping dashboard aggregate refresh")
+        return
+
+    async with async_session_maker() as session:
+        await session.execute(_REFRESH_SQL)
+        await session.commit()
+    logger.info("Dashboard aggregates refreshed")
+
+    try:
+        await get_redis_client().set(REFRESHED_AT_KEY, datetime.now(timezone.utc).isoformat())
+    except Exception as e:
+        logger.warning(f"Failed to record dashboard aggregate refresh time: {e}")
+
+
+async def get_aggregates_refreshed_at() -> Optional[datetime]:
+    """
+    取得最近一次視圖更新時間
+
+    Redis 不可用或尚未記錄時返回 None，呼叫端應視為「未知」並照常查詢。
+    """
+    try:
+        value = await get_redis_client().get(REFRESHED_AT_KEY)
+    except Exception as e:
+        logger.warning(f"Failed to read dashboard aggregate refresh time: {e}")
+        return None
+    return datetime.fromisoformat(value) if value else None
@@ -99,6 +99,20 @@ class RedisClient:
         """
         return await self.client.delete(key)
 
+    async def getdel(self, key: str) -> Optional[str]:
+        """
+        取得快取值並刪除（原子操作，需 Redis 6.2+）
+
+        適合一次性使用的值，如 OAuth nonce
+
+        Args:
+            key: 快取鍵名
+
+        Returns:
+            刪除前的值，若不存在則回傳 None
+        """
+        return await self.client.getdel(key)
+
     async def exists(self, key: str) -> bool:
         """
         檢查鍵是否存在
@@ -9,15 +9,17 @@ Token 管理服務
 4. 加密敏感資訊
 """
 
+import asyncio
 import uuid
+import weakref
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-import httpx
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
+from app.core.http import get_oauth_http_client
 from app.core.logger import get_logger
 from app.models.ad_account import AdAccount
 
@@ -33,6 +35,45 @@ META_TOKEN_URL = "https://graph.facebook.com/v24.0/oauth/access_token"
 # TikTok OAuth 端點
 TIKTOK_REFRESH_URL = "https://business-api.tiktok.com/open_api/v1.3/oauth2/refresh_token/"
 
+# 提前刷新的緩衝時間
+TOKEN_REFRESH_BUFFER = timedelta(minutes=5)
+
+class _RefreshState:
+    """
+    單一帳戶的刷新狀態
+
+    failures 為刷新失敗次數：等待鎖前先記下，取得鎖後若已增加，
+    代表等待期間的刷新已失敗，直接放棄而不重複向提供者請求。
+    """
+
+    __slots__ = ("lock", "failures", "__weakref__")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.failures = 0
+
+
+# 各帳戶的刷新狀態；無人持有或等待時自動釋放
+_refresh_states: "weakref.WeakValueDictionary[uuid.UUID, _RefreshState]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _refresh_state(account_id: uuid.UUID) -> _RefreshState:
+    """取得帳戶的刷新狀態，讓同一帳戶的並行刷新只向提供者請求一次"""
+    state = _refresh_states.get(account_id)
+    if state is None:
+        state = _RefreshState()
+        _refresh_states[account_id] = state
+    return state
+
+
+def _expires_soon(account: AdAccount) -> bool:
+    """token 是否已過期或即將過期"""
+    return bool(account.token_expires_at) and (
+        datetime.now(timezone.utc) + TOKEN_REFRESH_BUFFER >= account.token_expires_at
+    )
+
 
 class TokenManager:
     """Token 管理器"""
@@ -78,19 +119,26 @@ class TokenManager:
             return None
 
         # 檢查 token 是否即將過期（提前 5 分鐘刷新）
-        if account.token_expires_at:
-            buffer = timedelta(minutes=5)
-            if datetime.now(timezone.utc) + buffer >= account.token_expires_at:
-                # Token 即將過期，需要刷新
-                if account.platform == "google":
-                    refreshed = await self.refresh_google_token(account)
-                    if refreshed:
-                        return account.access_token
-                    return None
-                elif account.platform == "meta":
-                    # Meta token 無法刷新，返回現有 token
-                    # 如果過期，需要用戶重新授權
-                    return account.access_token
+        if _expires_soon(account):
+            # Token 即將過期，需要刷新
+            if account.platform == "google":
+                # 同一帳戶的並行請求只由第一個向 Google 刷新；
+                # 其餘取得鎖後重新讀取帳戶，直接使用已刷新的 token。
+                # 等待期間的刷新若失敗，等待者直接返回 None，不再逐一重試
+                state = _refresh_state(account.id)
+                failures_seen = state.failures
+                async with state.lock:
+                    if state.failures != failures_seen:
+                        return None
+                    await self.db.refresh(account)
+                    if _expires_soon(account) and not await self.refresh_google_token(account):
+                        state.failures += 1
+                        return None
+                return account.access_token
+            elif account.platform == "meta":
+                # Meta token 無法刷新，返回現有 token
+                # 如果過期，需要用戶重新授權
+                return account.access_token
 
         return account.access_token
 
@@ -108,35 +156,35 @@ class TokenManager:
             return False
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    GOOGLE_TOKEN_URL,
-                    data={
-                        "refresh_token": account.refresh_token,
-                        "client_id": settings.GOOGLE_ADS_CLIENT_ID,
-                        "client_secret": settings.GOOGLE_ADS_CLIENT_SECRET,
-                        "grant_type": "refresh_token",
-                    },
-                )
+            client = get_oauth_http_client()
+            response = await client.post(
+                GOOGLE_TOKEN_URL,
+                data={
+                    "refresh_token": account.refresh_token,
+                    "client_id": settings.GOOGLE_ADS_CLIENT_ID,
+                    "client_secret": settings.GOOGLE_ADS_CLIENT_SECRET,
+                    "grant_type": "refresh_token",
+                },
+            )
 
-                if response.status_code != 200:
-                    return False
+            if response.status_code != 200:
+                return False
 
-                data = response.json()
-                new_access_token = data.get("access_token")
-                expires_in = data.get("expires_in", 3600)
+            data = response.json()
+            new_access_token = data.get("access_token")
+            expires_in = data.get("expires_in", 3600)
 
-                if not new_access_token:
-                    return False
+            if not new_access_token:
+                return False
 
-                # 更新資料庫
-                await self.update_tokens(
-                    account_id=account.id,
-                    access_token=new_access_token,
-                    expires_in=expires_in,
-                )
+            # 更新資料庫
+            await self.update_tokens(
+                account_id=account.id,
+                access_token=new_access_token,
+                expires_in=expires_in,
+            )
 
-                return True
+            return True
 
         except Exception as e:
             logger.error(f"Failed to refresh Google token: {e}")
@@ -170,42 +218,42 @@ class TokenManager:
             return True
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    TIKTOK_REFRESH_URL,
-                    json={
-                        "app_id": settings.TIKTOK_APP_ID,
-                        "secret": settings.TIKTOK_APP_SECRET,
-                        "refresh_token": account.refresh_token,
-                    },
-                    headers={"Content-Type": "application/json"},
-                )
+            client = get_oauth_http_client()
+            response = await client.post(
+                TIKTOK_REFRESH_URL,
+                json={
+                    "app_id": settings.TIKTOK_APP_ID,
+                    "secret": settings.TIKTOK_APP_SECRET,
+                    "refresh_token": account.refresh_token,
+                },
+                headers={"Content-Type": "application/json"},
+            )
 
-                if response.status_code != 200:
-                    logger.error(f"TikTok token refresh failed: {response.text}")
-                    return False
+            if response.status_code != 200:
+                logger.error(f"TikTok token refresh failed: {response.text}")
+                return False
 
-                data = response.json()
-                if data.get("code") != 0:
-                    logger.error(f"TikTok token refresh error: {data}")
-                    return False
+            data = response.json()
+            if data.get("code") != 0:
+                logger.error(f"TikTok token refresh error: {data}")
+                return False
 
-                token_data = data.get("data", {})
-                new_access_token = token_data.get("access_token")
-                new_refresh_token = token_data.get("refresh_token")
-                expires_in = token_data.get("expires_in", 86400)
+            token_data = data.get("data", {})
+            new_access_token = token_data.get("access_token")
+            new_refresh_token = token_data.get("refresh_token")
+            expires_in = token_data.get("expires_in", 86400)
 
-                if not new_access_token:
-                    return False
+            if not new_access_token:
+                return False
 
-                await self.update_tokens(
-                    account_id=account.id,
-                    access_token=new_access_token,
-                    refresh_token=new_refresh_token,
-                    expires_in=expires_in,
-                )
+            await self.update_tokens(
+                account_id=account.id,
+                access_token=new_access_token,
+                refresh_token=new_refresh_token,
+                expires_in=expires_in,
+            )
 
-                return True
+            return True
 
         except Exception as e:
             logger.error(f"Failed to refresh TikTok token: {e}")
@@ -245,36 +293,36 @@ class TokenManager:
             f"{settings.REDDIT_CLIENT_ID}:{settings.REDDIT_CLIENT_SECRET}".encode()
         ).decode()
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://www.reddit.com/api/v1/access_token",
-                data={
-                    "grant_type": "refresh_token",
-                    "refresh_token": account.refresh_token,
-                },
-                headers={
-                    "Authorization": f"Basic {credentials}",
-                    "Content-Type": "application/x-www-form-urlencoded",
-                    "User-Agent": "AdOptimize/1.0",
-                },
-            )
+        client = get_oauth_http_client()
+        response = await client.post(
+            "https://www.reddit.com/api/v1/access_token",
+            data={
+                "grant_type": "refresh_token",
+                "refresh_token": account.refresh_token,
+            },
+            headers={
+                "Authorization": f"Basic {credentials}",
+                "Content-Type": "application/x-www-form-urlencoded",
+                "User-Agent": "AdOptimize/1.0",
+            },
+        )
 
-            if response.status_code != 200:
-                logger.error(f"Reddit token refresh failed: {response.text}")
-                return False
+        if response.status_code != 200:
+            logger.error(f"Reddit token refresh failed: {response.text}")
+            return False
 
-            data = response.json()
+        data = response.json()
 
-            if "error" in data:
-                logger.error(f"Reddit token refresh error: {data}")
-                return False
+        if "error" in data:
+            logger.error(f"Reddit token refresh error: {data}")
+            return False
 
-            return await self.update_tokens(
-                account_id=account.id,
-                access_token=data.get("access_token"),
-                refresh_token=data.get("refresh_token"),
-                expires_in=data.get("expires_in", 3600),
-            )
+        return await self.update_tokens(
+            account_id=account.id,
+            access_token=data.get("access_token"),
+            refresh_token=data.get("refresh_token"),
+            expires_in=data.get("expires_in", 3600),
+        )
 
     async def refresh_meta_token(self, account: AdAccount) -> bool:
         """
@@ -292,35 +340,35 @@ class TokenManager:
             return False
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    META_TOKEN_URL,
-                    params={
-                        "grant_type": "fb_exchange_token",
-                        "client_id": settings.META_APP_ID,
-                        "client_secret": settings.META_APP_SECRET,
-                        "fb_exchange_token": account.access_token,
-                    },
-                )
+            client = get_oauth_http_client()
+            response = await client.get(
+                META_TOKEN_URL,
+                params={
+                    "grant_type": "fb_exchange_token",
+                    "client_id": settings.META_APP_ID,
+                    "client_secret": settings.META_APP_SECRET,
+                    "fb_exchange_token": account.access_token,
+                },
+            )
 
-                if response.status_code != 200:
-                    return False
+            if response.status_code != 200:
+                return False
 
-                data = response.json()
-                new_access_token = data.get("access_token")
-                expires_in = data.get("expires_in", 5184000)  # 60 days
+            data = response.json()
+            new_access_token = data.get("access_token")
+            expires_in = data.get("expires_in", 5184000)  # 60 days
 
-                if not new_access_token:
-                    return False
+            if not new_access_token:
+                return False
 
-                # 更新資料庫
-                await self.update_tokens(
-                    account_id=account.id,
-                    access_token=new_access_token,
-                    expires_in=expires_in,
-                )
+            # 更新資料庫
+            await self.update_tokens(
+                account_id=account.id,
+                access_token=new_access_token,
+                expires_in=expires_in,
+            )
 
-                return True
+            return True
 
         except Exception as e:
             logger.error(f"Failed to refresh Meta token: {e}")
@@ -464,9 +512,9 @@ class TokenManager:
             status="active",
         )
 
+        # id 由 uuid4 在用戶端產生，commit 後即可使用，不需再查詢一次
         self.db.add(account)
         await self.db.commit()
-        await self.db.refresh(account)
 
         logger.info(f"Created new account {external_id} for user {user_id}")
         return (account.id, True, None)
@@ -1076,6 +1076,8 @@ async def sync_metrics_for_account(
                 metrics = CreativeMetrics(
                     id=uuid.uuid4(),
                     creative_id=creative_id,
+                    ad_account_id=account.id,
+                    platform=account.platform,
                     date=metric_date,
                     impressions=impressions,
                     clicks=clicks,
@@ -44,7 +44,11 @@ def _setup_sqlite_compatibility():
     """設定 SQLite 與 PostgreSQL 類型的相容性"""
     from sqlalchemy import JSON
 
-    for table in Base.metadata.tables.values():
+    import app.models  # noqa: F401  註冊所有模型，確保每張表都完成型別替換
+    from app.models.daily_account_platform_agg import view_metadata
+
+    tables = [*Base.metadata.tables.values(), *view_metadata.tables.values()]
+    for table in tables:
         for column in table.columns:
             # UUID -> String(36) 透過 TypeDecorator
             if isinstance(column.type, PG_UUID):
@@ -54,6 +58,12 @@ def _setup_sqlite_compatibility():
                 column.type = JSON()
 
 
+# 匯入時即替換型別：路由模組在載入時建立的查詢（如 notifications 的分頁語句）
+# 會綁定當下的欄位型別，若在 fixture 替換前被匯入（如 test_main 匯入 app.main），
+# UUID 參數會以 PostgreSQL 格式綁定而查不到資料
+_setup_sqlite_compatibility()
+
+
 @pytest.fixture(scope="session")
 def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     """創建事件循環供整個測試會話使用"""
@@ -99,6 +109,19 @@ async def db_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
         await session.rollback()
 
 
+@pytest.fixture
+def executed_statements(async_engine):
+    """記錄測試期間送到資料庫的 SQL 語句"""
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(async_engine.sync_engine, "before_cursor_execute", _record)
+
+
 @pytest.fixture
 def mock_meta_api_response():
     """Mock Meta API 回應的 fixture"""
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""OAuth state CSRF 防護單元測試"""
+
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from app.services import csrf_protection
+from app.services.csrf_protection import generate_oauth_state, verify_oauth_state
+
+
+class FakeRedis:
+    """最小化的記憶體 Redis 替身"""
+
+    def __init__(self):
+        self.store = {}
+
+    async def set(self, key, value, expire=None):
+        self.store[key] = value
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def getdel(self, key):
+        return self.store.pop(key, None)
+
+
+@pytest.fixture
+def fake_redis():
+    redis = FakeRedis()
+    with patch.object(csrf_protection, "get_redis_client", return_value=redis):
+        yield redis
+
+
+class TestOAuthState:
+    """測試 state 產生與驗證"""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, fake_redis):
+        """產生的 state 可驗證並取回 user_id，長度固定為 64 字元"""
+        user_id = uuid.uuid4()
+        state = await generate_oauth_state(user_id, "google")
+
+        assert len(state) == 64
+        assert await verify_oauth_state(state, "google") == (True, user_id, None)
+
+    @pytest.mark.asyncio
+    async def test_nonce_single_use(self, fake_redis):
+        """nonce 驗證後即刪除，重放被拒絕"""
+        state = await generate_oauth_state(uuid.uuid4(), "google")
+        await verify_oauth_state(state, "google")
+
+        is_valid, user_id, error = await verify_oauth_state(state, "google")
+        assert is_valid is False
+        assert user_id is None
+
+    @pytest.mark.asyncio
+    async def test_provider_bound_to_signature(self, fake_redis):
+        """state 不可跨 provider 使用"""
+        state = await generate_oauth_state(uuid.uuid4(), "google")
+
+        is_valid, _, error = await verify_oauth_state(state, "meta")
+        assert is_valid is False
+        assert "signature" in error
+
+    @pytest.mark.asyncio
+    async def test_tampered_state_rejected(self, fake_redis):
+        """竄改或格式錯誤的 state 被拒絕"""
+        state = await generate_oauth_state(uuid.uuid4(), "google")
+        tampered = ("A" if state[0] != "A" else "B") + state[1:]
+
+        assert (await verify_oauth_state(tampered, "google"))[0] is False
+        assert (await verify_oauth_state("not-a-state", "google"))[0] is False
+        assert (await verify_oauth_state("%%%", "google"))[0] is False
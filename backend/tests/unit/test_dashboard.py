@@ -0,0 +1,733 @@
+# -*- coding: utf-8 -*-
+"""儀表板路由單元測試"""
+
+import importlib
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.ad_account import AdAccount
+from app.models.creative import Creative
+from app.models.creative_metrics import CreativeMetrics
+from app.models.daily_account_platform_agg import daily_account_platform_agg, view_metadata
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def daily_agg_view(db_session: AsyncSession):
+    """在 SQLite 中以一般資料表模擬儀表板物化視圖"""
+    conn = await db_session.connection()
+    await conn.run_sync(view_metadata.create_all)
+
+
+async def _refresh_daily_agg_view(db_session: AsyncSession) -> None:
+    """以與 migration 008 相同的聚合重建視圖內容"""
+    await db_session.execute(daily_account_platform_agg.delete())
+    await db_session.execute(
+        insert(daily_account_platform_agg).from_select(
+            ["date", "ad_account_id", "user_id", "platform", "impressions", "clicks", "conversions", "spend"],
+            select(
+                CreativeMetrics.date,
+                CreativeMetrics.ad_account_id,
+                AdAccount.user_id,
+                CreativeMetrics.platform,
+                func.sum(CreativeMetrics.impressions),
+                func.sum(CreativeMetrics.clicks),
+                func.sum(CreativeMetrics.conversions),
+                func.sum(CreativeMetrics.spend),
+            )
+            .join(AdAccount, CreativeMetrics.ad_account_id == AdAccount.id)
+            .group_by(
+                CreativeMetrics.date,
+                CreativeMetrics.ad_account_id,
+                AdAccount.user_id,
+                CreativeMetrics.platform,
+            ),
+        )
+    )
+    await db_session.commit()
+
+
+@pytest_asyncio.fixture
+async def dashboard_user(db_session: AsyncSession):
+    """建立含 10 天素材指標的測試用戶"""
+    user = MagicMock()
+    user.id = uuid.uuid4()
+
+    account = AdAccount(
+        id=uuid.uuid4(),
+        user_id=user.id,
+        platform="meta",
+        external_id="act_dashboard",
+        name="Dashboard Account",
+    )
+    creative = Creative(id=uuid.uuid4(), ad_account_id=account.id, name="Creative A")
+    db_session.add_all([account, creative])
+
+    today = date.today()
+    for days_ago in range(10):
+        db_session.add(
+            CreativeMetrics(
+                id=uuid.uuid4(),
+                creative_id=creative.id,
+                ad_account_id=account.id,
+                platform=account.platform,
+                date=today - timedelta(days=days_ago),
+                impressions=1000 + days_ago,
+                clicks=10,
+                conversions=2,
+                spend=Decimal("20.00"),
+            )
+        )
+    await db_session.commit()
+    await _refresh_daily_agg_view(db_session)
+    return user
+
+
+class TestDashboardMetrics:
+    """測試詳細指標端點"""
+
+    @pytest.mark.asyncio
+    async def test_totals_cover_full_period(self, db_session, dashboard_user):
+        """總計應涵蓋整段期間，而非僅最近 7 天"""
+        from app.routers.dashboard import get_dashboard_metrics
+
+        result = await get_dashboard_metrics(
+            period="30d", account_ids=None, db=db_session, current_user=dashboard_user
+        )
+
+        metrics = {m.name: m for m in result.metrics}
+        assert metrics["impressions"].value == sum(1000 + i for i in range(10))
+        assert metrics["conversions"].value == 20
+        assert metrics["spend"].value == pytest.approx(200.0)
+        assert metrics["cpa"].value == pytest.approx(10.0)
+
+    @pytest.mark.asyncio
+    async def test_trend_is_last_seven_days_in_order(self, db_session, dashboard_user):
+        """趨勢只包含最近 7 天，並依日期由舊到新排序"""
+        from app.routers.dashboard import get_dashboard_metrics
+
+        result = await get_dashboard_metrics(
+            period="30d", account_ids=None, db=db_session, current_user=dashboard_user
+        )
+
+        impressions = next(m for m in result.metrics if m.name == "impressions")
+        assert impressions.trend == [1006, 1005, 1004, 1003, 1002, 1001, 1000]
+
+    @pytest.mark.asyncio
+    async def test_change_against_previous_period(self, db_session, dashboard_user):
+        """變化率應相較於等長的上一期計算，趨勢只包含本期日期"""
+        from app.routers.dashboard import get_dashboard_metrics
+
+        result = await get_dashboard_metrics(
+            period="7d", account_ids=None, db=db_session, current_user=dashboard_user
+        )
+
+        # 本期 7 天、上一期只有 3 天數據
+        metrics = {m.name: m for m in result.metrics}
+        assert metrics["clicks"].value == 70
+        assert metrics["clicks"].change == pytest.approx(133.33)
+        assert metrics["spend"].status == "danger"
+        assert metrics["cpa"].change == 0.0
+
+        today = await get_dashboard_metrics(
+            period="today", account_ids=None, db=db_session, current_user=dashboard_user
+        )
+        clicks = next(m for m in today.metrics if m.name == "clicks")
+        assert clicks.trend == [10]
+        assert clicks.change == 0.0
+
+    @pytest.mark.asyncio
+    async def test_empty_when_no_data(self, db_session):
+        """沒有數據時返回全部為 0 的指標"""
+        from app.routers.dashboard import get_dashboard_metrics
+
+        user = MagicMock()
+        user.id = uuid.uuid4()
+
+        result = await get_dashboard_metrics(
+            period="7d", account_ids=None, db=db_session, current_user=user
+        )
+
+        assert len(result.metrics) == 6
+        assert all(m.value == 0 for m in result.metrics)
+
+        again = await get_dashboard_metrics(
+            period="7d", account_ids=None, db=db_session, current_user=user
+        )
+        assert again is result
+
+    @pytest.mark.asyncio
+    async def test_single_query_without_joins(
+        self, db_session, dashboard_user, executed_statements
+    ):
+        """每日聚合只發出一次查詢，且直接讀取聚合視圖不做 join"""
+        from app.routers.dashboard import get_dashboard_metrics
+
+        await get_dashboard_metrics(
+            period="30d", account_ids=None, db=db_session, current_user=dashboard_user
+        )
+
+        assert len(executed_statements) == 1
+        assert "daily_account_platform_agg" in executed_statements[0]
+        assert "JOIN" not in executed_statements[0]
+
+    @pytest.mark.asyncio
+    async def test_filters_by_account_ids(self, db_session, dashboard_user):
+        """指定不屬於該帳戶的 ID 時不應返回數據"""
+        from app.routers.dashboard import get_dashboard_metrics
+
+        result = await get_dashboard_metrics(
+            period="30d",
+            account_ids=str(uuid.uuid4()),
+            db=db_session,
+            current_user=dashboard_user,
+        )
+
+        assert all(m.value == 0 for m in result.metrics)
+
+
+class TestDashboardOverview:
+    """測試總覽端點"""
+
+    @pytest.mark.asyncio
+    async def test_change_against_previous_period(self, db_session, dashboard_user):
+        """變化率應相較於等長的上一期計算"""
+        from app.routers.dashboard import get_dashboard_overview
+
+        result = await get_dashboard_overview(
+            period="7d", account_ids=None, db=db_session, current_user=dashboard_user
+        )
+
+        # 本期 7 天、上一期只有 3 天數據
+        assert result.metrics.spend.value == pytest.approx(140.0)
+        assert result.metrics.spend.change == pytest.approx(133.33)
+        assert result.metrics.spend.status == "danger"
+        assert result.metrics.conversions.change == pytest.approx(133.33)
+        assert result.metrics.conversions.status == "normal"
+        assert result.metrics.cpa.change == 0.0
+        assert result.platforms["meta"].conversions == 14
+
+    @pytest.mark.asyncio
+    async def test_no_change_without_previous_data(self, db_session, dashboard_user):
+        """上一期沒有數據時變化率為 0"""
+        from app.routers.dashboard import get_dashboard_overview
+
+        result = await get_dashboard_overview(
+            period="30d", account_ids=None, db=db_session, current_user=dashboard_user
+        )
+
+        assert result.metrics.impressions.value == sum(1000 + i for i in range(10))
+        assert result.metrics.impressions.change == 0.0
+
+
+class TestDashboardTrends:
+    """測試趨勢端點"""
+
+    @pytest.mark.asyncio
+    async def test_daily_trend_points(self, db_session, dashboard_user):
+        """daily 粒度每天一個數據點，並依日期排序"""
+        from app.routers.dashboard import get_dashboard_trends
+
+        result = await get_dashboard_trends(
+            period="7d",
+            granularity="daily",
+            account_ids=None,
+            db=db_session,
+            current_user=dashboard_user,
+        )
+
+        assert len(result.data) == 7
+        assert result.data[0].date < result.data[-1].date
+        assert result.data[0].spend == pytest.approx(20.0)
+        assert result.data[0].cpa == pytest.approx(10.0)
+        assert result.data[0].roas == pytest.approx(5.0)
+        assert result.granularity == "daily"
+
+    @pytest.mark.asyncio
+    async def test_account_filter_matches_own_account(self, db_session, dashboard_user):
+        """帳戶過濾以 expanding 參數傳入，指定自己的帳戶時照常返回數據"""
+        from app.routers.dashboard import get_dashboard_trends
+
+        account_id = (await db_session.execute(select(AdAccount.id))).scalar_one()
+        result = await get_dashboard_trends(
+            period="7d",
+            granularity="daily",
+            account_ids=f"{uuid.uuid4()},{account_id}",
+            db=db_session,
+            current_user=dashboard_user,
+        )
+
+        assert len(result.data) == 7
+
+    def test_weekly_bucket_uses_date_trunc(self):
+        """weekly 粒度在資料庫端以 date_trunc('week', date) 分桶"""
+        from sqlalchemy.dialects import postgresql
+
+        from app.routers.dashboard import _trend_bucket
+
+        compiled = str(_trend_bucket("weekly").compile(dialect=postgresql.dialect()))
+
+        assert compiled == "CAST(date_trunc('week', daily_account_platform_agg.date) AS DATE)"
+
+
+class TestDashboardQueryCount:
+    """每個儀表板端點只應發出一次聚合查詢（防止 N+1 回歸）"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "handler_name,kwargs",
+        [
+            ("get_dashboard_overview", {}),
+            ("get_dashboard_metrics", {}),
+            ("get_dashboard_trends", {"granularity": "daily"}),
+        ],
+    )
+    async def test_single_statement_per_request(
+        self, db_session, dashboard_user, executed_statements, handler_name, kwargs
+    ):
+        """端點處理期間只執行一條 SQL"""
+        from app.routers.dashboard import (
+            get_dashboard_metrics,
+            get_dashboard_overview,
+            get_dashboard_trends,
+        )
+
+        handler = {
+            "get_dashboard_overview": get_dashboard_overview,
+            "get_dashboard_metrics": get_dashboard_metrics,
+            "get_dashboard_trends": get_dashboard_trends,
+        }[handler_name]
+        await handler(
+            period="30d",
+            account_ids=None,
+            db=db_session,
+            current_user=dashboard_user,
+            **kwargs,
+        )
+
+        assert len(executed_statements) == 1
+
+
+def _dashboard_module():
+    """取得 dashboard 路由模組（供 patch.object 使用）"""
+    return importlib.import_module("app.routers.dashboard")
+
+
+class TestTodayShortCircuit:
+    """測試 today 期間在視圖尚未更新時跳過資料庫"""
+
+    @pytest.mark.asyncio
+    async def test_skips_db_when_refreshed_before_today(
+        self, db_session, dashboard_user, executed_statements
+    ):
+        """視圖最後更新早於今天時直接返回空回應"""
+        from app.routers.dashboard import get_dashboard_overview
+
+        yesterday = datetime.now(timezone.utc) - timedelta(days=1)
+        with patch.object(
+            _dashboard_module(),
+            "get_aggregates_refreshed_at",
+            new_callable=AsyncMock,
+            return_value=yesterday,
+        ):
+            result = await get_dashboard_overview(
+                period="today", account_ids=None, db=db_session, current_user=dashboard_user
+            )
+
+        assert result.metrics.spend.value == 0
+        assert executed_statements == []
+
+    @pytest.mark.asyncio
+    async def test_queries_db_when_refreshed_today(self, db_session, dashboard_user):
+        """視圖今天已更新時照常查詢"""
+        from app.routers.dashboard import get_dashboard_overview
+
+        with patch.object(
+            _dashboard_module(),
+            "get_aggregates_refreshed_at",
+            new_callable=AsyncMock,
+            return_value=datetime.now(timezone.utc),
+        ):
+            result = await get_dashboard_overview(
+                period="today", account_ids=None, db=db_session, current_user=dashboard_user
+            )
+
+        assert result.metrics.spend.value == pytest.approx(20.0)
+
+
+class _FakeRedis:
+    """以 dict 模擬 RedisClient 的 get / set"""
+
+    def __init__(self):
+        self.store: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, expire=None):
+        self.store[key] = value
+        return True
+
+
+class TestResponseCache:
+    """測試儀表板回應快取"""
+
+    @pytest.mark.asyncio
+    async def test_second_request_served_from_cache(
+        self, db_session, dashboard_user, executed_statements
+    ):
+        """相同條件的第二次請求直接讀取快取，帳戶順序不影響快取鍵"""
+        from app.routers.dashboard import get_dashboard_trends
+
+        fake_redis = _FakeRedis()
+        account_a, account_b = uuid.uuid4(), uuid.uuid4()
+        with patch.object(
+            _dashboard_module(),
+            "get_aggregates_refreshed_at",
+            new_callable=AsyncMock,
+            return_value=datetime.now(timezone.utc),
+        ), patch.object(_dashboard_module(), "get_redis_client", return_value=fake_redis):
+            first = await get_dashboard_trends(
+                period="7d",
+                granularity="daily",
+                account_ids=None,
+                db=db_session,
+                current_user=dashboard_user,
+            )
+            second = await get_dashboard_trends(
+                period="7d",
+                granularity="daily",
+                account_ids=None,
+                db=db_session,
+                current_user=dashboard_user,
+            )
+
+        refreshed_at = datetime.now(timezone.utc)
+        cache_key = _dashboard_module()._response_cache_key
+        key_ab = cache_key("trends", refreshed_at, dashboard_user.id, date.today(), date.today(), [account_a, account_b])
+        key_ba = cache_key("trends", refreshed_at, dashboard_user.id, date.today(), date.today(), [account_b, account_a])
+
+        assert len(executed_statements) == 1
+        assert len(fake_redis.store) == 1
+        assert second == first
+        assert key_ab == key_ba
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_counted(self, db_session, dashboard_user):
+        """快取命中時遞增 dashboard_cache_hits_total，未命中不計"""
+        from prometheus_client import REGISTRY
+
+        from app.routers.dashboard import get_dashboard_overview
+
+        def hits() -> float:
+            return REGISTRY.get_sample_value(
+                "dashboard_cache_hits_total", {"endpoint": "overview"}
+            ) or 0.0
+
+        fake_redis = _FakeRedis()
+        before = hits()
+        with patch.object(
+            _dashboard_module(),
+            "get_aggregates_refreshed_at",
+            new_callable=AsyncMock,
+            return_value=datetime.now(timezone.utc),
+        ), patch.object(_dashboard_module(), "get_redis_client", return_value=fake_redis):
+            await get_dashboard_overview(
+                period="7d", account_ids=None, db=db_session, current_user=dashboard_user
+            )
+            assert hits() == before
+            await get_dashboard_overview(
+                period="7d", account_ids=None, db=db_session, current_user=dashboard_user
+            )
+
+        assert hits() == before + 1
+
+    @pytest.mark.asyncio
+    async def test_no_cache_when_refresh_time_unknown(self, db_session, dashboard_user):
+        """視圖更新時間未知時不使用快取"""
+        from app.routers.dashboard import get_dashboard_overview
+
+        fake_redis = _FakeRedis()
+        with patch.object(
+            _dashboard_module(),
+            "get_aggregates_refreshed_at",
+            new_callable=AsyncMock,
+            return_value=None,
+        ), patch.object(_dashboard_module(), "get_redis_client", return_value=fake_redis):
+            result = await get_dashboard_overview(
+                period="7d", account_ids=None, db=db_session, current_user=dashboard_user
+            )
+
+        assert result.metrics.spend.value == pytest.approx(140.0)
+        assert fake_redis.store == {}
+
+
+class TestParseAccountIds:
+    """測試帳戶 ID 解析"""
+
+    def test_skips_invalid_tokens(self):
+        """忽略空白與無效的 ID，保留有效 UUID 的順序"""
+        from app.routers.dashboard import _parse_account_ids
+
+        first, second = uuid.uuid4(), uuid.uuid4()
+        raw = f" {first} ,not-a-uuid,,{str(second).upper()},{first.hex}"
+
+        assert _parse_account_ids(raw) == [first, second]
+        assert _parse_account_ids(None) == []
+
+
+class TestAlertsPagination:
+    """測試異常警示游標分頁"""
+
+    @staticmethod
+    def _alerts():
+        from app.routers.dashboard import Alert
+
+        return tuple(
+            Alert(
+                id=f"alert-{i}",
+                type="threshold",
+                severity="high" if i % 2 else "low",
+                title=f"Alert {i}",
+                description="",
+                metric="cpa",
+                value=float(i),
+                created_at=f"2026-10-0{i}T00:00:00+00:00",
+            )
+            for i in range(5, 0, -1)
+        )
+
+    @pytest.mark.asyncio
+    async def test_pages_follow_next_cursor(self):
+        """依 next_cursor 逐頁取得全部警示，不重複也不遺漏"""
+        from app.routers.dashboard import get_dashboard_alerts
+
+        with patch.object(_dashboard_module(), "_ALERTS", self._alerts()):
+            first = await get_dashboard_alerts(
+                severity=None, limit=2, cursor=None, _current_user=MagicMock()
+            )
+            second = await get_dashboard_alerts(
+                severity=None, limit=2, cursor=first.meta["next_cursor"], _current_user=MagicMock()
+            )
+            last = await get_dashboard_alerts(
+                severity=None, limit=2, cursor=second.meta["next_cursor"], _current_user=MagicMock()
+            )
+
+        assert [a.id for a in first.data] == ["alert-5", "alert-4"]
+        assert [a.id for a in second.data] == ["alert-3", "alert-2"]
+        assert [a.id for a in last.data] == ["alert-1"]
+        assert last.meta["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_severity_filter_with_cursor(self):
+        """嚴重度篩選與分頁可同時使用"""
+        from app.routers.dashboard import get_dashboard_alerts
+
+        with patch.object(_dashboard_module(), "_ALERTS", self._alerts()):
+            first = await get_dashboard_alerts(
+                severity="high", limit=1, cursor=None, _current_user=MagicMock()
+            )
+            rest = await get_dashboard_alerts(
+                severity="high", limit=10, cursor=first.meta["next_cursor"], _current_user=MagicMock()
+            )
+
+        assert [a.id for a in first.data] == ["alert-5"]
+        assert [a.id for a in rest.data] == ["alert-3", "alert-1"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_rejected(self):
+        """無效游標返回 400"""
+        from fastapi import HTTPException
+
+        from app.routers.dashboard import get_dashboard_alerts
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_dashboard_alerts(
+                severity=None, limit=10, cursor="not-a-cursor", _current_user=MagicMock()
+            )
+
+        assert exc_info.value.status_code == 400
+
+
+class TestDashboardBundle:
+    """測試合併端點"""
+
+    @pytest.mark.asyncio
+    async def test_bundle_matches_individual_endpoints(
+        self, db_session, dashboard_user, executed_statements
+    ):
+        """合併回應與個別端點一致，三個查詢共用同一個 session"""
+        from app.routers.dashboard import get_dashboard_bundle, get_dashboard_overview
+
+        bundle = await get_dashboard_bundle(
+            period="7d",
+            granularity="daily",
+            account_ids=None,
+            db=db_session,
+            current_user=dashboard_user,
+        )
+
+        assert len(executed_statements) == 3
+        assert bundle.overview == await get_dashboard_overview(
+            period="7d", account_ids=None, db=db_session, current_user=dashboard_user
+        )
+        assert len(bundle.trends.data) == 7
+        assert {m.name for m in bundle.metrics.metrics} == {
+            "impressions", "clicks", "conversions", "spend", "cpa", "roas"
+        }
+
+
+def _decimal_db(rows: list) -> MagicMock:
+    """模擬 PostgreSQL + asyncpg：聚合計數以 Decimal 返回"""
+    result = MagicMock()
+    result.all.return_value = rows
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+class TestDecimalAggregates:
+    """PostgreSQL 的 SUM(bigint) 為 numeric，計數以 Decimal 返回時端點仍可運算"""
+
+    @pytest.mark.asyncio
+    async def test_overview_with_decimal_counts(self):
+        """Decimal 計數與 float spend 混合時總覽不拋出 TypeError"""
+        from app.routers.dashboard import get_dashboard_overview
+
+        row = SimpleNamespace(
+            platform="meta",
+            impressions=Decimal("7000"), clicks=Decimal("70"),
+            conversions=Decimal("14"), spend=140.0,
+            prev_impressions=Decimal("3000"), prev_clicks=Decimal("30"),
+            prev_conversions=Decimal("6"), prev_spend=60.0,
+        )
+        user = SimpleNamespace(id=uuid.uuid4())
+
+        result = await get_dashboard_overview(
+            period="7d", account_ids=None, db=_decimal_db([row]), current_user=user
+        )
+
+        assert result.metrics.conversions.value == 14
+        assert result.metrics.cpa.value == pytest.approx(10.0)
+        assert result.metrics.roas.value == pytest.approx(5.0)
+
+    @pytest.mark.asyncio
+    async def test_metrics_with_decimal_counts(self):
+        """Decimal 計數與 float spend 混合時詳細指標不拋出 TypeError，數值為整數"""
+        from app.routers.dashboard import get_dashboard_metrics
+
+        today = date.today()
+        rows = [
+            SimpleNamespace(
+                date=today - timedelta(days=days_ago),
+                impressions=Decimal("1000"), clicks=Decimal("10"),
+                conversions=Decimal("2"), spend=20.0,
+                total_impressions=Decimal("7000"), total_clicks=Decimal("70"),
+                total_conversions=Decimal("14"), total_spend=140.0,
+                prev_impressions=Decimal("0"), prev_clicks=Decimal("0"),
+                prev_conversions=Decimal("0"), prev_spend=0.0,
+            )
+            for days_ago in range(7)
+        ]
+        user = SimpleNamespace(id=uuid.uuid4())
+
+        result = await get_dashboard_metrics(
+            period="7d", account_ids=None, db=_decimal_db(rows), current_user=user
+        )
+
+        metrics = {m.name: m for m in result.metrics}
+        assert metrics["cpa"].value == pytest.approx(10.0)
+        assert metrics["roas"].value == pytest.approx(5.0)
+        assert type(metrics["conversions"].value) is int
+        assert all(type(v) is int for v in metrics["impressions"].trend)
+
+
+    @pytest.mark.asyncio
+    async def test_trends_with_decimal_counts(self):
+        """Decimal 計數經 model_construct 後仍序列化為整數，且不產生序列化警告"""
+        import warnings
+
+        from app.routers.dashboard import get_dashboard_trends
+
+        row = SimpleNamespace(
+            date=date.today(),
+            impressions=Decimal("1000"), clicks=Decimal("10"),
+            conversions=Decimal("2"), spend=20.0,
+            cpa=Decimal("10.0"), roas=Decimal("5.0"),
+        )
+        user = SimpleNamespace(id=uuid.uuid4())
+
+        result = await get_dashboard_trends(
+            period="7d", granularity="daily", account_ids=None,
+            db=_decimal_db([row]), current_user=user,
+        )
+
+        point = result.data[0]
+        assert type(point.impressions) is int
+        assert type(point.conversions) is int
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            payload = result.model_dump(mode="json")
+        assert payload["data"][0]["impressions"] == 1000
+        assert payload["data"][0]["spend"] == 20.0
+
+    @pytest.mark.asyncio
+    async def test_metrics_serialize_without_warnings(self):
+        """詳細指標以 Decimal 計數建構後序列化不產生警告"""
+        import warnings
+
+        from app.routers.dashboard import get_dashboard_metrics
+
+        row = SimpleNamespace(
+            date=date.today(),
+            impressions=Decimal("1000"), clicks=Decimal("10"),
+            conversions=Decimal("2"), spend=20.0,
+            total_impressions=Decimal("1000"), total_clicks=Decimal("10"),
+            total_conversions=Decimal("2"), total_spend=20.0,
+            prev_impressions=Decimal("0"), prev_clicks=Decimal("0"),
+            prev_conversions=Decimal("0"), prev_spend=0.0,
+        )
+        user = SimpleNamespace(id=uuid.uuid4())
+
+        result = await get_dashboard_metrics(
+            period="7d", account_ids=None, db=_decimal_db([row]), current_user=user
+        )
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            payload = result.model_dump(mode="json")
+        impressions = next(m for m in payload["metrics"] if m["name"] == "impressions")
+        assert impressions["value"] == 1000
+        assert impressions["trend"] == [1000]
+
+
+class TestMetricStatus:
+    """測試指標狀態門檻"""
+
+    @pytest.mark.parametrize(
+        "change,is_positive_better,expected",
+        [
+            (0.0, True, "normal"),
+            (-10.0, True, "normal"),
+            (-10.01, True, "warning"),
+            (-30.0, True, "warning"),
+            (-30.01, True, "danger"),
+            (10.0, False, "normal"),
+            (10.01, False, "warning"),
+            (30.0, False, "warning"),
+            (30.01, False, "danger"),
+            (-50.0, False, "normal"),
+        ],
+    )
+    def test_thresholds(self, change, is_positive_better, expected):
+        """門檻值本身歸入較好的一級"""
+        from app.routers.dashboard import _get_metric_status
+
+        assert _get_metric_status(change, is_positive_better) == expected
@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+"""健檢路由單元測試"""
+
+import importlib
+import uuid
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.ad_account import AdAccount
+from app.models.audit_issue import AuditIssue
+from app.models.health_audit import HealthAudit
+
+
+@pytest.fixture(autouse=True)
+def clear_latest_audit_cache():
+    """每個測試前清空最新健檢報告的程序內快取"""
+    from app.routers.health import _latest_audit_cache
+
+    _latest_audit_cache.clear()
+    yield
+    _latest_audit_cache.clear()
+
+
+@pytest_asyncio.fixture
+async def audit_record(db_session: AsyncSession) -> HealthAudit:
+    """建立含三個問題的健檢報告"""
+    account = AdAccount(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        platform="meta",
+        external_id="act_health",
+        name="Health Account",
+    )
+    audit = HealthAudit(
+        id=uuid.uuid4(),
+        ad_account_id=account.id,
+        overall_score=72,
+        structure_score=80,
+        creative_score=60,
+        audience_score=70,
+        budget_score=75,
+        tracking_score=90,
+    )
+    audit.issues = [
+        AuditIssue(
+            id=uuid.uuid4(),
+            category="CREATIVE",
+            severity="HIGH",
+            issue_code="CREATIVE_FATIGUE",
+            title="素材疲勞",
+            affected_entities={"ids": ["c1", "c2"]},
+            status="open",
+        ),
+        AuditIssue(id=uuid.uuid4(), category="creative", severity="LOW", status="open"),
+        AuditIssue(id=uuid.uuid4(), category="BUDGET", status="resolved"),
+    ]
+    db_session.add_all([account, audit])
+    await db_session.commit()
+    return audit
+
+
+class TestGetAudit:
+    """測試取得指定健檢報告"""
+
+    @pytest.mark.asyncio
+    async def test_response_shape(self, db_session, audit_record):
+        """回應欄位與型別應與完整驗證後的結果一致"""
+        from app.routers.health import HealthAuditResponse, get_audit
+
+        result = await get_audit(audit_id=str(audit_record.id), db=db_session)
+        validated = HealthAuditResponse.model_validate_json(result.model_dump_json())
+
+        assert validated == result
+        audit = result.data
+        assert audit.account_id == str(audit_record.ad_account_id)
+        assert audit.issues_count == 3
+        assert audit.dimensions["creative"].issues == 2
+        assert audit.dimensions["budget"].issues == 1
+        assert audit.dimensions["tracking"].weight == pytest.approx(0.10)
+        fatigue = next(i for i in audit.issues if i.issue_code == "CREATIVE_FATIGUE")
+        assert fatigue.affected_entities == ["c1", "c2"]
+        assert {i.severity for i in audit.issues} == {"HIGH", "LOW", "MEDIUM"}
+
+
+class TestAuditQueryCount:
+    """測試健檢查詢數量不隨問題數增加"""
+
+    @pytest.mark.asyncio
+    async def test_latest_audit_issues_two_queries(
+        self, db_session, audit_record, executed_statements
+    ):
+        """最新健檢報告：報告一次、問題列表一次（selectinload）"""
+        from app.routers.health import get_latest_audit
+
+        result = await get_latest_audit(account_id=None, db=db_session)
+
+        assert result.data.issues_count == 3
+        assert len(executed_statements) == 2
+
+    @pytest.mark.asyncio
+    async def test_unloaded_relationship_raises(self, db_session, audit_record):
+        """未預先載入的關聯存取時直接報錯，而非隱性 lazy load"""
+        from app.routers.health import _AUDIT_LOAD_OPTIONS
+
+        db_session.expunge_all()
+        query = (
+            select(HealthAudit)
+            .options(*_AUDIT_LOAD_OPTIONS)
+            .where(HealthAudit.id == audit_record.id)
+        )
+        audit = (await db_session.execute(query)).scalar_one()
+
+        with pytest.raises(InvalidRequestError):
+            audit.account
+        with pytest.raises(InvalidRequestError):
+            audit.issues[0].recommendations
+
+
+class TestIssueIdValidation:
+    """測試問題操作的 ID 格式驗證"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("issue_id", ["not-a-uuid", "1234", str(uuid.uuid4()) + "0"])
+    async def test_invalid_issue_id_returns_400(self, db_session, issue_id):
+        """格式錯誤的 ID 直接回傳 400，不查詢資料庫"""
+        from app.routers.health import resolve_issue
+
+        with pytest.raises(HTTPException) as exc_info:
+            await resolve_issue(audit_id=str(uuid.uuid4()), issue_id=issue_id, db=db_session)
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_uppercase_issue_id_accepted(self, db_session, audit_record):
+        """大寫 UUID 亦視為合法格式"""
+        from app.routers.health import resolve_issue
+
+        issue = audit_record.issues[0]
+        result = await resolve_issue(
+            audit_id=str(audit_record.id).upper(),
+            issue_id=str(issue.id).upper(),
+            db=db_session,
+        )
+        assert result.new_status == "resolved"
+
+    @pytest.mark.asyncio
+    async def test_missing_issue_returns_404(self, db_session, executed_statements):
+        """不存在的問題以單一 UPDATE 判定並回傳 404"""
+        from app.routers.health import ignore_issue
+
+        with pytest.raises(HTTPException) as exc_info:
+            await ignore_issue(audit_id=str(uuid.uuid4()), issue_id=str(uuid.uuid4()), db=db_session)
+        assert exc_info.value.status_code == 404
+        assert len(executed_statements) == 1
+
+
+class TestEmptyAudit:
+    """測試無健檢資料時的空報告"""
+
+    @pytest.mark.asyncio
+    async def test_empty_audit_shape(self, db_session):
+        """沒有健檢記錄時回傳空報告，欄位與完整驗證結果一致"""
+        from app.routers.health import HealthAuditResponse, get_latest_audit
+
+        result = await get_latest_audit(account_id=None, db=db_session)
+        validated = HealthAuditResponse.model_validate_json(result.model_dump_json())
+
+        assert validated == result
+        assert result.data.grade == "N/A"
+        assert set(result.data.dimensions) == {
+            "structure", "creative", "audience", "budget", "tracking"
+        }
+        assert all(d.score == 0 and d.issues == 0 for d in result.data.dimensions.values())
+
+
+class TestLatestAuditCache:
+    """測試最新健檢報告的程序內快取"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_skips_database(
+        self, db_session, audit_record, executed_statements
+    ):
+        """TTL 內重複請求直接回傳快取，不再查詢資料庫"""
+        from app.routers.health import get_latest_audit
+
+        first = await get_latest_audit(account_id=None, db=db_session)
+        executed_statements.clear()
+        second = await get_latest_audit(account_id=None, db=db_session)
+
+        assert second is first
+        assert executed_statements == []
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_requeries(self, db_session, audit_record, executed_statements):
+        """快取過期後重新查詢資料庫"""
+        health = importlib.import_module("app.routers.health")
+
+        await health.get_latest_audit(account_id=None, db=db_session)
+        expires_at, response = health._latest_audit_cache[None]
+        health._latest_audit_cache[None] = (expires_at - 3600, response)
+        executed_statements.clear()
+
+        await health.get_latest_audit(account_id=None, db=db_session)
+
+        assert len(executed_statements) == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("handler", "status"), [("resolve_issue", "resolved"), ("ignore_issue", "ignored")]
+    )
+    async def test_issue_status_change_invalidates(self, db_session, audit_record, handler, status):
+        """變更問題狀態後，重新讀取最新健檢報告可看到新狀態"""
+        health = importlib.import_module("app.routers.health")
+
+        issue_id = str(audit_record.issues[0].id)
+        before = await health.get_latest_audit(account_id=None, db=db_session)
+        assert {i.id: i.status for i in before.data.issues}[issue_id] != status
+
+        await getattr(health, handler)(
+            audit_id=str(audit_record.id), issue_id=issue_id, db=db_session
+        )
+        after = await health.get_latest_audit(account_id=None, db=db_session)
+
+        assert after is not before
+        assert {i.id: i.status for i in after.data.issues}[issue_id] == status
+
+    @pytest.mark.asyncio
+    async def test_invalidated_after_commit(self, db_session, audit_record):
+        """提交時快取仍在，提交完成後才清除，避免並行讀取重新快取舊資料"""
+        health = importlib.import_module("app.routers.health")
+
+        await health.get_latest_audit(account_id=None, db=db_session)
+        cached_at_commit = []
+        original_commit = db_session.commit
+
+        async def spy_commit():
+            cached_at_commit.append(None in health._latest_audit_cache)
+            await original_commit()
+
+        with patch.object(db_session, "commit", spy_commit):
+            await health.resolve_issue(
+                audit_id=str(audit_record.id),
+                issue_id=str(audit_record.issues[0].id),
+                db=db_session,
+            )
+
+        assert cached_at_commit == [True]
+        assert health._latest_audit_cache == {}
+
+
+class TestLatestAuditAccountFilter:
+    """測試最新健檢報告的帳戶篩選"""
+
+    @pytest.mark.asyncio
+    async def test_filters_by_account(self, db_session, audit_record):
+        """指定帳戶時只回傳該帳戶的健檢報告"""
+        from app.routers.health import get_latest_audit
+
+        matched = await get_latest_audit(account_id=str(audit_record.ad_account_id), db=db_session)
+        other = await get_latest_audit(account_id=str(uuid.uuid4()), db=db_session)
+
+        assert matched.data.id == str(audit_record.id)
+        assert other.data.id == ""
+
+
+class TestDatabaseErrors:
+    """測試資料庫錯誤處理"""
+
+    @pytest.mark.asyncio
+    async def test_get_audit_propagates_database_error(self):
+        """指定報告查詢失敗時交由全域 handler 轉為 503"""
+        from app.db.base import DatabaseUnavailableError, MockAsyncSession
+        from app.routers.health import get_audit
+
+        with pytest.raises(DatabaseUnavailableError):
+            await get_audit(audit_id=str(uuid.uuid4()), db=MockAsyncSession())
+
+    @pytest.mark.asyncio
+    async def test_latest_audit_falls_back_to_empty(self):
+        """最新報告查詢失敗時仍回傳空報告"""
+        from app.db.base import MockAsyncSession
+        from app.routers.health import _latest_audit_cache, get_latest_audit
+
+        result = await get_latest_audit(account_id=None, db=MockAsyncSession())
+
+        assert result.data.grade == "N/A"
+        assert _latest_audit_cache == {}
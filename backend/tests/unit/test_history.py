@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""操作歷史路由單元測試"""
+
+import uuid
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.action_history import ActionHistory
+from app.models.recommendation import Recommendation
+
+
+@pytest_asyncio.fixture
+async def executed_action(db_session: AsyncSession) -> ActionHistory:
+    """建立一筆已執行建議的操作歷史"""
+    account_id = uuid.uuid4()
+    recommendation = Recommendation(
+        id=uuid.uuid4(),
+        account_id=account_id,
+        title="暫停疲勞素材",
+        status="executed",
+    )
+    history = ActionHistory(
+        id=uuid.uuid4(),
+        recommendation_id=recommendation.id,
+        ad_account_id=account_id,
+        action_type="PAUSE",
+        target_type="CREATIVE",
+        before_state={"status": "pending"},
+        after_state={"status": "executed"},
+    )
+    db_session.add_all([recommendation, history])
+    await db_session.commit()
+    db_session.expunge_all()
+    return history
+
+
+class TestRevertAction:
+    """測試還原操作"""
+
+    @pytest.mark.asyncio
+    async def test_reverts_recommendation_without_select(
+        self, db_session, executed_action, executed_statements
+    ):
+        """操作歷史與建議各以一個 UPDATE 完成還原，不需先 SELECT"""
+        from app.routers.history import revert_action
+
+        result = await revert_action(history_id=str(executed_action.id), db=db_session)
+
+        verbs = [s.lstrip().split(None, 1)[0].upper() for s in executed_statements]
+        assert verbs == ["UPDATE", "UPDATE"]
+        assert result.reverted is True
+
+        recommendation = await db_session.get(Recommendation, executed_action.recommendation_id)
+        history = await db_session.get(ActionHistory, executed_action.id)
+        assert recommendation.status == "pending"
+        assert history.status == "rolled_back"
+
+    @pytest.mark.asyncio
+    async def test_already_reverted_returns_400(self, db_session, executed_action):
+        """重複還原回傳 400"""
+        from app.routers.history import revert_action
+
+        await revert_action(history_id=str(executed_action.id), db=db_session)
+        with pytest.raises(HTTPException) as exc_info:
+            await revert_action(history_id=str(executed_action.id), db=db_session)
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_missing_history_returns_404(self, db_session):
+        """不存在的操作歷史回傳 404"""
+        from app.routers.history import revert_action
+
+        with pytest.raises(HTTPException) as exc_info:
+            await revert_action(history_id=str(uuid.uuid4()), db=db_session)
+        assert exc_info.value.status_code == 404
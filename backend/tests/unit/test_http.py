@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""共用 HTTP 客戶端單元測試"""
+
+import pytest
+
+from app.core.http import close_http_clients, get_oauth_http_client
+
+
+class TestOAuthHttpClient:
+    """測試 OAuth 共用 HTTP 客戶端"""
+
+    @pytest.mark.asyncio
+    async def test_reused_within_loop(self):
+        """同一 event loop 內重用同一個客戶端"""
+        try:
+            assert get_oauth_http_client() is get_oauth_http_client()
+        finally:
+            await close_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_recreated_after_close(self):
+        """關閉後再次取得時建立新的客戶端"""
+        client = get_oauth_http_client()
+        await close_http_clients()
+
+        try:
+            assert client.is_closed
+            assert get_oauth_http_client() is not client
+        finally:
+            await close_http_clients()
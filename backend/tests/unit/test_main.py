@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""應用程式入口（app.main）冒煙測試"""
+
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """不觸發 lifespan（Redis、排程器）的測試客戶端"""
+    from app.main import app
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+class TestRouting:
+    """經由完整應用程式送出請求，確認中間件不會讓路由失敗"""
+
+    @pytest.mark.parametrize("path", ["/api/v1/auth/me", "/api/v1/dashboard/overview"])
+    def test_protected_route_requires_auth(self, client, path):
+        """/api/v1/* 路由未帶認證時回傳 401，而不是 500"""
+        response = client.get(path)
+
+        assert response.status_code == 401
+
+    def test_health_check(self, client):
+        """健康檢查端點正常回應"""
+        response = client.get("/api/health")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "healthy"
+
+
+class TestMetrics:
+    """測試 Prometheus 指標"""
+
+    def test_route_latency_labelled_by_template(self, client):
+        """延遲直方圖以含前綴的完整路由樣板為 handler 標籤"""
+        client.get("/api/v1/auth/me")
+
+        body = client.get("/metrics").text
+
+        assert 'handler="/api/v1/auth/me"' in body
+        assert 'status="4xx"' in body
+
+    def test_excluded_paths_not_recorded(self, client):
+        """/metrics 與 /api/health 不記錄延遲"""
+        client.get("/api/health")
+
+        body = client.get("/metrics").text
+
+        assert 'handler="/api/health"' not in body
+        assert 'handler="/metrics"' not in body
+
+
+class TestDatabaseUnavailable:
+    """資料庫不可用時（get_db 返回 MockAsyncSession）回傳 503"""
+
+    @pytest.fixture
+    def db_down_client(self, client):
+        from app.db.base import MockAsyncSession, get_db
+
+        async def mock_db():
+            yield MockAsyncSession()
+
+        client.app.dependency_overrides[get_db] = mock_db
+        yield client
+        client.app.dependency_overrides.pop(get_db, None)
+
+    def test_get_notification_returns_503(self, db_down_client):
+        """以主鍵取得通知時回傳 503，而不是 500"""
+        response = db_down_client.get(f"/api/v1/notifications/{uuid.uuid4()}")
+
+        assert response.status_code == 503
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""通知路由單元測試"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.notification import Notification
+
+
+@pytest_asyncio.fixture
+async def notifications(db_session: AsyncSession) -> list[Notification]:
+    """建立 25 則通知：每 5 則中 2 則未讀，時間由新到舊"""
+    user_id = uuid.uuid4()
+    now = datetime(2026, 10, 16, 12, 0, tzinfo=timezone.utc)
+    records = [
+        Notification(
+            id=uuid.uuid4(),
+            user_id=user_id,
+            type="alert" if i % 2 == 0 else "system",
+            severity="warning",
+            title=f"通知 {i}",
+            message="測試通知",
+            is_read=i % 5 >= 2,
+            created_at=now - timedelta(minutes=i),
+        )
+        for i in range(25)
+    ]
+    db_session.add_all(records)
+    await db_session.commit()
+    return records
+
+
+class TestGetNotifications:
+    """測試通知列表"""
+
+    @pytest.mark.asyncio
+    async def test_paginates_in_sql(self, db_session, notifications, executed_statements):
+        """分頁與計數在資料庫完成：一次計數查詢、一次當頁查詢"""
+        from app.routers.notifications import get_notifications
+
+        result = await get_notifications(
+            is_read=None, type=None, severity=None, page=2, page_size=10, cursor=None, db=db_session
+        )
+
+        assert len(executed_statements) == 2
+        assert "LIMIT" in executed_statements[1].upper()
+        assert [n.title for n in result.data] == [f"通知 {i}" for i in range(10, 20)]
+        assert result.meta["total"] == 25
+        assert result.meta["total_pages"] == 3
+        assert result.meta["unread_count"] == 10
+
+    @pytest.mark.asyncio
+    async def test_list_skips_orm_hydration(self, db_session, notifications):
+        """列表以欄位資料列讀取，不建立 ORM 實體"""
+        from app.routers.notifications import get_notifications
+
+        db_session.expunge_all()
+        result = await get_notifications(
+            is_read=None, type=None, severity=None, page=1, page_size=10, cursor=None, db=db_session
+        )
+
+        assert len(result.data) == 10
+        assert len(db_session.identity_map) == 0
+
+    @pytest.mark.asyncio
+    async def test_filters_apply_to_counts(self, db_session, notifications):
+        """篩選條件同時套用於總數與未讀數"""
+        from app.routers.notifications import get_notifications
+
+        result = await get_notifications(
+            is_read=None, type="alert", severity=None, page=1, page_size=50, cursor=None, db=db_session
+        )
+
+        alerts = [n for n in notifications if n.type == "alert"]
+        assert result.meta["total"] == len(alerts)
+        assert result.meta["unread_count"] == sum(1 for n in alerts if not n.is_read)
+        assert {n.type for n in result.data} == {"alert"}
+
+    @pytest.mark.asyncio
+    async def test_empty_database_returns_mock(self, db_session):
+        """資料庫無資料時返回模擬通知"""
+        from app.routers.notifications import get_notifications
+
+        result = await get_notifications(
+            is_read=False, type=None, severity=None, page=1, page_size=20, cursor=None, db=db_session
+        )
+
+        assert result.meta["total"] == 2
+        assert result.meta["unread_count"] == 2
+        assert all(not n.is_read for n in result.data)
+
+
+class TestNotificationCursor:
+    """測試 keyset 游標分頁"""
+
+    @pytest.mark.asyncio
+    async def test_cursor_walks_all_pages(self, db_session, notifications):
+        """依 next_cursor 逐頁取得所有通知，不重複、不遺漏"""
+        from app.routers.notifications import get_notifications
+
+        titles, cursor = [], None
+        for _ in range(5):
+            result = await get_notifications(
+                is_read=None, type=None, severity=None, page=1, page_size=10,
+                cursor=cursor, db=db_session,
+            )
+            titles.extend(n.title for n in result.data)
+            cursor = result.meta["next_cursor"]
+            if cursor is None:
+                break
+
+        assert titles == [f"通知 {i}" for i in range(25)]
+
+    @pytest.mark.asyncio
+    async def test_cursor_uses_row_comparison(self, db_session, notifications, executed_statements):
+        """有游標時以 (created_at, id) 範圍條件接續"""
+        from app.routers.notifications import get_notifications
+
+        first = await get_notifications(
+            is_read=None, type=None, severity=None, page=1, page_size=10, cursor=None, db=db_session
+        )
+        executed_statements.clear()
+        await get_notifications(
+            is_read=None, type=None, severity=None, page=1, page_size=10,
+            cursor=first.meta["next_cursor"], db=db_session,
+        )
+
+        assert "(notifications.created_at, notifications.id) <" in executed_statements[-1]
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_returns_400(self, db_session, notifications):
+        """格式錯誤的游標回傳 400"""
+        from app.routers.notifications import get_notifications
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_notifications(
+                is_read=None, type=None, severity=None, page=1, page_size=10,
+                cursor="not-a-cursor", db=db_session,
+            )
+        assert exc_info.value.status_code == 400
+
+
+class TestMockNotifications:
+    """測試模擬通知"""
+
+    def test_reused_within_minute(self):
+        """同一分鐘內重用同一組模擬通知，未讀數與內容一致"""
+        from app.routers.notifications import (
+            _MOCK_UNREAD_COUNT,
+            _mock_notifications_for_minute,
+        )
+
+        first = _mock_notifications_for_minute(29_000_000)
+        second = _mock_notifications_for_minute(29_000_000)
+
+        assert second is first
+        assert _MOCK_UNREAD_COUNT == sum(1 for n in first if not n.is_read) == 2
+        assert [n.created_at for n in first] == sorted((n.created_at for n in first), reverse=True)
+        assert first[1].data["recommendation_id"] != "__uuid__"
+
+    def test_ids_stable_across_minutes(self):
+        """模擬通知 ID 於載入時產生，跨分鐘保持不變"""
+        from app.routers.notifications import _mock_notifications_for_minute
+
+        first = _mock_notifications_for_minute(29_000_000)
+        later = _mock_notifications_for_minute(29_000_001)
+
+        assert [n.id for n in later] == [n.id for n in first]
+        assert later[0].created_at != first[0].created_at
+
+
+class TestDatabaseUnavailable:
+    """測試資料庫不可用（MockAsyncSession）時的行為"""
+
+    @pytest.mark.asyncio
+    async def test_get_notification_raises_unavailable(self):
+        """取得通知詳情拋出 DatabaseUnavailableError（由全域處理轉為 503），而非 AttributeError"""
+        from app.db.base import DatabaseUnavailableError, MockAsyncSession
+        from app.routers.notifications import get_notification
+
+        with pytest.raises(DatabaseUnavailableError):
+            await get_notification(notification_id=uuid.uuid4(), db=MockAsyncSession())
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", ["execute", "get", "scalar", "scalars", "refresh"])
+    async def test_mock_session_query_methods_raise(self, method):
+        """MockAsyncSession 的查詢類方法一律拋出 DatabaseUnavailableError"""
+        from app.db.base import DatabaseUnavailableError, MockAsyncSession
+
+        with pytest.raises(DatabaseUnavailableError):
+            await getattr(MockAsyncSession(), method)(object())
+
+
+class TestMarkAllRead:
+    """測試全部標記已讀"""
+
+    @pytest.mark.asyncio
+    async def test_counts_updated_rows(self, db_session, notifications):
+        """回傳實際更新的未讀通知筆數，再次呼叫時為 0"""
+        from app.routers.notifications import mark_all_notifications_read
+
+        user = SimpleNamespace(id=notifications[0].user_id)
+        result = await mark_all_notifications_read(db=db_session, current_user=user)
+        again = await mark_all_notifications_read(db=db_session, current_user=user)
+
+        assert result.count == 10
+        assert again.count == 0
+
+    @pytest.mark.asyncio
+    async def test_only_current_user(self, db_session, notifications):
+        """只更新當前用戶的通知，其他用戶的未讀通知不受影響"""
+        from app.routers.notifications import mark_all_notifications_read
+
+        other = Notification(
+            id=uuid.uuid4(), user_id=uuid.uuid4(), type="info", title="其他用戶", message="測試"
+        )
+        db_session.add(other)
+        await db_session.commit()
+
+        result = await mark_all_notifications_read(
+            db=db_session, current_user=SimpleNamespace(id=notifications[0].user_id)
+        )
+        await db_session.refresh(other)
+
+        assert result.count == 10
+        assert other.is_read is False
+
+
+class TestMarkRead:
+    """測試單則標記已讀"""
+
+    @pytest.mark.asyncio
+    async def test_marks_notification_read(self, db_session, notifications):
+        """標記後通知詳情顯示已讀與已讀時間"""
+        from app.routers.notifications import get_notification, mark_notification_read
+
+        unread = next(n for n in notifications if not n.is_read)
+        db_session.expunge_all()
+        result = await mark_notification_read(notification_id=unread.id, db=db_session)
+        detail = await get_notification(notification_id=unread.id, db=db_session)
+
+        assert result.success is True
+        assert detail.is_read is True
+        assert detail.read_at is not None
+
+    @pytest.mark.asyncio
+    async def test_single_update_statement(self, db_session, notifications, executed_statements):
+        """未讀通知以單一 UPDATE 完成標記；已讀通知不重設已讀時間"""
+        from app.routers.notifications import mark_notification_read
+
+        unread = next(n for n in notifications if not n.is_read)
+        await mark_notification_read(notification_id=unread.id, db=db_session)
+        assert len(executed_statements) == 1
+
+        result = await mark_notification_read(notification_id=unread.id, db=db_session)
+        assert result.message == "通知已標記為已讀"
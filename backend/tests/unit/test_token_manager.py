@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""Token 管理服務單元測試"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.token_manager import TokenManager
+
+
+class TestGoogleTokenRefresh:
+    """測試 Google token 自動刷新"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refresh_coalesced(self):
+        """同一帳戶的並行請求只刷新一次，其餘使用刷新後的 token"""
+        account_id = uuid.uuid4()
+        stored = {
+            "access_token": "old-token",
+            "token_expires_at": datetime.now(timezone.utc) - timedelta(minutes=1),
+        }
+        refresh_calls = 0
+
+        async def get_account(_account_id):
+            return SimpleNamespace(id=account_id, platform="google", **stored)
+
+        async def db_refresh(account):
+            account.__dict__.update(stored)
+
+        async def refresh_google_token(account):
+            nonlocal refresh_calls
+            refresh_calls += 1
+            await asyncio.sleep(0.01)
+            stored.update(
+                access_token="new-token",
+                token_expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+            )
+            await db_refresh(account)
+            return True
+
+        def make_manager() -> TokenManager:
+            db = MagicMock()
+            db.refresh = db_refresh
+            manager = TokenManager(db)
+            manager.get_account = get_account
+            manager.refresh_google_token = refresh_google_token
+            return manager
+
+        tokens = await asyncio.gather(
+            *(make_manager().get_valid_access_token(account_id) for _ in range(5))
+        )
+
+        assert refresh_calls == 1
+        assert tokens == ["new-token"] * 5
+
+    @pytest.mark.asyncio
+    async def test_refresh_failure_returns_none(self):
+        """刷新失敗時回傳 None"""
+        account = SimpleNamespace(
+            id=uuid.uuid4(),
+            platform="google",
+            access_token="old-token",
+            token_expires_at=datetime.now(timezone.utc),
+        )
+
+        async def get_account(_account_id):
+            return account
+
+        async def refresh_google_token(_account):
+            return False
+
+        db = MagicMock()
+
+        async def db_refresh(_account):
+            return None
+
+        db.refresh = db_refresh
+        manager = TokenManager(db)
+        manager.get_account = get_account
+        manager.refresh_google_token = refresh_google_token
+
+        assert await manager.get_valid_access_token(account.id) is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refresh_failure_not_retried(self):
+        """刷新失敗時，等待中的並行請求直接回傳 None，只向 Google 請求一次"""
+        account_id = uuid.uuid4()
+        post_calls = 0
+
+        async def get_account(_account_id):
+            return SimpleNamespace(
+                id=account_id,
+                platform="google",
+                access_token="old-token",
+                refresh_token="refresh-token",
+                token_expires_at=datetime.now(timezone.utc) - timedelta(minutes=1),
+            )
+
+        async def db_refresh(_account):
+            return None
+
+        async def post(*_args, **_kwargs):
+            nonlocal post_calls
+            post_calls += 1
+            await asyncio.sleep(0.01)
+            return SimpleNamespace(status_code=400, json=lambda: {"error": "invalid_grant"})
+
+        def make_manager() -> TokenManager:
+            db = MagicMock()
+            db.refresh = db_refresh
+            manager = TokenManager(db)
+            manager.get_account = get_account
+            return manager
+
+        client = SimpleNamespace(post=post)
+        with patch("app.services.token_manager.get_oauth_http_client", return_value=client):
+            tokens = await asyncio.gather(
+                *(make_manager().get_valid_access_token(account_id) for _ in range(5))
+            )
+            retry = await make_manager().get_valid_access_token(account_id)
+
+        assert tokens == [None] * 5
+        assert post_calls == 2  # 並行的 5 個請求只請求一次；之後的新請求會再試一次
+        assert retry is None
+
+
+class TestSaveOrUpdateAccount:
+    """測試帳戶儲存"""
+
+    @pytest.mark.asyncio
+    async def test_new_account_single_insert(self, db_session, executed_statements):
+        """新帳戶只需查詢是否存在與一次 INSERT，不在 commit 後重新讀取"""
+        manager = TokenManager(db_session)
+
+        account_id, is_new, error = await manager.save_or_update_account(
+            user_id=uuid.uuid4(),
+            platform="google",
+            external_id="1234567890",
+            name="Google Ads Account",
+            access_token="access",
+            refresh_token="refresh",
+            expires_in=3600,
+        )
+
+        assert is_new is True
+        assert error is None
+        assert isinstance(account_id, uuid.UUID)
+        assert [stmt.split()[0] for stmt in executed_statements] == ["SELECT", "INSERT"]